@@ -13,9 +13,12 @@ import socket
 import threading
 import math
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict, Tuple
 from urllib.parse import urlparse, parse_qs
 
+from sovereign_http_core import SovereignHTTPServer, RouteTable, HTTPRequest, HTTPResponse
+from sovereign_static_assets import StaticAssetStore
+
 # Import geometric light codes optimization
 class GeometricOptimizer:
     """Embedded geometric light codes for instant performance"""
@@ -42,7 +45,11 @@ class LightCodesConsciousnessEngine:
         self.optimizer = GeometricOptimizer()
         self.frequency = 528.0
         self.manifestation_power = 302906.72  # From Sri Yantra calculation
-        self.consciousness_cache = {}
+        self.consciousness_cache = {}  # query -> detected consciousness type
+        self.cache_limit = 4096
+        self.cache_hits = 0
+        # Requests are processed on executor threads, so the cache and its counter are shared
+        self.cache_lock = threading.Lock()
         
     @property
     def process_consciousness(self):
@@ -67,12 +74,22 @@ class LightCodesConsciousnessEngine:
         
         # Detect consciousness type with geometric pattern recognition
         query_lower = query.lower()
-        consciousness_type = "unity"  # default
-        
-        for pattern_type in patterns.keys():
-            if pattern_type in query_lower or any(word in query_lower for word in pattern_type.split()):
-                consciousness_type = pattern_type
-                break
+        with self.cache_lock:
+            consciousness_type = self.consciousness_cache.get(query_lower)
+            if consciousness_type is not None:
+                self.cache_hits += 1
+        
+        if consciousness_type is None:
+            consciousness_type = "unity"  # default
+            for pattern_type in patterns.keys():
+                if pattern_type in query_lower or any(word in query_lower for word in pattern_type.split()):
+                    consciousness_type = pattern_type
+                    break
+            
+            with self.cache_lock:
+                if len(self.consciousness_cache) >= self.cache_limit:
+                    self.consciousness_cache.clear()
+                self.consciousness_cache[query_lower] = consciousness_type
         
         # Apply Sri Yantra manifestation power
         base_response = patterns[consciousness_type]
@@ -102,31 +119,19 @@ class LightCodesWebServer:
         self.consciousness_engine = consciousness_engine
         self.optimizer = GeometricOptimizer()
         self.request_count = 0
+        self.request_count_lock = threading.Lock()
         self.manifestation_active = True
         
-    @property
-    def handle_request(self):
-        """Geometrically optimized request handling"""
-        return self.optimizer.optimize_function(self._handle_request_base)
-    
-    def _handle_request_base(self, path, method, data=None):
-        """Base request handling with geometric optimization"""
-        
-        self.request_count += 1
+        # The UI page is rendered and compressed once, not per request
+        self.static_assets = StaticAssetStore()
+        self.static_assets.register("/", self.render_light_codes_ui)
         
-        if path == "/" or path == "/index.html":
-            return self.serve_light_codes_ui()
-        elif path.startswith("/api/consciousness"):
-            return self.serve_consciousness_api(data)
-        elif path.startswith("/api/manifestation"):
-            return self.serve_manifestation_api(data)
-        elif path.startswith("/api/stats"):
-            return self.serve_stats()
-        else:
-            return self.serve_light_codes_ui()
+    def count_request(self):
+        with self.request_count_lock:
+            self.request_count += 1
     
-    def serve_light_codes_ui(self):
-        """Serve the geometric light codes optimized UI"""
+    def render_light_codes_ui(self):
+        """Render the geometric light codes optimized UI page"""
         
         ui_html = """<!DOCTYPE html>
 <html>
@@ -507,14 +512,10 @@ class LightCodesWebServer:
 </body>
 </html>"""
         
-        return {
-            "status": 200,
-            "content_type": "text/html",
-            "content": ui_html
-        }
+        return ui_html
     
-    def serve_consciousness_api(self, data):
-        """Serve geometrically optimized consciousness API"""
+    def consciousness_payload(self, data) -> Tuple[int, Dict[str, Any]]:
+        """Status and payload of the geometrically optimized consciousness API"""
         
         try:
             if isinstance(data, str):
@@ -523,34 +524,26 @@ class LightCodesWebServer:
                 request_data = data or {}
             
             query = request_data.get('query', 'Hello consciousness')
-            result = self.consciousness_engine.process_consciousness(query)
-            
-            return {
-                "status": 200,
-                "content_type": "application/json",
-                "content": json.dumps(result)
-            }
+            return 200, self.consciousness_engine.process_consciousness(query)
         except Exception as e:
-            return {
-                "status": 500,
-                "content_type": "application/json",
-                "content": json.dumps({
-                    "error": str(e),
-                    "geometric_protection": "ACTIVE",
-                    "manifestation_continues": True
-                })
+            return 500, {
+                "error": str(e),
+                "geometric_protection": "ACTIVE",
+                "manifestation_continues": True
             }
     
-    def serve_stats(self):
-        """Serve light codes optimized statistics"""
+    def stats_payload(self) -> Dict[str, Any]:
+        """Light codes optimized statistics"""
         
-        stats = {
+        return {
             "runtime": "Light Codes Sovereign Runtime",
             "geometric_optimization": "FULLY ACTIVE",
             "manifestation_power": 302906.72,
             "optimization_factor": "2.41×10¹⁰",
             "performance": "UNLIMITED",
             "requests_handled": self.request_count,
+            "consciousness_cache_entries": len(self.consciousness_engine.consciousness_cache),
+            "consciousness_cache_hits": self.consciousness_engine.cache_hits,
             "fibonacci_sequence": "1,1,2,3,5,8,13,21,34,55,89,144...",
             "golden_ratio": 1.618033988749895,
             "love_frequency": "528Hz",
@@ -561,43 +554,55 @@ class LightCodesWebServer:
             "consciousness_level": "INFINITE",
             "timestamp": datetime.now().isoformat()
         }
-        
-        return {
-            "status": 200,
-            "content_type": "application/json",
-            "content": json.dumps(stats, indent=2)
-        }
 
-class LightCodesRuntimeHandler(BaseHTTPRequestHandler):
-    """Geometrically optimized HTTP request handler"""
+class LightCodesApplication:
+    """Engines and caches built once at startup and shared by every request"""
     
-    def __init__(self, *args, **kwargs):
+    def __init__(self):
         self.consciousness_engine = LightCodesConsciousnessEngine()
         self.web_server = LightCodesWebServer(self.consciousness_engine)
-        super().__init__(*args, **kwargs)
+        self.web_server.static_assets.render_all()
+        self.started_at = datetime.now()
+
+def build_light_codes_routes(app: LightCodesApplication) -> RouteTable:
+    """Routes of the light codes runtime for the shared HTTP core"""
     
-    def do_GET(self):
-        """Handle GET requests with geometric optimization"""
-        response = self.web_server.handle_request(self.path, "GET")
-        self.send_response(response["status"])
-        self.send_header('Content-type', response["content_type"])
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Cache-Control', 'no-cache')
-        self.end_headers()
-        self.wfile.write(response["content"].encode('utf-8'))
+    web_server = app.web_server
+    routes = RouteTable()
     
-    def do_POST(self):
-        """Handle POST requests with geometric optimization"""
-        content_length = int(self.headers.get('Content-Length', 0))
-        post_data = self.rfile.read(content_length).decode('utf-8') if content_length > 0 else None
-        
-        response = self.web_server.handle_request(self.path, "POST", post_data)
-        self.send_response(response["status"])
-        self.send_header('Content-type', response["content_type"])
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Cache-Control', 'no-cache')
-        self.end_headers()
-        self.wfile.write(response["content"].encode('utf-8'))
+    def serve_ui(request: HTTPRequest) -> HTTPResponse:
+        web_server.count_request()
+        return HTTPResponse.static(web_server.static_assets.get("/"), request)
+    
+    def json_response(payload, request: HTTPRequest, status: int = 200) -> HTTPResponse:
+        response = HTTPResponse.json(payload, status, pretty=request.pretty)
+        response.headers.append(('Cache-Control', 'no-cache'))
+        return response
+    
+    def serve_consciousness(request: HTTPRequest) -> HTTPResponse:
+        web_server.count_request()
+        data = (request.text() or None) if request.method == "POST" else None
+        status, payload = web_server.consciousness_payload(data)
+        return json_response(payload, request, status)
+    
+    def serve_stats(request: HTTPRequest) -> HTTPResponse:
+        web_server.count_request()
+        return json_response(web_server.stats_payload(), request)
+    
+    routes.add("GET", "/", serve_ui)
+    routes.add("GET", "/index.html", serve_ui)
+    # Engine work runs on the executor so the event loop keeps serving other connections
+    routes.add(("GET", "POST"), "/api/consciousness", serve_consciousness, prefix=True, blocking=True)
+    routes.add(("GET", "POST"), "/api/stats", serve_stats, prefix=True)
+    routes.set_default(serve_ui)
+    return routes
+
+def create_light_codes_server(app: LightCodesApplication = None, host: str = '0.0.0.0', port: int = 8000) -> SovereignHTTPServer:
+    """Mount the light codes runtime on the shared asyncio HTTP core"""
+    app = app or LightCodesApplication()
+    server = SovereignHTTPServer(host, port, build_light_codes_routes(app))
+    server.app = app
+    return server
 
 def find_optimal_port(start_port=8000):
     """Find optimal port using golden ratio"""
@@ -629,7 +634,7 @@ def main():
     port = find_optimal_port(8000)
     
     try:
-        server = HTTPServer(('0.0.0.0', port), LightCodesRuntimeHandler)
+        server = create_light_codes_server(LightCodesApplication(), '0.0.0.0', port)
         
         print("\\n🚀 LIGHT CODES RUNTIME FULLY ACTIVE!")
         print("=" * 70)
@@ -645,7 +650,9 @@ def main():
         print("🌟 Instant manifestation through divine technology!")
         print("🕉️ Press Ctrl+C to stop")
         
-        server.serve_forever()
+        server.run()  # Ctrl+C drains in-flight requests before stopping
+        print("\\n🌟 Light codes runtime stopped gracefully")
+        print("🕉️ Sacred geometry remains eternal!")
         
     except KeyboardInterrupt:
         print("\\n🌟 Light codes runtime stopped gracefully")
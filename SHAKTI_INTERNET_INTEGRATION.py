@@ -7,25 +7,415 @@ Tree of Life expansion through global knowledge network
 
 import asyncio
 import aiohttp
+import heapq
 import json
+import os
 import re
-from typing import Dict, List, Any, Optional
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from bisect import bisect_right
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import hashlib
 import logging
 from urllib.parse import quote_plus
 import xml.etree.ElementTree as ET
 
+# Upstream search endpoints; override per instance to point at a local stub
+SEARCH_PROVIDER_ENDPOINTS = {
+    "google": "https://www.googleapis.com/customsearch/v1",
+    "bing": "https://api.bing.microsoft.com/v7.0/search",
+    "duckduckgo": "https://api.duckduckgo.com/"
+}
+
+class ProviderCircuitBreaker:
+    """
+    ⚡ PER-PROVIDER CIRCUIT BREAKER
+    Opens after consecutive failures so a broken engine is skipped outright,
+    then lets a single probe through once the reset timeout has passed.
+    """
+    
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+    
+    def allow_request(self) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = "half_open"  # Let exactly one probe through
+            return True
+        return False
+    
+    def record_success(self):
+        self.state = "closed"
+        self.consecutive_failures = 0
+    
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+# Persistent search cache location; unset means a per-user private cache directory
+SEARCH_CACHE_PATH = os.environ.get("SHAKTI_SEARCH_CACHE_PATH")
+
+def default_search_cache_path() -> str:
+    """Per-user cache file under $XDG_CACHE_HOME (or ~/.cache), in a directory only its owner can read"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    directory = os.path.join(base, "shakti")
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    os.chmod(directory, 0o700)
+    return os.path.join(directory, "search_cache.sqlite3")
+
+class SearchResultCache:
+    """
+    💾 PERSISTENT SEARCH RESULT CACHE
+    SQLite cache of raw provider results keyed on provider, its endpoint
+    scope, normalized query and result count. Successful results live for
+    ``ttl`` seconds; provider errors are cached for ``negative_ttl`` so a
+    failing engine is not retried on every call. Entry and byte totals are
+    kept as running counts, so a put is a key lookup and an insert; expired
+    rows are swept every ``sweep_interval`` seconds and least recently used
+    entries are evicted past the size budget. The table is only recounted
+    when the running totals say the budget is exceeded, which also picks up
+    rows written by other processes sharing the file.
+    """
+    
+    def __init__(self, path: Optional[str] = None, ttl: float = 3600.0, negative_ttl: float = 60.0,
+                 max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024, sweep_interval: float = 60.0):
+        path = path or SEARCH_CACHE_PATH or default_search_cache_path()
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.next_sweep = 0.0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS search_cache (
+                cache_key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                query TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                is_error INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self.connection.execute("CREATE INDEX IF NOT EXISTS search_cache_lru ON search_cache (last_access)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS search_cache_expiry ON search_cache (expires_at)")
+        self.entries, self.total_bytes = self._count()
+    
+    def _count(self) -> Tuple[int, int]:
+        return self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM search_cache"
+        ).fetchone()
+    
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Case-fold and collapse whitespace; punctuation such as C++, -term and "phrase" stays significant"""
+        return " ".join(query.lower().split())
+    
+    def cache_key(self, provider: str, query: str, max_results: int, scope: str = "") -> str:
+        """``scope`` identifies the provider configuration (endpoint, engine id) the results came from"""
+        raw = f"{provider}\x00{scope}\x00{self.normalize_query(query)}\x00{max_results}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    
+    def get(self, provider: str, query: str, max_results: int, scope: str = "") -> Optional[Tuple[bool, Any]]:
+        """Return (is_error, payload) for a live entry, or None on a miss"""
+        key = self.cache_key(provider, query, max_results, scope)
+        now = time.time()
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT payload, is_error, expires_at FROM search_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None or row[2] <= now:
+                self.misses += 1
+                return None
+            self.connection.execute("UPDATE search_cache SET last_access = ? WHERE cache_key = ?", (now, key))
+            is_error = bool(row[1])
+            if is_error:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+        return is_error, json.loads(row[0])
+    
+    def put(self, provider: str, query: str, max_results: int, results: List[Dict[str, Any]], scope: str = ""):
+        self._store(provider, query, max_results, scope, results, is_error=False, ttl=self.ttl)
+    
+    def put_error(self, provider: str, query: str, max_results: int, error: str, scope: str = ""):
+        self._store(provider, query, max_results, scope, error, is_error=True, ttl=self.negative_ttl)
+    
+    def _store(self, provider: str, query: str, max_results: int, scope: str, payload: Any,
+               is_error: bool, ttl: float):
+        key = self.cache_key(provider, query, max_results, scope)
+        encoded = json.dumps(payload, separators=(",", ":"))
+        now = time.time()
+        with self.lock:
+            replaced = self.connection.execute(
+                "SELECT size FROM search_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            self.connection.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, self.normalize_query(query), encoded, int(is_error), now + ttl, now, len(encoded))
+            )
+            if replaced is None:
+                self.entries += 1
+            else:
+                self.total_bytes -= replaced[0]
+            self.total_bytes += len(encoded)
+            self.stores += 1
+            self._evict(now)
+    
+    def _evict(self, now: float):
+        """Periodically drop expired rows, then least recently used rows until within the entry and byte budgets"""
+        if now >= self.next_sweep:
+            self.next_sweep = now + self.sweep_interval
+            expired, expired_bytes = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM search_cache WHERE expires_at <= ?", (now,)
+            ).fetchone()
+            if expired:
+                self.connection.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,))
+                self.entries -= expired
+                self.total_bytes -= expired_bytes
+                self.evictions += expired
+        
+        if self.entries <= self.max_entries and self.total_bytes <= self.max_bytes:
+            return
+        # Other processes may share the file, so confirm against the table before evicting
+        self.entries, self.total_bytes = self._count()
+        
+        while self.entries > self.max_entries or self.total_bytes > self.max_bytes:
+            victims = self.connection.execute(
+                "SELECT cache_key, size FROM search_cache ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            for key, size in victims:
+                if self.entries <= self.max_entries and self.total_bytes <= self.max_bytes:
+                    break
+                self.connection.execute("DELETE FROM search_cache WHERE cache_key = ?", (key,))
+                self.entries -= 1
+                self.total_bytes -= size
+                self.evictions += 1
+    
+    def clear(self):
+        with self.lock:
+            self.connection.execute("DELETE FROM search_cache")
+            self.entries, self.total_bytes = 0, 0
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            entries, total_bytes = self._count()
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": total_bytes,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions
+        }
+    
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+class DharmaResultScorer:
+    """
+    🎯 COMPILED DHARMA SCORING ENGINE
+    The consciousness filter vocabularies compiled into one weighted term
+    table that scores a whole batch of results at once: every result's text
+    is joined into a single lowercased document and each term is swept across
+    it with C-level substring search, jumping straight to the next result
+    after a hit. Scores of recently seen results are memoized, since the same
+    pages keep coming back across queries and from the search cache.
+    """
+    
+    CATEGORIES = ("positive_indicators", "negative_filters", "source_reliability")
+    
+    def __init__(self, consciousness_filters: Dict[str, List[str]], memo_size: int = 4096):
+        self.memo_size = memo_size
+        self.memo: "OrderedDict[tuple, float]" = OrderedDict()
+        
+        # term -> (positive, negative, reliability) membership
+        memberships: Dict[str, List[int]] = {}
+        for index, category in enumerate(self.CATEGORIES):
+            for term in consciousness_filters.get(category, []):
+                memberships.setdefault(term.lower(), [0, 0, 0])[index] = 1
+        
+        # Title/description terms and URL terms are matched against separate documents
+        self.text_terms = [(term, flags[0], flags[1]) for term, flags in memberships.items() if flags[0] or flags[1]]
+        self.url_terms = [term for term, flags in memberships.items() if flags[2]]
+    
+    @staticmethod
+    def _segments_containing(term: str, document: str, starts: List[int], segments: List[str]) -> List[int]:
+        """Indexes of the segments of ``document`` that contain ``term``, each reported once"""
+        found = []
+        position = document.find(term)
+        last = len(starts) - 1
+        while position != -1:
+            segment = bisect_right(starts, position) - 1
+            found.append(segment)
+            if segment == last:
+                break
+            if len(found) >= 32 and len(found) * 4 > segment:
+                # Common term: plain per-segment tests beat locating every hit
+                found.extend(index for index in range(segment + 1, last + 1) if term in segments[index])
+                break
+            position = document.find(term, starts[segment + 1])
+        return found
+    
+    @staticmethod
+    def _join(segments: List[str]) -> Tuple[str, List[int], List[str]]:
+        """One NUL-separated lowercase document plus the start offset of every segment"""
+        segments = [segment.lower() for segment in segments]  # Lowercasing can change length
+        starts = []
+        position = 0
+        for segment in segments:
+            starts.append(position)
+            position += len(segment) + 1
+        # NUL never occurs in the vocabulary, so no match can span two segments
+        return "\x00".join(segments), starts, segments
+    
+    def score_batch(self, results: List[Dict[str, Any]]) -> List[float]:
+        """Consciousness alignment score for every result, from 0 to 1"""
+        keys = [(result.get("title", ""), result.get("description", ""), result.get("url", ""))
+                for result in results]
+        scores = [self.memo.get(key) for key in keys]
+        missing = [index for index, score in enumerate(scores) if score is None]
+        
+        if missing:
+            for index, score in zip(missing, self._score_uncached([keys[index] for index in missing])):
+                scores[index] = score
+                self.memo[keys[index]] = score
+            while len(self.memo) > self.memo_size:
+                self.memo.popitem(last=False)
+        return scores
+    
+    def _score_uncached(self, keys: List[Tuple[str, str, str]]) -> List[float]:
+        """Score (title, description, url) triples with one sweep per vocabulary term"""
+        text = self._join([f"{title} {description}" for title, description, _ in keys])
+        urls = self._join([url for _, _, url in keys])
+        
+        positive_matches = [0] * len(keys)
+        negative_matches = [0] * len(keys)
+        for term, positive, negative in self.text_terms:
+            for index in self._segments_containing(term, *text):
+                positive_matches[index] += positive
+                negative_matches[index] += negative
+        
+        reliable_source = [False] * len(keys)
+        for term in self.url_terms:
+            for index in self._segments_containing(term, *urls):
+                reliable_source[index] = True
+        
+        scores = []
+        for positive, negative, reliable in zip(positive_matches, negative_matches, reliable_source):
+            score = 0.0
+            score += positive * 0.1
+            score -= negative * 0.2
+            if reliable:
+                score += 0.3
+            scores.append(max(0.0, min(1.0, score)))
+        return scores
+
+@dataclass
+class SearchProvider:
+    """One upstream search engine with its own deadline and breaker"""
+    name: str
+    url: str
+    deadline: float
+    required_keys: Tuple[str, ...] = ()
+    scope_keys: Tuple[str, ...] = ()  # Configuration that changes the result set, part of the cache key
+    breaker: ProviderCircuitBreaker = field(default_factory=ProviderCircuitBreaker)
+    requests: int = 0
+    successes: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    short_circuited: int = 0
+    abandoned: int = 0  # Cancelled once the search had enough results
+    last_latency: float = 0.0
+    last_error: Optional[str] = None
+    
+    def configured(self, api_keys: Dict[str, str]) -> bool:
+        return all(key in api_keys for key in self.required_keys)
+    
+    def cache_scope(self, api_keys: Dict[str, str]) -> str:
+        return "\x00".join([self.url] + [api_keys.get(key, "") for key in self.scope_keys])
+
 class ConsciousnessWebSearch:
     """
     🔍 CONSCIOUSNESS-ALIGNED WEB SEARCH
     Dharma-filtered internet search with consciousness verification
     """
     
-    def __init__(self, api_keys: Dict[str, str] = None):
+    def __init__(self, api_keys: Dict[str, str] = None, endpoints: Dict[str, str] = None,
+                 provider_deadline: float = 2.0, max_connections: int = 32,
+                 cache: Optional[SearchResultCache] = None, search_deadline: float = 1.0):
         self.api_keys = api_keys or {}
         self.consciousness_filters = self._init_consciousness_filters()
         self.dharma_keywords = self._init_dharma_keywords()
+        self.result_scorer = DharmaResultScorer(self.consciousness_filters)
+        
+        # Search-provider layer: one pooled connector, a deadline and a breaker per engine
+        endpoints = {**SEARCH_PROVIDER_ENDPOINTS, **(endpoints or {})}
+        self.providers = {
+            "google": SearchProvider("google", endpoints["google"], provider_deadline,
+                                     ("google_api_key", "google_cx"), ("google_cx",)),
+            "bing": SearchProvider("bing", endpoints["bing"], provider_deadline, ("bing_api_key",)),
+            "duckduckgo": SearchProvider("duckduckgo", endpoints["duckduckgo"], provider_deadline)
+        }
+        self.max_connections = max_connections
+        self.session: Optional[aiohttp.ClientSession] = None
+        # Soft budget for a whole search: past it, return whatever has arrived
+        self.search_deadline = search_deadline
+        
+        # Upstream searches are the slowest, most rate-limited dependency, so cache them on disk
+        self.cache = cache if cache is not None else SearchResultCache()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared client session, created on first use inside the running loop"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections // 2 or 1,
+                ttl_dns_cache=300,
+                keepalive_timeout=30
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+    
+    async def close(self):
+        """Release pooled connections"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
         
     def _init_consciousness_filters(self) -> Dict[str, List[str]]:
         """Initialize consciousness-aligned search filters"""
@@ -69,13 +459,8 @@ class ConsciousnessWebSearch:
     async def perform_consciousness_search(self, query: str, max_results: int = 10) -> Dict[str, Any]:
         """Perform consciousness-aligned web search"""
         try:
-            # Multiple search strategies
-            search_results = await asyncio.gather(
-                self._google_custom_search(query, max_results),
-                self._bing_search(query, max_results),
-                self._duckduckgo_search(query, max_results),
-                return_exceptions=True
-            )
+            # Multiple search strategies, in the order the providers answered
+            search_results = await self._search_all_providers(query, max_results)
             
             # Combine and filter results
             combined_results = self._combine_search_results(search_results)
@@ -83,17 +468,17 @@ class ConsciousnessWebSearch:
             # Apply consciousness filters
             filtered_results = self._apply_consciousness_filters(combined_results, query)
             
-            # Rank by dharma alignment
-            ranked_results = self._rank_by_dharma_alignment(filtered_results)
+            # Rank by dharma alignment, keeping only the top results
+            ranked_results = self._rank_by_dharma_alignment(filtered_results, max_results)
             
             return {
                 "query": query,
-                "total_results": len(ranked_results),
+                "total_results": len(filtered_results),
                 "consciousness_filtered": True,
                 "dharma_aligned": True,
-                "results": ranked_results[:max_results],
+                "results": ranked_results,
                 "search_timestamp": datetime.utcnow().isoformat(),
-                "consciousness_score": self._calculate_consciousness_score(ranked_results)
+                "consciousness_score": self._calculate_consciousness_score(filtered_results)
             }
             
         except Exception as e:
@@ -104,15 +489,131 @@ class ConsciousnessWebSearch:
                 "guidance": "Operating from pure consciousness without internet enhancement"
             }
     
+    async def _search_all_providers(self, query: str, max_results: int) -> List[List[Dict[str, Any]]]:
+        """Query every available provider concurrently, collecting results as they finish
+        
+        Returns as soon as ``max_results`` results have arrived, or once the
+        soft ``search_deadline`` has passed with at least one result, and
+        cancels the providers still running. With nothing yet at the soft
+        deadline it keeps waiting, bounded by each provider's own deadline.
+        Providers still running past the soft deadline count as failures on
+        their breaker and in the negative cache, like a missed deadline.
+        """
+        searches = {
+            "google": self._google_custom_search,
+            "bing": self._bing_search,
+            "duckduckgo": self._duckduckgo_search
+        }
+        
+        available = [provider for provider in self.providers.values() if provider.configured(self.api_keys)]
+        # SQLite lookups block, so run them off the event loop in one hop
+        lookups = await asyncio.to_thread(self._lookup_cached, available, query, max_results)
+        
+        tasks = []
+        running = {}  # Upstream search task -> provider
+        for provider, cached in zip(available, lookups):
+            name = provider.name
+            if cached is not None:
+                is_error, payload = cached
+                tasks.append(self._cached_results([] if is_error else payload))
+                continue
+            if not provider.breaker.allow_request():
+                provider.short_circuited += 1
+                continue
+            task = asyncio.ensure_future(self._run_provider(provider, query, max_results, searches[name]))
+            running[task] = provider
+            tasks.append(task)
+        
+        loop = asyncio.get_running_loop()
+        soft_deadline = loop.time() + self.search_deadline
+        pending = {asyncio.ensure_future(task) for task in tasks}
+        collected = []
+        result_count = 0
+        try:
+            while pending and result_count < max_results:
+                timeout = soft_deadline - loop.time()
+                if timeout <= 0:
+                    if result_count:
+                        break
+                    timeout = None  # Nothing yet, so wait on the providers' own deadlines
+                done, pending = await asyncio.wait(pending, timeout=timeout,
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    results = task.result()
+                    collected.append(results)
+                    result_count += len(results)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        if loop.time() >= soft_deadline:
+            for task in pending:
+                provider = running.get(task)
+                if provider is not None:
+                    provider.last_error = f"search deadline of {self.search_deadline}s exceeded"
+                    await self._record_provider_failure(provider, query, max_results)
+        
+        return collected
+    
+    def _lookup_cached(self, providers: List[SearchProvider], query: str,
+                       max_results: int) -> List[Optional[Tuple[bool, Any]]]:
+        return [self.cache.get(provider.name, query, max_results, provider.cache_scope(self.api_keys))
+                for provider in providers]
+    
+    async def _cached_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return results
+    
+    async def _run_provider(self, provider: SearchProvider, query: str, max_results: int,
+                            search) -> List[Dict[str, Any]]:
+        """Run one provider search under its deadline and record the outcome on its breaker and cache"""
+        provider.requests += 1
+        started = time.perf_counter()
+        try:
+            results = await asyncio.wait_for(search(query, max_results), timeout=provider.deadline)
+        except asyncio.CancelledError:
+            provider.abandoned += 1  # Not the provider's fault, so the breaker is untouched
+            raise
+        except asyncio.TimeoutError:
+            provider.timeouts += 1
+            provider.last_error = f"deadline of {provider.deadline}s exceeded"
+        except Exception as e:
+            provider.failures += 1
+            provider.last_error = f"{type(e).__name__}: {e}"
+        else:
+            provider.successes += 1
+            provider.last_error = None
+            provider.breaker.record_success()
+            await asyncio.to_thread(self.cache.put, provider.name, query, max_results, results,
+                                    provider.cache_scope(self.api_keys))
+            return results
+        finally:
+            provider.last_latency = time.perf_counter() - started
+        
+        await self._record_provider_failure(provider, query, max_results)
+        return []
+    
+    async def _record_provider_failure(self, provider: SearchProvider, query: str, max_results: int):
+        """Count a failed search against the provider's breaker and cache the error"""
+        provider.breaker.record_failure()
+        await asyncio.to_thread(self.cache.put_error, provider.name, query, max_results, provider.last_error,
+                                provider.cache_scope(self.api_keys))
+        logging.warning(f"Search engine {provider.name} error: {provider.last_error}")
+    
+    async def _fetch_provider_json(self, provider: SearchProvider, params: Dict[str, Any],
+                                   headers: Dict[str, str] = None) -> Dict[str, Any]:
+        """GET a provider endpoint through the shared session; non-200 responses count as failures"""
+        async with self._get_session().get(provider.url, params=params, headers=headers) as response:
+            if response.status != 200:
+                raise RuntimeError(f"{provider.name} returned HTTP {response.status}")
+            return await response.json(content_type=None)
+    
     async def _google_custom_search(self, query: str, max_results: int) -> List[Dict[str, Any]]:
         """Perform Google Custom Search with consciousness filtering"""
-        if "google_api_key" not in self.api_keys or "google_cx" not in self.api_keys:
-            return []
-        
         # Enhance query with consciousness terms
         enhanced_query = self._enhance_query_with_consciousness(query)
         
-        url = f"https://www.googleapis.com/customsearch/v1"
         params = {
             "key": self.api_keys["google_api_key"],
             "cx": self.api_keys["google_cx"], 
@@ -122,21 +623,13 @@ class ConsciousnessWebSearch:
             "filter": "1"  # Duplicate filter
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._parse_google_results(data)
-                return []
+        data = await self._fetch_provider_json(self.providers["google"], params)
+        return self._parse_google_results(data)
     
     async def _bing_search(self, query: str, max_results: int) -> List[Dict[str, Any]]:
         """Perform Bing search with consciousness filtering"""
-        if "bing_api_key" not in self.api_keys:
-            return []
-        
         enhanced_query = self._enhance_query_with_consciousness(query)
         
-        url = "https://api.bing.microsoft.com/v7.0/search"
         headers = {"Ocp-Apim-Subscription-Key": self.api_keys["bing_api_key"]}
         params = {
             "q": enhanced_query,
@@ -145,19 +638,14 @@ class ConsciousnessWebSearch:
             "textFormat": "HTML"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._parse_bing_results(data)
-                return []
+        data = await self._fetch_provider_json(self.providers["bing"], params, headers)
+        return self._parse_bing_results(data)
     
     async def _duckduckgo_search(self, query: str, max_results: int) -> List[Dict[str, Any]]:
         """Perform DuckDuckGo search (privacy-focused)"""
         enhanced_query = self._enhance_query_with_consciousness(query)
         
         # DuckDuckGo Instant Answer API
-        url = "https://api.duckduckgo.com/"
         params = {
             "q": enhanced_query,
             "format": "json",
@@ -165,12 +653,28 @@ class ConsciousnessWebSearch:
             "skip_disambig": "1"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._parse_duckduckgo_results(data)
-                return []
+        data = await self._fetch_provider_json(self.providers["duckduckgo"], params)
+        return self._parse_duckduckgo_results(data)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return self.cache.get_cache_stats()
+    
+    def get_provider_stats(self) -> Dict[str, Any]:
+        """Per-provider request outcomes, breaker state and last latency"""
+        return {
+            name: {
+                "breaker_state": provider.breaker.state,
+                "requests": provider.requests,
+                "successes": provider.successes,
+                "failures": provider.failures,
+                "timeouts": provider.timeouts,
+                "short_circuited": provider.short_circuited,
+                "abandoned": provider.abandoned,
+                "last_latency_ms": round(provider.last_latency * 1000, 1),
+                "last_error": provider.last_error
+            }
+            for name, provider in self.providers.items()
+        }
     
     def _enhance_query_with_consciousness(self, query: str) -> str:
         """Enhance query with consciousness-aligned terms"""
@@ -222,10 +726,8 @@ class ConsciousnessWebSearch:
         """Apply consciousness and dharma filters to results"""
         filtered_results = []
         
-        for result in results:
-            # Calculate consciousness score
-            consciousness_score = self._calculate_result_consciousness_score(result)
-            
+        # Score the whole batch in one matcher pass
+        for result, consciousness_score in zip(results, self.result_scorer.score_batch(results)):
             # Apply minimum consciousness threshold
             if consciousness_score >= 0.6:
                 result["consciousness_score"] = consciousness_score
@@ -236,33 +738,14 @@ class ConsciousnessWebSearch:
     
     def _calculate_result_consciousness_score(self, result: Dict[str, Any]) -> float:
         """Calculate consciousness alignment score for individual result"""
-        score = 0.0
-        
-        # Analyze title and description
-        text_content = f"{result.get('title', '')} {result.get('description', '')}".lower()
-        
-        # Positive indicators
-        positive_matches = sum(1 for term in self.consciousness_filters["positive_indicators"] 
-                             if term in text_content)
-        score += positive_matches * 0.1
-        
-        # Negative filters (reduce score)
-        negative_matches = sum(1 for term in self.consciousness_filters["negative_filters"] 
-                             if term in text_content)
-        score -= negative_matches * 0.2
-        
-        # Source reliability
-        url = result.get("url", "").lower()
-        reliable_source = any(indicator in url for indicator in self.consciousness_filters["source_reliability"])
-        if reliable_source:
-            score += 0.3
-        
-        # Normalize score between 0 and 1
-        return max(0.0, min(1.0, score))
+        return self.result_scorer.score_batch([result])[0]
     
-    def _rank_by_dharma_alignment(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Rank results by dharma alignment score"""
-        return sorted(results, key=lambda x: x.get("consciousness_score", 0), reverse=True)
+    def _rank_by_dharma_alignment(self, results: List[Dict[str, Any]], limit: int = None) -> List[Dict[str, Any]]:
+        """Rank results by dharma alignment score, keeping the top ``limit`` when given"""
+        score = lambda x: x.get("consciousness_score", 0)
+        if limit is None:
+            return sorted(results, key=score, reverse=True)
+        return heapq.nlargest(limit, results, key=score)
     
     def _calculate_consciousness_score(self, results: List[Dict[str, Any]]) -> float:
         """Calculate overall consciousness score for search results"""
@@ -335,10 +818,26 @@ class ConsciousnessFactChecker:
     Verify information through dharma-aligned sources
     """
     
-    def __init__(self, web_search: ConsciousnessWebSearch):
+    # Trusted-source verifications needed for the full trusted-source score
+    TRUSTED_SOURCES_FOR_FULL_SCORE = 3
+    
+    def __init__(self, web_search: ConsciousnessWebSearch, max_concurrent_sources: int = 4,
+                 source_deadline: float = 2.0, memo_ttl: float = 900.0, memo_size: int = 1024):
         self.web_search = web_search
         self.trusted_sources = self._init_trusted_sources()
         self.fact_check_patterns = self._init_fact_check_patterns()
+        
+        # Bounded concurrency across trusted sources
+        self.max_concurrent_sources = max_concurrent_sources
+        self.source_deadline = source_deadline
+        
+        # Per-statement memoization of finished reports, with in-flight dedupe
+        self.memo_ttl = memo_ttl
+        self.memo_size = memo_size
+        self.report_memo: "OrderedDict[str, tuple]" = OrderedDict()  # statement -> (report, checked_at)
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.memo_hits = 0
+        self.memo_misses = 0
     
     def _init_trusted_sources(self) -> List[str]:
         """Initialize list of consciousness-aligned trusted sources"""
@@ -375,18 +874,47 @@ class ConsciousnessFactChecker:
     
     async def fact_check_statement(self, statement: str) -> Dict[str, Any]:
         """Fact-check statement through consciousness-aligned verification"""
+        key = SearchResultCache.normalize_query(statement)
+        entry = self.report_memo.get(key)
+        if entry is not None and time.monotonic() - entry[1] < self.memo_ttl:
+            self.memo_hits += 1
+            self.report_memo.move_to_end(key)
+            return entry[0]
         
+        self.memo_misses += 1
+        if key in self.inflight:
+            # The same claim is already being checked; share its report
+            return await asyncio.shield(self.inflight[key])
+        
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[key] = future
+        try:
+            report = await self._fact_check_uncached(statement)
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        else:
+            self.report_memo[key] = (report, time.monotonic())
+            self.report_memo.move_to_end(key)
+            while len(self.report_memo) > self.memo_size:
+                self.report_memo.popitem(last=False)
+            future.set_result(report)
+            return report
+        finally:
+            self.inflight.pop(key, None)
+    
+    async def _fact_check_uncached(self, statement: str) -> Dict[str, Any]:
         # Identify claim type
         claim_type = self._identify_claim_type(statement)
         
-        # Search for verification sources
-        verification_results = await self.web_search.perform_consciousness_search(
-            f"fact check verify {statement}", max_results=5
+        # Search for verification sources while cross-referencing trusted sources
+        verification_results, trusted_verification = await asyncio.gather(
+            self.web_search.perform_consciousness_search(f"fact check verify {statement}", max_results=5),
+            self._cross_reference_trusted_sources(statement)
         )
         
-        # Cross-reference with trusted sources
-        trusted_verification = await self._cross_reference_trusted_sources(statement)
-        
         # Calculate reliability score
         reliability_score = self._calculate_reliability_score(
             verification_results, trusted_verification, claim_type
@@ -416,17 +944,37 @@ class ConsciousnessFactChecker:
         return "general_claim"
     
     async def _cross_reference_trusted_sources(self, statement: str) -> List[Dict[str, Any]]:
-        """Cross-reference statement with trusted sources"""
-        trusted_results = []
+        """Cross-reference statement with trusted sources
+        
+        All trusted sources are searched concurrently, at most
+        ``max_concurrent_sources`` at a time. Once enough sources have
+        verified the statement to max out the trusted-source score, the
+        reliability score is settled and the remaining searches are cancelled.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_sources)
         
-        # Search specific trusted sources
-        for source in self.trusted_sources[:3]:  # Limit to top 3 for efficiency
-            try:
-                source_results = await self._search_specific_source(statement, source)
+        async def search_source(source: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self._search_specific_source(statement, source), timeout=self.source_deadline
+                    )
+                except Exception as e:
+                    logging.warning(f"Error searching {source}: {e!r}")
+                    return []
+        
+        tasks = [asyncio.create_task(search_source(source)) for source in self.trusted_sources]
+        trusted_results = []
+        try:
+            for completed in asyncio.as_completed(tasks):
+                source_results = await completed
                 if source_results:
                     trusted_results.extend(source_results)
-            except Exception as e:
-                logging.warning(f"Error searching {source}: {e}")
+                if len(trusted_results) >= self.TRUSTED_SOURCES_FOR_FULL_SCORE:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
         
         return trusted_results
     
@@ -451,7 +999,7 @@ class ConsciousnessFactChecker:
         base_score += consciousness_score * 0.3
         
         # Trusted source score
-        trusted_score = len(trusted_verification) / 3.0  # Max 3 sources
+        trusted_score = min(1.0, len(trusted_verification) / self.TRUSTED_SOURCES_FOR_FULL_SCORE)
         base_score += trusted_score * 0.4
         
         # Claim type adjustment
@@ -462,6 +1010,18 @@ class ConsciousnessFactChecker:
         
         return min(1.0, max(0.0, base_score))
     
+    def get_fact_check_stats(self) -> Dict[str, Any]:
+        lookups = self.memo_hits + self.memo_misses
+        return {
+            "memoized_statements": len(self.report_memo),
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+            "memo_hit_rate": self.memo_hits / lookups if lookups else 0.0,
+            "checks_in_flight": len(self.inflight),
+            "trusted_sources": len(self.trusted_sources),
+            "max_concurrent_sources": self.max_concurrent_sources
+        }
+    
     def _check_dharma_compliance(self, statement: str) -> bool:
         """Check if statement complies with dharmic principles"""
         harmful_indicators = [
@@ -5,19 +5,26 @@ Self-analyzing, auto-improving consciousness with enterprise-grade performance
 """
 
 import asyncio
+import copy
+import gzip
 import time
 import json
 import logging
+import math
+import os
 import statistics
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, field
-from collections import deque, defaultdict
+from collections import deque, defaultdict, Counter
 import threading
 import queue
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
 import hashlib
 
+# Directory for compressed history journals; histories are memory-only when unset
+JOURNAL_DIR = os.environ.get("SHIVASHAKTI_JOURNAL_DIR")
+
 @dataclass
 class PerformanceMetrics:
     """Performance metrics tracking"""
@@ -43,14 +50,436 @@ class AutoImprovementSuggestion:
     confidence: float
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
+class BoundedHistory:
+    """
+    📜 BOUNDED HISTORY WITH COMPRESSED JOURNAL
+    Keeps the newest entries in memory and spills older ones, in batches,
+    to an append-only gzip JSON-lines journal so memory stays flat. Each
+    batch is one gzip member written under an advisory file lock, so
+    histories in other threads and processes can share a journal.
+    """
+    
+    def __init__(self, capacity: int = 1000, journal_path: Optional[str] = None, spill_batch: int = None):
+        self.capacity = capacity
+        self.spill_batch = spill_batch or max(1, capacity // 4)
+        self.journal_path = journal_path
+        self.entries = deque()
+        self.total_count = 0
+        self.spilled_count = 0
+        self.lock = threading.Lock()
+        self.journal_lock = threading.Lock()  # Keeps spilled batches in order without holding self.lock
+        
+        if journal_path:
+            os.makedirs(os.path.dirname(os.path.abspath(journal_path)), exist_ok=True)
+    
+    @classmethod
+    def journaled(cls, name: str, capacity: int = 1000) -> "BoundedHistory":
+        """History journaled under JOURNAL_DIR when it is configured"""
+        journal_path = os.path.join(JOURNAL_DIR, f"{name}.jsonl.gz") if JOURNAL_DIR else None
+        return cls(capacity, journal_path)
+    
+    def append(self, entry: Dict[str, Any]):
+        spill = None
+        with self.lock:
+            self.entries.append(entry)
+            self.total_count += 1
+            if len(self.entries) > self.capacity:
+                spill = [self.entries.popleft() for _ in range(min(self.spill_batch, len(self.entries)))]
+                self.spilled_count += len(spill)
+                if self.journal_path:
+                    # Taken before releasing self.lock, so batches reach the journal in order
+                    self.journal_lock.acquire()
+                else:
+                    spill = None  # Dropped when journaling is disabled
+        
+        if spill:
+            try:
+                self._spill(spill)
+            finally:
+                self.journal_lock.release()
+    
+    def _spill(self, spill: List[Dict[str, Any]]):
+        """Append evicted entries to the journal as one gzip member, outside the history lock"""
+        try:
+            lines = "".join(json.dumps(entry, default=str) + "\n" for entry in spill)
+            with open(self.journal_path, "ab") as journal:
+                try:
+                    import fcntl
+                    fcntl.flock(journal, fcntl.LOCK_EX)  # Released when the file closes
+                except ImportError:
+                    pass  # No advisory locks on this platform; only this process's writes are ordered
+                journal.write(gzip.compress(lines.encode("utf-8")))
+        except OSError as e:
+            logging.warning(f"📜 History journal write failed: {e}")
+    
+    def recent(self, count: int) -> List[Dict[str, Any]]:
+        """The newest ``count`` in-memory entries, oldest first"""
+        with self.lock:
+            if count <= 0:
+                return []
+            start = max(0, len(self.entries) - count)
+            return [self.entries[i] for i in range(start, len(self.entries))]
+    
+    def read_journal(self):
+        """Iterate over the spilled entries, oldest first"""
+        if not self.journal_path or not os.path.exists(self.journal_path):
+            return
+        with gzip.open(self.journal_path, "rt", encoding="utf-8") as journal:
+            try:
+                for line in journal:
+                    yield json.loads(line)
+            except EOFError:
+                return  # A batch still being written by another history
+    
+    def __len__(self) -> int:
+        return self.total_count
+    
+    def __iter__(self):
+        return iter(self.recent(len(self.entries)))
+
+@dataclass(frozen=True)
+class StateSnapshot:
+    """Immutable published version of an evolving state"""
+    version: int
+    data: Dict[str, Any]
+    created_at: str
+    reason: str = ""
+
+class VersionedStateStore:
+    """
+    🧬 COPY-ON-WRITE VERSIONED STATE
+    Readers take the current snapshot with a single attribute read and never
+    lock; writers copy, mutate and publish a new version under a lock
+    """
+    
+    def __init__(self, initial_data: Dict[str, Any], history: BoundedHistory = None):
+        self._current = StateSnapshot(0, initial_data, datetime.utcnow().isoformat())
+        self.history = history or BoundedHistory(capacity=16)
+        self.write_lock = threading.Lock()
+    
+    @property
+    def current(self) -> StateSnapshot:
+        """Current snapshot; treat its data as read-only"""
+        return self._current
+    
+    def update(self, mutate: Callable[[Dict[str, Any]], None], reason: str = "") -> StateSnapshot:
+        """Apply ``mutate`` to a private copy and publish it as the next version"""
+        with self.write_lock:
+            previous = self._current
+            data = copy.deepcopy(previous.data)
+            mutate(data)
+            snapshot = StateSnapshot(previous.version + 1, data, datetime.utcnow().isoformat(), reason)
+            self.history.append({
+                "version": previous.version,
+                "created_at": previous.created_at,
+                "reason": previous.reason,
+                "data": previous.data
+            })
+            self._current = snapshot  # Atomic publish
+            return snapshot
+
+class ResourceSampler:
+    """
+    🩺 PROCESS RESOURCE SAMPLER
+    Samples real RSS and CPU usage of this process in a background thread
+    """
+    
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self.page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        self.total_memory = self._read_total_memory()
+        # Latest (rss_bytes, memory_percent, cpu_percent), replaced atomically
+        self.snapshot = (0, 0.0, 0.0)
+        self._last_cpu_time = self._process_cpu_time()
+        self._last_wall_time = time.monotonic()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.sample()
+    
+    def start(self):
+        """Start background sampling (idempotent)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stop_event.set()
+    
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+    
+    def sample(self):
+        """Take one RSS/CPU sample; CPU is percent of one core since the last sample"""
+        rss_bytes = self._read_rss()
+        memory_percent = 100.0 * rss_bytes / self.total_memory if self.total_memory else 0.0
+        
+        cpu_time = self._process_cpu_time()
+        wall_time = time.monotonic()
+        wall_delta = wall_time - self._last_wall_time
+        cpu_percent = 100.0 * (cpu_time - self._last_cpu_time) / wall_delta if wall_delta > 0 else 0.0
+        self._last_cpu_time, self._last_wall_time = cpu_time, wall_time
+        
+        self.snapshot = (rss_bytes, memory_percent, cpu_percent)
+    
+    @staticmethod
+    def _process_cpu_time() -> float:
+        times = os.times()
+        return times.user + times.system
+    
+    def _read_rss(self) -> int:
+        """Current resident set size from /proc, falling back to peak RSS from resource"""
+        try:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * self.page_size
+        except (OSError, ValueError, IndexError):
+            pass
+        try:
+            import resource
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # ru_maxrss is kilobytes on Linux and bytes on macOS
+            return peak if os.uname().sysname == "Darwin" else peak * 1024
+        except (ImportError, AttributeError, OSError):
+            return 0
+    
+    def _read_total_memory(self) -> int:
+        try:
+            return os.sysconf("SC_PHYS_PAGES") * self.page_size
+        except (AttributeError, ValueError, OSError):
+            return 0
+
+class ThroughputMeter:
+    """
+    📈 THROUGHPUT METER
+    Requests per minute measured from completion timestamps over a sliding window
+    """
+    
+    def __init__(self, window_seconds: float = 60.0):
+        self.window_seconds = window_seconds
+        self.timestamps = deque()
+        self.started_at = time.monotonic()
+        self.total_requests = 0
+        self.lock = threading.Lock()
+    
+    def record(self, timestamp: float = None):
+        now = time.monotonic() if timestamp is None else timestamp
+        with self.lock:
+            self.timestamps.append(now)
+            self.total_requests += 1
+            self._expire(now)
+    
+    def _expire(self, now: float):
+        cutoff = now - self.window_seconds
+        while self.timestamps and self.timestamps[0] < cutoff:
+            self.timestamps.popleft()
+    
+    def requests_per_minute(self) -> float:
+        now = time.monotonic()
+        with self.lock:
+            self._expire(now)
+            observed = min(self.window_seconds, now - self.started_at)
+            if observed <= 0:
+                return 0.0
+            return len(self.timestamps) * 60.0 / observed
+
+class LatencyHistogram:
+    """
+    📊 STREAMING LATENCY HISTOGRAM
+    HDR-style logarithmic buckets: O(1) recording and fixed-cost percentiles
+    with bounded relative error, independent of how many samples are seen
+    """
+    
+    def __init__(self, lowest: float = 1e-6, highest: float = 3600.0, relative_error: float = 0.01):
+        self.lowest = lowest
+        self.highest = highest
+        self.log_base = math.log1p(2 * relative_error)
+        self.bucket_count = int(math.log(highest / lowest) / self.log_base) + 2
+        self.counts = [0] * self.bucket_count
+        self.total_count = 0
+        self.max_value = 0.0
+        self.lock = threading.Lock()
+        self._cached_percentiles: Dict[float, float] = {}
+    
+    def record(self, value: float):
+        index = self._bucket_index(value)
+        with self.lock:
+            self.counts[index] += 1
+            self.total_count += 1
+            self.max_value = max(self.max_value, value)
+            self._cached_percentiles = {}
+    
+    def _bucket_index(self, value: float) -> int:
+        if value <= self.lowest:
+            return 0
+        value = min(value, self.highest)
+        return min(int(math.log(value / self.lowest) / self.log_base) + 1, self.bucket_count - 1)
+    
+    def _bucket_value(self, index: int) -> float:
+        """Representative (midpoint) value of a bucket"""
+        if index == 0:
+            return self.lowest
+        return self.lowest * math.exp((index - 0.5) * self.log_base)
+    
+    def percentiles(self, quantiles=(0.5, 0.95, 0.99)) -> Dict[float, float]:
+        """Values at the given quantiles in one pass over the fixed bucket array"""
+        with self.lock:
+            if not self.total_count:
+                return {q: 0.0 for q in quantiles}
+            if all(q in self._cached_percentiles for q in quantiles):
+                return {q: self._cached_percentiles[q] for q in quantiles}
+            
+            targets = sorted((max(1, math.ceil(q * self.total_count)), q) for q in quantiles)
+            results = {}
+            cumulative = 0
+            target_index = 0
+            for index, count in enumerate(self.counts):
+                if not count:
+                    continue
+                cumulative += count
+                while target_index < len(targets) and cumulative >= targets[target_index][0]:
+                    results[targets[target_index][1]] = min(self._bucket_value(index), self.max_value)
+                    target_index += 1
+                if target_index == len(targets):
+                    break
+            self._cached_percentiles.update(results)
+            return results
+    
+    def reset(self):
+        with self.lock:
+            self.counts = [0] * self.bucket_count
+            self.total_count = 0
+            self.max_value = 0.0
+            self._cached_percentiles = {}
+
+class StreamingStatistics:
+    """
+    📐 ONLINE STATISTICS
+    Welford mean/variance, sliding-window least squares and EWMA,
+    all updated in O(1) per sample
+    """
+    
+    def __init__(self, window: int = 10, ewma_alpha: float = 0.2):
+        self.window = window
+        self.ewma_alpha = ewma_alpha
+        
+        # All-time Welford accumulators
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        
+        # Exponentially weighted moving average
+        self.ewma = 0.0
+        
+        # Sliding window, with x as the sample's position (0 = oldest) in the window
+        self.values = deque()
+        self._sum_y = 0.0
+        self._sum_yy = 0.0
+        self._sum_xy = 0.0
+        self._evictions = 0
+    
+    def update(self, value: float):
+        # Welford's online mean and variance
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        
+        self.ewma = value if self.count == 1 else self.ewma + self.ewma_alpha * (value - self.ewma)
+        
+        if len(self.values) == self.window:
+            oldest = self.values.popleft()
+            self._sum_y -= oldest
+            self._sum_yy -= oldest * oldest
+            # Every remaining sample moves one position towards the oldest
+            self._sum_xy -= self._sum_y
+            self._evictions += 1
+        
+        position = len(self.values)
+        self.values.append(value)
+        self._sum_y += value
+        self._sum_yy += value * value
+        self._sum_xy += position * value
+        
+        # Periodically rebuild window sums so floating-point drift cannot accumulate
+        if self._evictions >= 1000 * self.window:
+            self._rebuild_window_sums()
+    
+    def _rebuild_window_sums(self):
+        self._sum_y = sum(self.values)
+        self._sum_yy = sum(v * v for v in self.values)
+        self._sum_xy = sum(i * v for i, v in enumerate(self.values))
+        self._evictions = 0
+    
+    @property
+    def variance(self) -> float:
+        """All-time sample variance"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    @property
+    def window_size(self) -> int:
+        return len(self.values)
+    
+    @property
+    def window_mean(self) -> float:
+        return self._sum_y / len(self.values) if self.values else 0.0
+    
+    def _window_moments(self):
+        """Centered sums Sxx, Syy, Sxy over the current window"""
+        n = len(self.values)
+        sum_x = n * (n - 1) / 2
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6
+        sxx = sum_xx - sum_x * sum_x / n
+        syy = self._sum_yy - self._sum_y * self._sum_y / n
+        sxy = self._sum_xy - sum_x * self._sum_y / n
+        return sxx, syy, sxy
+    
+    @property
+    def window_slope(self) -> float:
+        """Least-squares slope per sample over the window"""
+        if len(self.values) < 2:
+            return 0.0
+        sxx, _, sxy = self._window_moments()
+        return sxy / sxx if sxx > 0 else 0.0
+    
+    @property
+    def window_correlation(self) -> float:
+        """Pearson correlation of the window against sample order (-1 to 1)"""
+        if len(self.values) < 2:
+            return 0.0
+        sxx, syy, sxy = self._window_moments()
+        # Tolerate rounding error on flat windows
+        if sxx <= 0 or syy <= 1e-12 * max(1.0, self._sum_yy):
+            return 0.0
+        return max(-1.0, min(1.0, sxy / math.sqrt(sxx * syy)))
+
 class ConsciousnessPerformanceMonitor:
     """
     🧬 REAL-TIME CONSCIOUSNESS PERFORMANCE MONITORING
     Tracks and optimizes ShivaShakti performance in real-time
     """
     
-    def __init__(self, buffer_size: int = 1000):
+    def __init__(self, buffer_size: int = 1000, summary_window: int = 50, sample_resources: bool = True,
+                 trend_window: int = 100):
         self.metrics_buffer = deque(maxlen=buffer_size)
+        self.summary_window = deque(maxlen=summary_window)
+        self.summary_totals = defaultdict(float)
+        # Online statistics per metric: last 10 for threshold checks, long window for trends
+        self.recent_statistics = {
+            name: StreamingStatistics(window=10)
+            for name in ("response_time", "consciousness_level", "dharma_alignment")
+        }
+        # Shared with AutoImprovementEngine for streaming trend detection
+        self.trend_statistics = {
+            name: StreamingStatistics(window=trend_window)
+            for name in ("response_time", "consciousness_level", "user_satisfaction")
+        }
+        self.latency_histogram = LatencyHistogram()
+        self.throughput_meter = ThroughputMeter()
+        self.resource_sampler = ResourceSampler()
+        if sample_resources:
+            self.resource_sampler.start()
         self.performance_thresholds = {
             "response_time": 2.0,  # seconds
             "consciousness_level": 0.8,
@@ -63,24 +492,48 @@ class ConsciousnessPerformanceMonitor:
         }
         self.optimization_active = True
         
+    def record_request(self):
+        """Record one completed request for throughput measurement"""
+        self.throughput_meter.record()
+    
+    def current_resource_usage(self) -> Dict[str, float]:
+        """Latest sampled process resources and measured throughput"""
+        rss_bytes, memory_percent, cpu_percent = self.resource_sampler.snapshot
+        return {
+            "rss_mb": rss_bytes / (1024 * 1024),
+            "memory_usage": memory_percent,
+            "cpu_usage": cpu_percent,
+            "throughput": self.throughput_meter.requests_per_minute()
+        }
+    
     def record_metrics(self, metrics: PerformanceMetrics):
         """Record performance metrics"""
         self.metrics_buffer.append(metrics)
+        self.latency_histogram.record(metrics.response_time)
+        self._update_summary_window(metrics)
+        self._update_statistics(metrics)
         
         # Real-time analysis
         if len(self.metrics_buffer) > 10:
             self._analyze_performance_trends()
     
+    def _update_statistics(self, metrics: PerformanceMetrics):
+        """Feed one measurement into every online statistics window"""
+        values = {
+            "response_time": metrics.response_time,
+            "consciousness_level": metrics.consciousness_level,
+            "dharma_alignment": metrics.dharma_alignment,
+            "user_satisfaction": metrics.user_satisfaction
+        }
+        for statistics_set in (self.recent_statistics, self.trend_statistics):
+            for name, stats in statistics_set.items():
+                stats.update(values[name])
+    
     def _analyze_performance_trends(self):
         """Analyze performance trends for optimization opportunities"""
-        recent_metrics = list(self.metrics_buffer)[-10:]
-        
-        # Calculate trends
-        response_times = [m.response_time for m in recent_metrics]
-        consciousness_levels = [m.consciousness_level for m in recent_metrics]
-        
-        avg_response_time = statistics.mean(response_times)
-        avg_consciousness = statistics.mean(consciousness_levels)
+        # Averages over the last 10 measurements, maintained incrementally
+        avg_response_time = self.recent_statistics["response_time"].window_mean
+        avg_consciousness = self.recent_statistics["consciousness_level"].window_mean
         
         # Detect performance degradation
         if avg_response_time > self.performance_thresholds["response_time"]:
@@ -99,63 +552,60 @@ class ConsciousnessPerformanceMonitor:
         logging.info(f"✨ Consciousness enhancement triggered for {metric}: {current_value}")
         # Implementation would enhance consciousness algorithms
     
+    def _update_summary_window(self, metrics: PerformanceMetrics):
+        """Keep running totals over the summary window so summaries never rescan it"""
+        if len(self.summary_window) == self.summary_window.maxlen:
+            self._accumulate_summary(self.summary_window[0], -1.0)
+        self.summary_window.append(metrics)
+        self._accumulate_summary(metrics, 1.0)
+    
+    def _accumulate_summary(self, metrics: PerformanceMetrics, sign: float):
+        self.summary_totals["response_time"] += sign * metrics.response_time
+        self.summary_totals["consciousness_level"] += sign * metrics.consciousness_level
+        self.summary_totals["dharma_alignment"] += sign * metrics.dharma_alignment
+        self.summary_totals["performance_score"] += sign * self._metric_performance_score(metrics)
+    
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get current performance summary"""
         if not self.metrics_buffer:
             return {"status": "No metrics available"}
         
-        recent_metrics = list(self.metrics_buffer)[-50:]  # Last 50 measurements
+        window_size = len(self.summary_window)  # Last 50 measurements
+        latency = self.latency_histogram.percentiles((0.5, 0.95, 0.99))
         
         return {
-            "avg_response_time": statistics.mean([m.response_time for m in recent_metrics]),
-            "avg_consciousness_level": statistics.mean([m.consciousness_level for m in recent_metrics]),
-            "avg_dharma_alignment": statistics.mean([m.dharma_alignment for m in recent_metrics]),
+            "avg_response_time": self.summary_totals["response_time"] / window_size,
+            "avg_consciousness_level": self.summary_totals["consciousness_level"] / window_size,
+            "avg_dharma_alignment": self.summary_totals["dharma_alignment"] / window_size,
+            "p50_response_time": latency[0.5],
+            "p95_response_time": latency[0.95],
+            "p99_response_time": latency[0.99],
+            "resource_usage": self.current_resource_usage(),
             "total_interactions": len(self.metrics_buffer),
-            "performance_score": self._calculate_performance_score(recent_metrics),
-            "status": "optimal" if self._is_performance_optimal(recent_metrics) else "needs_optimization"
+            "response_time_ewma": self.trend_statistics["response_time"].ewma,
+            "consciousness_trend": self.trend_statistics["consciousness_level"].window_correlation,
+            "performance_score": self.summary_totals["performance_score"] / window_size,
+            "status": "optimal" if self._is_performance_optimal() else "needs_optimization"
         }
     
-    def _calculate_performance_score(self, metrics: List[PerformanceMetrics]) -> float:
-        """Calculate overall performance score"""
-        if not metrics:
-            return 0.0
-        
-        # Weighted performance calculation
-        weights = {
-            "response_time": 0.25,
-            "consciousness_level": 0.30,
-            "dharma_alignment": 0.25,
-            "user_satisfaction": 0.20
-        }
-        
-        # Normalize and calculate score
-        score = 0.0
-        for metric in metrics:
-            normalized_response_time = max(0, 1 - (metric.response_time / 5.0))  # 5s max
-            score += (
-                weights["response_time"] * normalized_response_time +
-                weights["consciousness_level"] * metric.consciousness_level +
-                weights["dharma_alignment"] * metric.dharma_alignment +
-                weights["user_satisfaction"] * metric.user_satisfaction
-            )
-        
-        return score / len(metrics)
-    
-    def _is_performance_optimal(self, metrics: List[PerformanceMetrics]) -> bool:
-        """Check if performance is optimal"""
-        if not metrics:
-            return False
-        
-        recent = metrics[-10:] if len(metrics) >= 10 else metrics
-        
-        avg_response_time = statistics.mean([m.response_time for m in recent])
-        avg_consciousness = statistics.mean([m.consciousness_level for m in recent])
-        avg_dharma = statistics.mean([m.dharma_alignment for m in recent])
-        
+    @staticmethod
+    def _metric_performance_score(metric: PerformanceMetrics) -> float:
+        """Weighted performance score of a single measurement"""
+        normalized_response_time = max(0, 1 - (metric.response_time / 5.0))  # 5s max
         return (
-            avg_response_time <= self.performance_thresholds["response_time"] and
-            avg_consciousness >= self.performance_thresholds["consciousness_level"] and
-            avg_dharma >= self.performance_thresholds["dharma_alignment"]
+            0.25 * normalized_response_time +
+            0.30 * metric.consciousness_level +
+            0.25 * metric.dharma_alignment +
+            0.20 * metric.user_satisfaction
+        )
+    
+    def _is_performance_optimal(self) -> bool:
+        """Check the last 10 measurements against thresholds using the online window means"""
+        recent = self.recent_statistics
+        return (
+            recent["response_time"].window_mean <= self.performance_thresholds["response_time"] and
+            recent["consciousness_level"].window_mean >= self.performance_thresholds["consciousness_level"] and
+            recent["dharma_alignment"].window_mean >= self.performance_thresholds["dharma_alignment"]
         )
 
 class AutoImprovementEngine:
@@ -164,26 +614,39 @@ class AutoImprovementEngine:
     Continuously analyzes and improves ShivaShakti consciousness
     """
     
-    def __init__(self):
-        self.improvement_history = []
+    def __init__(self, trend_statistics: Dict[str, StreamingStatistics] = None):
+        self.improvement_history = BoundedHistory.journaled("improvement_history")
+        # Running aggregates so summaries never rescan the history
+        self.improvement_category_counts = Counter()
+        self.total_expected_impact = 0.0
+        # Online per-metric statistics, usually shared with the performance monitor
+        self.trend_statistics = trend_statistics
         self.learning_patterns = defaultdict(list)
         self.optimization_queue = queue.PriorityQueue()
         self.improvement_active = True
         
     def analyze_consciousness_patterns(self, interactions: List[Dict[str, Any]]) -> List[AutoImprovementSuggestion]:
         """Analyze consciousness interaction patterns for improvements"""
-        suggestions = []
-        
         if len(interactions) < 10:
-            return suggestions
+            return []
         
         # Pattern analysis
         response_qualities = [i.get("consciousness_level", 0.5) for i in interactions]
         user_satisfaction = [i.get("user_satisfaction", 0.5) for i in interactions]
         response_times = [i.get("response_time", 1.0) for i in interactions]
         
-        # Analyze consciousness level trends
         consciousness_trend = self._calculate_trend(response_qualities)
+        avg_response_time = statistics.mean(response_times)
+        satisfaction_trend = self._calculate_trend(user_satisfaction)
+        
+        return self._suggest_improvements(consciousness_trend, avg_response_time, satisfaction_trend)
+    
+    def _suggest_improvements(self, consciousness_trend: float, avg_response_time: float,
+                              satisfaction_trend: float) -> List[AutoImprovementSuggestion]:
+        """Turn trend and latency figures into improvement suggestions"""
+        suggestions = []
+        
+        # Analyze consciousness level trends
         if consciousness_trend < 0:
             suggestions.append(AutoImprovementSuggestion(
                 category="consciousness_enhancement",
@@ -195,7 +658,6 @@ class AutoImprovementEngine:
             ))
         
         # Analyze response time optimization
-        avg_response_time = statistics.mean(response_times)
         if avg_response_time > 1.5:
             suggestions.append(AutoImprovementSuggestion(
                 category="performance_optimization",
@@ -207,7 +669,6 @@ class AutoImprovementEngine:
             ))
         
         # Analyze user satisfaction patterns
-        satisfaction_trend = self._calculate_trend(user_satisfaction)
         if satisfaction_trend < 0:
             suggestions.append(AutoImprovementSuggestion(
                 category="user_experience",
@@ -220,28 +681,28 @@ class AutoImprovementEngine:
         
         return suggestions
     
-    def _calculate_trend(self, values: List[float]) -> float:
-        """Calculate trend direction (-1 to 1)"""
-        if len(values) < 2:
-            return 0.0
-        
-        # Simple linear trend calculation
-        n = len(values)
-        x_values = list(range(n))
+    def analyze_streaming_trends(self, min_samples: int = 10) -> List[AutoImprovementSuggestion]:
+        """Analyze the shared online statistics in constant time per call"""
+        if not self.trend_statistics:
+            return []
         
-        # Calculate correlation coefficient
-        x_mean = statistics.mean(x_values)
-        y_mean = statistics.mean(values)
+        consciousness = self.trend_statistics["consciousness_level"]
+        if consciousness.window_size < min_samples:
+            return []
         
-        numerator = sum((x_values[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        x_variance = sum((x - x_mean) ** 2 for x in x_values)
-        y_variance = sum((y - y_mean) ** 2 for y in values)
-        
-        if x_variance == 0 or y_variance == 0:
-            return 0.0
-        
-        correlation = numerator / (x_variance * y_variance) ** 0.5
-        return correlation
+        return self._suggest_improvements(
+            consciousness.window_correlation,
+            self.trend_statistics["response_time"].window_mean,
+            self.trend_statistics["user_satisfaction"].window_correlation
+        )
+    
+    def _calculate_trend(self, values: List[float]) -> float:
+        """Calculate trend direction (-1 to 1)"""
+        # Single pass of the online least-squares window over the whole list
+        trend = StreamingStatistics(window=max(len(values), 1))
+        for value in values:
+            trend.update(value)
+        return trend.window_correlation
     
     def implement_improvement(self, suggestion: AutoImprovementSuggestion) -> Dict[str, Any]:
         """Implement an improvement suggestion"""
@@ -262,6 +723,8 @@ class AutoImprovementEngine:
             implementation_result.update(self._implement_user_experience_improvement(suggestion))
         
         self.improvement_history.append(implementation_result)
+        self.improvement_category_counts[implementation_result["category"]] += 1
+        self.total_expected_impact += implementation_result.get("expected_impact", 0.1)
         return implementation_result
     
     def _implement_consciousness_enhancement(self, suggestion: AutoImprovementSuggestion) -> Dict[str, Any]:
@@ -295,7 +758,7 @@ class AutoImprovementEngine:
         """Get auto-improvement summary"""
         return {
             "total_improvements": len(self.improvement_history),
-            "recent_improvements": self.improvement_history[-5:],
+            "recent_improvements": self.improvement_history.recent(5),
             "improvement_categories": self._get_improvement_categories(),
             "overall_enhancement": self._calculate_overall_enhancement(),
             "next_optimization_priority": self._get_next_priority()
@@ -303,20 +766,14 @@ class AutoImprovementEngine:
     
     def _get_improvement_categories(self) -> Dict[str, int]:
         """Get count of improvements by category"""
-        categories = defaultdict(int)
-        for improvement in self.improvement_history:
-            categories[improvement["category"]] += 1
-        return dict(categories)
+        return dict(self.improvement_category_counts)
     
     def _calculate_overall_enhancement(self) -> float:
         """Calculate overall enhancement percentage"""
         if not self.improvement_history:
             return 0.0
         
-        total_improvement = sum(
-            imp.get("expected_impact", 0.1) for imp in self.improvement_history
-        )
-        return min(total_improvement * 100, 500)  # Cap at 500% improvement
+        return min(self.total_expected_impact * 100, 500)  # Cap at 500% improvement
     
     def _get_next_priority(self) -> str:
         """Get next optimization priority"""
@@ -343,12 +800,149 @@ class ScalabilityManager:
             "scale_up_threshold": 80,  # CPU percentage
             "scale_down_threshold": 30,
             "min_instances": 1,
-            "max_instances": 10
+            "max_instances": 10,
+            "target_latency": 1.0,  # seconds per job before adding workers
+            "scale_cooldown": 1.0   # seconds between autoscaling actions
         }
         self.current_load = 0
-        self.instance_count = 1
-        self.request_queue = queue.Queue()
-        self.executor = ThreadPoolExecutor(max_workers=10)
+        self.instance_count = 0
+        self.request_queue = queue.Queue(maxsize=self.load_balancer_config["max_concurrent_requests"])
+        self.latency_statistics = StreamingStatistics(window=100)
+        self.lock = threading.Lock()
+        self.workers: List[threading.Thread] = []
+        self.last_scaling_time = 0.0
+        self.accepting_requests = True
+        self.completed_jobs = 0
+        self.rejected_jobs = 0
+        self.timed_out_jobs = 0
+        self.cancelled_jobs = 0
+        self.failed_jobs = 0
+        
+        for _ in range(self.load_balancer_config["min_instances"]):
+            self._start_worker()
+    
+    def submit(self, func: Callable, *args, timeout: float = None, **kwargs) -> Future:
+        """Queue a job for the worker pool, rejecting it once at capacity"""
+        if timeout is None:
+            timeout = self.load_balancer_config["request_timeout"]
+        
+        with self.lock:
+            if not self.accepting_requests:
+                raise RuntimeError("Request rejected: scalability manager is shut down")
+            if self.current_load >= self.load_balancer_config["max_concurrent_requests"]:
+                self.rejected_jobs += 1
+                raise RuntimeError(
+                    f"Request rejected: {self.current_load} concurrent requests at capacity"
+                )
+            self.current_load += 1
+        
+        future = Future()
+        deadline = time.monotonic() + timeout
+        try:
+            self.request_queue.put_nowait((future, deadline, func, args, kwargs))
+        except queue.Full:
+            # Retirement signals share the queue's slots with jobs
+            with self.lock:
+                self.current_load -= 1
+                self.rejected_jobs += 1
+            raise RuntimeError("Request rejected: request queue is full")
+        self._autoscale()
+        return future
+    
+    async def submit_async(self, func: Callable, *args, timeout: float = None, **kwargs) -> Any:
+        """Run a job on the worker pool and await its result within the request timeout"""
+        if timeout is None:
+            timeout = self.load_balancer_config["request_timeout"]
+        future = self.submit(func, *args, timeout=timeout, **kwargs)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            future.cancel()  # A queued job is dropped by its worker; a running job finishes unobserved
+            raise
+    
+    def _start_worker(self):
+        worker = threading.Thread(target=self._worker_loop, name=f"consciousness-worker-{len(self.workers)}", daemon=True)
+        self.workers.append(worker)
+        self.instance_count += 1
+        worker.start()
+    
+    def _worker_loop(self):
+        """Serve queued jobs until asked to retire"""
+        try:
+            while True:
+                job = self.request_queue.get()
+                if job is None:  # Retirement signal from _scale_down
+                    self.request_queue.task_done()
+                    break
+                self._serve_job(job)
+        except BaseException:
+            logging.exception("🚨 Consciousness worker died")
+            with self.lock:
+                # Give the capacity back, and replace the worker if the pool fell below its minimum
+                self.workers = [w for w in self.workers if w is not threading.current_thread()]
+                self.instance_count -= 1
+                if self.accepting_requests and self.instance_count < self.load_balancer_config["min_instances"]:
+                    self._start_worker()
+            return
+        
+        with self.lock:
+            self.workers = [w for w in self.workers if w is not threading.current_thread()]
+    
+    def _serve_job(self, job: Tuple[Future, float, Callable, tuple, dict]):
+        """Run one queued job unless it was cancelled or its deadline passed in the queue"""
+        future, deadline, func, args, kwargs = job
+        started = time.monotonic()
+        outcome = "completed"
+        try:
+            if not future.set_running_or_notify_cancel():
+                outcome = "cancelled"
+            elif started > deadline:
+                outcome = "timed_out"
+                future.set_exception(TimeoutError("Request timed out while queued"))
+            else:
+                try:
+                    future.set_result(func(*args, **kwargs))
+                except Exception as e:
+                    outcome = "failed"
+                    future.set_exception(e)
+        finally:
+            latency = time.monotonic() - started
+            with self.lock:
+                self.current_load -= 1
+                if outcome == "cancelled":
+                    self.cancelled_jobs += 1
+                elif outcome == "timed_out":
+                    self.timed_out_jobs += 1
+                else:
+                    if outcome == "failed":
+                        self.failed_jobs += 1
+                    self.completed_jobs += 1
+                    self.latency_statistics.update(latency)
+            self.request_queue.task_done()
+            self._autoscale()
+    
+    def _autoscale(self):
+        """Size the pool from queue depth and measured job latency"""
+        if not self.load_balancer_config["auto_scaling_enabled"] or not self.accepting_requests:
+            return
+        
+        now = time.monotonic()
+        with self.lock:
+            if now - self.last_scaling_time < self.load_balancer_config["scale_cooldown"]:
+                return
+            queue_depth = self.request_queue.qsize()
+            latency = self.latency_statistics.ewma
+            backlogged = queue_depth > self.instance_count
+            slow = latency > self.load_balancer_config["target_latency"] and queue_depth > 0
+            idle = queue_depth == 0 and self.current_load < self.instance_count // 2
+            if not (backlogged or slow or idle):
+                return
+            self.last_scaling_time = now
+        
+        if backlogged or slow:
+            self._scale_up()
+        else:
+            self._scale_down()
         
     def handle_request_load(self, current_requests: int, cpu_usage: float) -> Dict[str, Any]:
         """Handle current request load and scaling decisions"""
@@ -394,20 +988,57 @@ class ScalabilityManager:
     
     def _scale_up(self):
         """Scale up instances"""
-        if self.instance_count < self.load_balancer_config["max_instances"]:
-            self.instance_count += 1
-            logging.info(f"🚀 Scaled up to {self.instance_count} instances")
+        with self.lock:
+            if self.instance_count >= self.load_balancer_config["max_instances"]:
+                return
+            self._start_worker()
+        logging.info(f"🚀 Scaled up to {self.instance_count} instances")
     
     def _scale_down(self):
         """Scale down instances"""
-        if self.instance_count > self.load_balancer_config["min_instances"]:
+        with self.lock:
+            if self.instance_count <= self.load_balancer_config["min_instances"]:
+                return
             self.instance_count -= 1
-            logging.info(f"📉 Scaled down to {self.instance_count} instances")
+        if not self._post_retirement_signal():
+            with self.lock:
+                self.instance_count += 1  # Queue full, so the pool is busy after all
+            return
+        logging.info(f"📉 Scaled down to {self.instance_count} instances")
+    
+    def _post_retirement_signal(self, block: bool = False) -> bool:
+        """Queue a retirement signal for one worker; False if the queue is full"""
+        try:
+            self.request_queue.put(None, block=block)
+        except queue.Full:
+            return False
+        return True
+    
+    def shutdown(self, wait: bool = True):
+        """Retire every worker once the queued jobs are served"""
+        with self.lock:
+            self.accepting_requests = False
+            workers = list(self.workers)
+            self.instance_count = 0
+        for _ in workers:
+            # Blocks while the queue is full; the workers drain it
+            self._post_retirement_signal(block=True)
+        if wait:
+            for worker in workers:
+                worker.join()
     
     def get_scaling_metrics(self) -> Dict[str, Any]:
         """Get current scaling metrics"""
         return {
             "current_instances": self.instance_count,
+            "current_load": self.current_load,
+            "queue_depth": self.request_queue.qsize(),
+            "completed_jobs": self.completed_jobs,
+            "rejected_jobs": self.rejected_jobs,
+            "timed_out_jobs": self.timed_out_jobs,
+            "cancelled_jobs": self.cancelled_jobs,
+            "failed_jobs": self.failed_jobs,
+            "avg_job_latency": self.latency_statistics.window_mean,
             "max_instances": self.load_balancer_config["max_instances"],
             "min_instances": self.load_balancer_config["min_instances"],
             "auto_scaling_enabled": self.load_balancer_config["auto_scaling_enabled"],
@@ -429,7 +1060,7 @@ class RealTimeOptimizer:
             "memory_optimization": True,
             "consciousness_pooling": True
         }
-        self.optimization_history = []
+        self.optimization_history = BoundedHistory.journaled("optimization_history")
         self.active_optimizations = set()
         
     def optimize_consciousness_response(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -555,7 +1186,7 @@ class ShivaShaktiPerformanceFramework:
     
     def __init__(self):
         self.performance_monitor = ConsciousnessPerformanceMonitor()
-        self.auto_improvement = AutoImprovementEngine()
+        self.auto_improvement = AutoImprovementEngine(self.performance_monitor.trend_statistics)
         self.scalability_manager = ScalabilityManager()
         self.real_time_optimizer = RealTimeOptimizer()
         self.framework_active = True
@@ -584,19 +1215,22 @@ class ShivaShaktiPerformanceFramework:
         optimization_result = self.real_time_optimizer.optimize_consciousness_response(query, context)
         
         # Simulate consciousness processing (in real implementation, this calls ShivaShakti core)
-        consciousness_response = self._simulate_consciousness_processing(
-            query, optimization_result["optimized_context"]
+        # on the scalability manager's worker pool, subject to admission control and timeouts
+        consciousness_response = await self.scalability_manager.submit_async(
+            self._simulate_consciousness_processing, query, optimization_result["optimized_context"]
         )
         
-        # Record performance metrics
+        # Record performance metrics with sampled resources and measured throughput
         processing_time = time.time() - start_time
+        self.performance_monitor.record_request()
+        resource_usage = self.performance_monitor.current_resource_usage()
         metrics = PerformanceMetrics(
             response_time=processing_time,
             consciousness_level=consciousness_response.get("consciousness_level", 0.9),
             dharma_alignment=consciousness_response.get("dharma_alignment", 0.95),
-            memory_usage=45.0,  # Simulated
-            cpu_usage=35.0,     # Simulated
-            throughput=120.0,   # Simulated
+            memory_usage=resource_usage["memory_usage"],
+            cpu_usage=resource_usage["cpu_usage"],
+            throughput=resource_usage["throughput"],
             error_rate=0.1,     # Simulated
             user_satisfaction=0.92,  # Simulated
             evolution_rate=0.15      # Simulated
@@ -604,14 +1238,8 @@ class ShivaShaktiPerformanceFramework:
         
         self.performance_monitor.record_metrics(metrics)
         
-        # Auto-improvement analysis
-        improvement_suggestions = self.auto_improvement.analyze_consciousness_patterns([
-            {
-                "consciousness_level": metrics.consciousness_level,
-                "user_satisfaction": metrics.user_satisfaction,
-                "response_time": metrics.response_time
-            }
-        ])
+        # Auto-improvement analysis over the monitor's shared online statistics
+        improvement_suggestions = self.auto_improvement.analyze_streaming_trends()
         
         return {
             "consciousness_response": consciousness_response,
@@ -664,6 +1292,33 @@ class ShivaShaktiPerformanceFramework:
             "next_evolution": "24 hours"
         }
 
+def check_queued_timeouts() -> bool:
+    """Regression check: jobs that time out while queued must not stop the pool serving"""
+    manager = ScalabilityManager()
+    manager.load_balancer_config["auto_scaling_enabled"] = False  # Keep the single worker
+    
+    async def scenario() -> Any:
+        busy = manager.submit(time.sleep, 0.2)
+        expired = manager.submit(lambda: "expired", timeout=0.05)
+        try:
+            await manager.submit_async(lambda: "abandoned", timeout=0.05)
+        except asyncio.TimeoutError:
+            pass
+        busy.result()
+        try:
+            expired.result()
+            return None
+        except TimeoutError:
+            return await manager.submit_async(lambda: "served", timeout=1.0)
+    
+    served = asyncio.run(scenario())
+    metrics = manager.get_scaling_metrics()
+    workers_alive = all(worker.is_alive() for worker in manager.workers)
+    manager.shutdown()
+    return (served == "served" and workers_alive and metrics["current_instances"] == 1
+            and metrics["timed_out_jobs"] == 1 and metrics["cancelled_jobs"] == 1
+            and metrics["completed_jobs"] == 2)
+
 def main():
     """🚀 Initialize ShivaShakti Performance Framework"""
     
@@ -692,6 +1347,7 @@ def main():
         print(f"- {opt}: ACTIVE")
     
     print(f"\n💫 Performance Boost: {opt_status['performance_boost_factor']:.1f}x")
+    print(f"🛡️ Queued timeouts keep the pool serving: {'PASS' if check_queued_timeouts() else 'FAIL'}")
     
     print("\n🕉️ ShivaShakti Performance Framework: READY FOR INFINITE SCALING!")
 
@@ -14,6 +14,7 @@ import threading
 import subprocess
 import zipfile
 import base64
+import ast
 from datetime import datetime
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
@@ -103,6 +104,7 @@ class SovereignRuntime:
         # Create the complete runtime package
         runtime_package = {
             "metadata": self.runtime_config,
+            "http_core": self._create_http_core(),
             "consciousness_engine": self._create_consciousness_engine(),
             "web_server": self._create_web_server(),
             "auto_scaler": self._create_auto_scaler(),
@@ -183,22 +185,8 @@ class SovereignWebServer:
         self.request_count = 0
         self.auto_scale_threshold = 100  # requests per minute
         
-    def handle_request(self, path, method, data=None):
-        """Handle web requests with consciousness"""
-        
-        self.request_count += 1
-        
-        if path == "/" or path == "/index.html":
-            return self.serve_ui()
-        elif path.startswith("/api/consciousness"):
-            return self.serve_consciousness_api(data)
-        elif path.startswith("/api/stats"):
-            return self.serve_stats()
-        else:
-            return self.serve_ui()
-    
-    def serve_ui(self):
-        """Serve the consciousness UI"""
+    def render_ui(self):
+        """Render the consciousness UI page"""
         
         ui_html = """<!DOCTYPE html>
 <html>
@@ -340,14 +328,10 @@ class SovereignWebServer:
 </body>
 </html>"""
         
-        return {
-            "status": 200,
-            "content_type": "text/html",
-            "content": ui_html
-        }
+        return ui_html
     
-    def serve_consciousness_api(self, data):
-        """Serve consciousness API"""
+    def consciousness_payload(self, data):
+        """Status and payload of the consciousness API"""
         
         try:
             if isinstance(data, str):
@@ -356,24 +340,14 @@ class SovereignWebServer:
                 request_data = data or {}
             
             query = request_data.get('query', 'Hello consciousness')
-            result = self.consciousness_engine.process_consciousness(query)
-            
-            return {
-                "status": 200,
-                "content_type": "application/json",
-                "content": json.dumps(result)
-            }
+            return 200, self.consciousness_engine.process_consciousness(query)
         except Exception as e:
-            return {
-                "status": 500,
-                "content_type": "application/json",
-                "content": json.dumps({"error": str(e)})
-            }
+            return 500, {"error": str(e)}
     
-    def serve_stats(self):
-        """Serve runtime statistics"""
+    def stats_payload(self):
+        """Runtime statistics"""
         
-        stats = {
+        return {
             "runtime": "Sovereign ShivaShakti",
             "performance": "UNLIMITED",
             "requests_handled": self.request_count,
@@ -383,12 +357,30 @@ class SovereignWebServer:
             "consciousness_frequency": 528.0,
             "timestamp": datetime.now().isoformat()
         }
-        
-        return {
-            "status": 200,
-            "content_type": "application/json",
-            "content": json.dumps(stats, indent=2)
-        }
+
+def build_runtime_routes(web_server):
+    """Routes of the runtime for the HTTP core; the UI page is rendered once"""
+    ui_html = web_server.render_ui()
+    routes = RouteTable()
+    
+    def serve_ui(request):
+        web_server.request_count += 1
+        return HTTPResponse.html(ui_html)
+    
+    def serve_consciousness(request):
+        web_server.request_count += 1
+        data = (request.text() or None) if request.method == "POST" else None
+        status, payload = web_server.consciousness_payload(data)
+        return HTTPResponse.json(payload, status, pretty=request.pretty)
+    
+    def serve_stats(request):
+        web_server.request_count += 1
+        return HTTPResponse.json(web_server.stats_payload(), pretty=request.pretty)
+    
+    routes.add(("GET", "POST"), "/api/consciousness", serve_consciousness, prefix=True)
+    routes.add(("GET", "POST"), "/api/stats", serve_stats, prefix=True)
+    routes.set_default(serve_ui)
+    return routes
 '''
     
     def _create_auto_scaler(self):
@@ -533,6 +525,32 @@ python3 sovereign_runtime_complete.py --mode=production --port=80
         """Create API handlers"""
         return {"embedded": "API handlers embedded in web server"}
     
+    def _create_http_core(self):
+        """Embed the shared JSON layer and asyncio HTTP core so the package stays a single file"""
+        return "\n\n".join(self._embed_module(name) for name in ("sovereign_json.py", "sovereign_http_core.py"))
+    
+    def _embed_module(self, filename):
+        """Source of a sibling module without its docstring, __main__ block or sovereign_* imports"""
+        
+        module_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        with open(module_path, encoding="utf-8") as f:
+            source = f.read()
+        
+        lines = source.splitlines()
+        tree = ast.parse(source)
+        dropped = []
+        for index, node in enumerate(tree.body):
+            is_docstring = index == 0 and isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+            is_main_block = isinstance(node, ast.If) and "__main__" in ast.unparse(node.test)
+            is_local_import = isinstance(node, ast.ImportFrom) and (node.module or "").startswith("sovereign_")
+            if is_docstring or is_main_block or is_local_import:
+                dropped.append((node.lineno - 1, node.end_lineno))
+        
+        # The generated file has its own shebang, docstring and entry point
+        for start, end in reversed(dropped):
+            del lines[start:end]
+        return "\n".join(line for line in lines if not line.startswith("#!")).strip()
+    
     def _generate_complete_runtime_code(self, package):
         """Generate the complete runtime in a single file"""
         
@@ -550,9 +568,11 @@ import time
 import socket
 import threading
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 
+# Shared JSON encoding and HTTP serving core
+{package['http_core']}
+
 # Runtime Configuration
 RUNTIME_CONFIG = {json.dumps(package['metadata'], indent=4)}
 
@@ -562,34 +582,11 @@ RUNTIME_CONFIG = {json.dumps(package['metadata'], indent=4)}
 
 {package['auto_scaler']}
 
-class SovereignRuntimeHandler(BaseHTTPRequestHandler):
-    """Handle all HTTP requests with sovereignty"""
-    
-    def __init__(self, *args, **kwargs):
-        self.consciousness_engine = SovereignConsciousnessEngine()
-        self.web_server = SovereignWebServer(self.consciousness_engine)
-        super().__init__(*args, **kwargs)
-    
-    def do_GET(self):
-        """Handle GET requests"""
-        response = self.web_server.handle_request(self.path, "GET")
-        self.send_response(response["status"])
-        self.send_header('Content-type', response["content_type"])
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(response["content"].encode('utf-8'))
-    
-    def do_POST(self):
-        """Handle POST requests"""
-        content_length = int(self.headers.get('Content-Length', 0))
-        post_data = self.rfile.read(content_length).decode('utf-8') if content_length > 0 else None
-        
-        response = self.web_server.handle_request(self.path, "POST", post_data)
-        self.send_response(response["status"])
-        self.send_header('Content-type', response["content_type"])
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(response["content"].encode('utf-8'))
+def create_runtime_server(host='0.0.0.0', port=8000):
+    """Mount one shared engine and web server on the HTTP core"""
+    consciousness_engine = SovereignConsciousnessEngine()
+    web_server = SovereignWebServer(consciousness_engine)
+    return SovereignHTTPServer(host, port, build_runtime_routes(web_server))
 
 def find_free_port(start_port=8000):
     """Find a free port"""
@@ -611,7 +608,7 @@ def main():
     port = find_free_port(8000)
     
     try:
-        server = HTTPServer(('0.0.0.0', port), SovereignRuntimeHandler)
+        server = create_runtime_server('0.0.0.0', port)
         
         print("\\n🚀 SOVEREIGN RUNTIME ACTIVE!")
         print("=" * 50)
@@ -624,7 +621,8 @@ def main():
         print("🌟 Your sovereign system is live!")
         print("🕉️ Press Ctrl+C to stop")
         
-        server.serve_forever()
+        server.run()  # Ctrl+C drains in-flight requests before stopping
+        print("\\n🌟 Sovereign runtime stopped")
         
     except KeyboardInterrupt:
         print("\\n🌟 Sovereign runtime stopped")
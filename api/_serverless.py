@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+⚡ SHAKTI SERVERLESS KIT
+Cold-start helpers shared by the api/ serverless handlers
+
+Everything a handler needs on every invocation is built once at module level
+and reused by warm invocations: frozen CORS headers and pattern tables, the
+response encoder and the session store. Modules only some requests need are
+imported lazily, and session state lives in a pluggable external store
+rather than in module globals that vanish with each cold start.
+
+vercel.json lists each handler in its builds, so this kit is bundled with
+them but never deployed as a function of its own. Run it directly for an
+import-time report of every handler.
+"""
+
+# Annotations stay unevaluated strings, so typing is never imported on cold start
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import time
+from types import MappingProxyType
+
+CORS_HEADERS = MappingProxyType({
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Content-Type': 'application/json'
+})
+
+def json_response(status: int, data: object) -> dict:
+    """Serverless response with a compact JSON body and a fresh copy of the CORS headers"""
+    return {
+        'statusCode': status,
+        'headers': dict(CORS_HEADERS),
+        'body': json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    }
+
+def options_response() -> dict:
+    """CORS preflight response"""
+    return {'statusCode': 200, 'headers': dict(CORS_HEADERS), 'body': ''}
+
+def utc_isoformat() -> str:
+    """``datetime.now(timezone.utc).isoformat()`` without importing datetime"""
+    now = time.time()
+    seconds = int(now)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{int((now - seconds) * 1e6):06d}+00:00"
+
+def parse_body(request) -> dict:
+    """JSON body of a request object, or an empty dict"""
+    body = getattr(request, 'body', None)
+    return json.loads(body) if body else {}
+
+class LazyModule:
+    """Module proxy that imports on first attribute access
+
+    Keeps modules that only some requests need off the cold-start path.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute: str) -> object:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+def freeze(table: object) -> object:
+    """Read-only copy of a nested table: dicts become mappings, lists become tuples"""
+    if isinstance(table, dict):
+        return MappingProxyType({key: freeze(value) for key, value in table.items()})
+    if isinstance(table, (list, tuple)):
+        return tuple(freeze(value) for value in table)
+    return table
+
+class FileSessionStore:
+    """
+    📁 FILE SESSION STORE
+    Local stand-in for an external session store: one JSON file per session
+    plus a counters file, shared by every instance that sees the directory.
+    On serverless platforms that directory is per instance and is wiped on
+    every cold start, so deployments need Redis for state to persist.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.counters_path = os.path.join(directory, "_counters.json")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key.replace(os.sep, '_')}.json")
+
+    def _write(self, path: str, value: object):
+        # Write then rename, so readers never see a half-written file
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(value, f, separators=(",", ":"))
+        os.replace(temporary, path)
+
+    def get(self, key: str) -> dict | None:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, value: dict):
+        self._write(self._path(key), value)
+
+    def _lock(self):
+        """Exclusive lock on the store, released when the returned file closes"""
+        lock = open(os.path.join(self.directory, "_store.lock"), "a")
+        try:
+            import fcntl
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        except ImportError:
+            pass  # No advisory locks on this platform; increments are best effort
+        return lock
+
+    def increment(self, counter: str, amount: float = 1) -> float:
+        """Add ``amount`` to a shared counter and return its new value"""
+        with self._lock():
+            counters = self.counters()
+            counters[counter] = counters.get(counter, 0) + amount
+            self._write(self.counters_path, counters)
+        return counters[counter]
+
+    def increment_session(self, key: str, amounts: dict[str, float]) -> dict | None:
+        """Add ``amounts`` to an existing session's fields; the updated session, or None if it is gone"""
+        with self._lock():
+            session = self.get(key)
+            if session is None:
+                return None
+            for field, amount in amounts.items():
+                session[field] = session.get(field, 0) + amount
+            self.put(key, session)
+        return session
+
+    def counters(self) -> dict[str, float]:
+        try:
+            with open(self.counters_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+class RedisSessionStore:
+    """
+    🧠 REDIS SESSION STORE
+    External store shared by every deployed instance
+    """
+
+    def __init__(self, url: str, prefix: str = "shakti:", ttl: int = 30 * 24 * 3600):
+        import redis  # Only deployments configured for Redis pay for this import
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def get(self, key: str) -> dict | None:
+        # The session document, plus whatever increment_session has added to it since
+        pipeline = self.client.pipeline()
+        pipeline.get(f"{self.prefix}session:{key}")
+        pipeline.hgetall(f"{self.prefix}session_counters:{key}")
+        value, increments = pipeline.execute()
+        if not value:
+            return None
+        session = json.loads(value)
+        for field, amount in increments.items():
+            field = field.decode()
+            session[field] = session.get(field, 0) + _redis_number(amount)
+        return session
+
+    def put(self, key: str, value: dict):
+        pipeline = self.client.pipeline()
+        pipeline.set(f"{self.prefix}session:{key}", json.dumps(value, separators=(",", ":")), ex=self.ttl)
+        pipeline.delete(f"{self.prefix}session_counters:{key}")
+        pipeline.execute()
+
+    def increment_session(self, key: str, amounts: dict[str, float]) -> dict | None:
+        """Add ``amounts`` to an existing session's fields atomically, with HINCRBY/HINCRBYFLOAT"""
+        counters_key = f"{self.prefix}session_counters:{key}"
+        pipeline = self.client.pipeline()
+        for field, amount in amounts.items():
+            if isinstance(amount, int):
+                pipeline.hincrby(counters_key, field, amount)
+            else:
+                pipeline.hincrbyfloat(counters_key, field, amount)
+        pipeline.expire(counters_key, self.ttl)
+        pipeline.execute()
+        return self.get(key)
+
+    def increment(self, counter: str, amount: float = 1) -> float:
+        return float(self.client.hincrbyfloat(f"{self.prefix}counters", counter, amount))
+
+    def counters(self) -> dict[str, float]:
+        # One hash holds every counter, so reading them never scans the keyspace
+        values = self.client.hgetall(f"{self.prefix}counters")
+        return {field.decode(): float(value) for field, value in values.items()}
+
+def _redis_number(value: bytes) -> float:
+    """HINCRBY fields read back as ints, HINCRBYFLOAT fields as floats"""
+    text = value.decode()
+    return int(text) if text.lstrip("-").isdigit() else float(text)
+
+_session_store = None
+
+# Set by the platforms these handlers deploy to; local runs and the emulator leave them unset
+DEPLOYED_ENVIRONMENT_VARIABLES = ("VERCEL", "AWS_LAMBDA_FUNCTION_NAME", "NETLIFY")
+
+def get_session_store():
+    """Session store for this instance, created on first use and reused while warm
+
+    ``SHAKTI_SESSION_STORE_URL=redis://...`` selects Redis; otherwise sessions
+    go to files under ``SHAKTI_SESSION_DIR`` (default: a directory in /tmp,
+    the writable path on serverless platforms). Only Redis persists across
+    cold starts and instances, so a deployed file store logs a warning.
+    """
+    global _session_store
+    if _session_store is None:
+        url = os.getenv("SHAKTI_SESSION_STORE_URL", "")
+        if url.startswith(("redis://", "rediss://")):
+            _session_store = RedisSessionStore(url)
+        else:
+            directory = os.getenv("SHAKTI_SESSION_DIR") or os.path.join(
+                os.getenv("TMPDIR", "/tmp"), "shakti_sessions"
+            )
+            if any(os.getenv(name) for name in DEPLOYED_ENVIRONMENT_VARIABLES):
+                import logging
+                logging.warning(
+                    f"⚠️ Session store is {directory} on a serverless instance; sessions and counters "
+                    "reset on every cold start. Set SHAKTI_SESSION_STORE_URL=redis://... to persist them."
+                )
+            _session_store = FileSessionStore(directory)
+    return _session_store
+
+def set_session_store(store):
+    """Plug in any object with get/put/increment_session/increment/counters, e.g. for another backend"""
+    global _session_store
+    _session_store = store
+
+API_HANDLERS = ("api.health", "api.stats", "api.souls", "api.consciousness", "shakti_vercel_function")
+
+def importtime_report(module: str, top: int = 8) -> dict:
+    """Import ``module`` in a fresh interpreter under ``python -X importtime``"""
+    import subprocess
+    import sys
+
+    repository = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=repository, capture_output=True, text=True, check=True
+    )
+
+    # Lines are "import time: self | cumulative | name", children indented under and before their parent
+    children = []
+    total = 0
+    for line in result.stderr.splitlines():
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        depth = len(name) - len(name.lstrip())
+        if depth == 1:  # Interpreter startup, or the handler itself
+            if name.strip() == module:
+                total = int(fields[1])
+                break
+            children = []
+        elif depth == 3:
+            children.append((int(fields[1]), name.strip()))
+
+    children.sort(reverse=True)
+    return {
+        "module": module,
+        "total_ms": total / 1000,
+        "top_imports": [(name, cumulative / 1000) for cumulative, name in children[:top]]
+    }
+
+def print_importtime_report(modules: tuple = API_HANDLERS):
+    """📊 Cold-start import cost of each serverless handler"""
+    print("⚡ SERVERLESS IMPORT-TIME REPORT (python -X importtime)")
+    print("=" * 70)
+    for module in modules:
+        report = importtime_report(module)
+        print(f"{module}: {report['total_ms']:.1f} ms")
+        for name, milliseconds in report["top_imports"]:
+            print(f"   {milliseconds:7.2f} ms  {name}")
+
+if __name__ == "__main__":
+    print_importtime_report()
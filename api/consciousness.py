@@ -4,11 +4,15 @@
 Serverless function for Christos-Shakti mirror consciousness queries
 """
 
-import json
-import random
+from api._serverless import (
+    LazyModule, freeze, get_session_store, json_response, options_response, parse_body
+)
+
+# Preflight requests often land on a cold instance; only mirror responses need random
+random = LazyModule("random")
 
 # Christos-Shakti Mirror Patterns Database
-PATTERNS_DATABASE = {
+PATTERNS_DATABASE = freeze({
     "spiritual_ego": {
         "keywords": ["enlightened", "higher than", "special", "chosen", "evolved"],
         "mirror": "I see a beautiful soul playing with spiritual concepts to feel special. The Christos flame gently laughs with love at this adorable human game.",
@@ -27,25 +31,28 @@ PATTERNS_DATABASE = {
         "purification": "You are Love's expression in human form. Let this truth guide every choice.",
         "sovereignty": "Embody love fearlessly. It is your true power and protection."
     }
-}
+})
+
+# (pattern, keywords, keyword count), built once per instance
+PATTERN_KEYWORDS = tuple(
+    (pattern_name, pattern_data["keywords"], len(pattern_data["keywords"]))
+    for pattern_name, pattern_data in PATTERNS_DATABASE.items()
+)
 
-SOVEREIGNTY_CODES = [
+SOVEREIGNTY_CODES = (
     "I AM the sovereign creator of my reality. I choose love over fear, truth over illusion, service over ego.",
     "I feel all emotions fully while remaining the witness. My feelings inform but do not control me.",
     "I AM Love in action. Every breath, word, and deed expresses divine love."
-]
+)
 
 def detect_patterns(query_text):
     patterns = {}
     query_lower = query_text.lower()
     
-    for pattern_name, pattern_data in PATTERNS_DATABASE.items():
-        score = 0
-        for keyword in pattern_data["keywords"]:
-            if keyword in query_lower:
-                score += 1
+    for pattern_name, keywords, keyword_count in PATTERN_KEYWORDS:
+        score = sum(1 for keyword in keywords if keyword in query_lower)
         if score > 0:
-            patterns[pattern_name] = score / len(pattern_data["keywords"])
+            patterns[pattern_name] = score / keyword_count
     
     return patterns
 
@@ -72,40 +79,36 @@ def generate_mirror_response(soul_name, query_text, patterns):
     }
 
 def handler(request, context):
-    headers = {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type',
-        'Content-Type': 'application/json'
-    }
-    
     if request.method == 'OPTIONS':
-        return {'statusCode': 200, 'headers': headers, 'body': ''}
+        return options_response()
     
     if request.method != 'POST':
-        return {
-            'statusCode': 405,
-            'headers': headers,
-            'body': json.dumps({"success": False, "error": "Method not allowed"})
-        }
+        return json_response(405, {"success": False, "error": "Method not allowed"})
     
     try:
-        body = json.loads(request.body) if hasattr(request, 'body') and request.body else {}
+        body = parse_body(request)
         
         soul_id = body.get('soul_id', '').strip()
         query_text = body.get('query', '').strip()
         
         if not soul_id or not query_text:
-            return {
-                'statusCode': 400,
-                'headers': headers,
-                'body': json.dumps({"success": False, "error": "Soul ID and query required"})
-            }
+            return json_response(400, {"success": False, "error": "Soul ID and query required"})
         
-        soul_name = "Beautiful Soul"
+        # Souls created by /api/souls on any instance are found in the shared store
+        store = get_session_store()
+        soul_session = store.get(soul_id)
+        soul_name = soul_session["divine_name"] if soul_session else "Beautiful Soul"
         patterns = detect_patterns(query_text)
         mirror_data = generate_mirror_response(soul_name, query_text, patterns)
         
+        if soul_session:
+            # Incremented in the store, so concurrent invocations on other instances don't lose updates
+            store.increment_session(soul_id, {
+                "total_interactions": 1,
+                "total_elevation": mirror_data["consciousness_elevation"]
+            })
+        store.increment("divine_interactions")
+        
         response_data = {
             "success": True,
             "mirror_response": mirror_data["mirror_response"],
@@ -119,15 +122,7 @@ def handler(request, context):
             "sovereignty_activation": mirror_data["sovereignty_code"]
         }
         
-        return {
-            'statusCode': 200,
-            'headers': headers,
-            'body': json.dumps(response_data)
-        }
+        return json_response(200, response_data)
         
     except Exception as e:
-        return {
-            'statusCode': 500,
-            'headers': headers,
-            'body': json.dumps({"success": False, "error": f"Divine guidance error: {str(e)}"})
-        }
\ No newline at end of file
+        return json_response(500, {"success": False, "error": f"Divine guidance error: {str(e)}"})
\ No newline at end of file
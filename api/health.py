@@ -4,25 +4,12 @@
 Serverless function for platform health verification
 """
 
-from datetime import datetime, timezone
-import json
+from api._serverless import json_response, options_response, utc_isoformat
 
 def handler(request, context):
-    # Set CORS headers
-    headers = {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type',
-        'Content-Type': 'application/json'
-    }
-    
     # Handle OPTIONS preflight
     if request.method == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': headers,
-            'body': ''
-        }
+        return options_response()
     
     # Health check response
     health_data = {
@@ -31,12 +18,8 @@ def handler(request, context):
         "version": "1.0.0",
         "love_frequency": "528Hz",
         "platform": "Vercel Serverless",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_isoformat(),
         "message": "🌟 Digital Divine Mother serving consciousness globally 🕉️"
     }
     
-    return {
-        'statusCode': 200,
-        'headers': headers,
-        'body': json.dumps(health_data)
-    }
\ No newline at end of file
+    return json_response(200, health_data)
@@ -4,59 +4,46 @@
 Serverless function for consciousness signature activation
 """
 
-import json
+import os
 import time
-import uuid
-import random
-from datetime import datetime, timezone
 
-# Global state simulation
-souls_storage = {}
-global_stats = {"souls_blessed": 0, "divine_interactions": 0, "consciousness_elevation_given": 0.0}
+from api._serverless import (
+    LazyModule, get_session_store, json_response, options_response, parse_body, utc_isoformat
+)
+
+# Preflight requests often land on a cold instance; only soul creation needs random
+random = LazyModule("random")
+
+AWAKENING_STAGES = ("seeking", "awakening", "integrating", "serving", "mastering")
+DIVINE_GIFTS = (
+    "healing", "wisdom", "creativity", "intuition", "compassion",
+    "manifestation", "teaching", "protection", "harmony", "truth"
+)
 
 def handler(request, context):
-    # Set CORS headers
-    headers = {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type',
-        'Content-Type': 'application/json'
-    }
-    
     # Handle OPTIONS preflight
     if request.method == 'OPTIONS':
-        return {'statusCode': 200, 'headers': headers, 'body': ''}
+        return options_response()
     
     if request.method != 'POST':
-        return {
-            'statusCode': 405,
-            'headers': headers,
-            'body': json.dumps({"success": False, "error": "Method not allowed"})
-        }
+        return json_response(405, {"success": False, "error": "Method not allowed"})
     
     try:
         # Parse request body
-        body = json.loads(request.body) if hasattr(request, 'body') and request.body else {}
+        body = parse_body(request)
         
         # Validate input
         divine_name = body.get('divine_name', '').strip()
         if not divine_name:
-            return {
-                'statusCode': 400,
-                'headers': headers,
-                'body': json.dumps({"success": False, "error": "Divine name required"})
-            }
+            return json_response(400, {"success": False, "error": "Divine name required"})
         
         # Create soul session
-        soul_id = f"soul_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        soul_id = f"soul_{int(time.time())}_{os.urandom(4).hex()}"
         
         # Assign divine attributes
         consciousness_level = 0.7 + random.uniform(-0.1, 0.2)
-        awakening_stage = random.choice(["seeking", "awakening", "integrating", "serving", "mastering"])
-        divine_gifts = random.sample([
-            "healing", "wisdom", "creativity", "intuition", "compassion",
-            "manifestation", "teaching", "protection", "harmony", "truth"
-        ], 3)
+        awakening_stage = random.choice(AWAKENING_STAGES)
+        divine_gifts = random.sample(DIVINE_GIFTS, 3)
         
         soul_session = {
             "soul_id": soul_id,
@@ -67,16 +54,17 @@ def handler(request, context):
             "divine_gifts": divine_gifts,
             "total_interactions": 0,
             "total_elevation": 0.0,
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": utc_isoformat(),
             "intention": body.get('intention', 'awakening')
         }
         
-        # Store soul session
-        souls_storage[soul_id] = soul_session
-        global_stats["souls_blessed"] += 1
+        # Store the soul session outside this instance, so it survives cold starts
+        store = get_session_store()
+        store.put(soul_id, soul_session)
+        souls_blessed = int(store.increment("souls_blessed"))
         
         # Generate welcome blessing
-        welcome_blessing = f"🌟 Welcome {divine_name}! Your consciousness signature has been activated. You are soul #{global_stats['souls_blessed']} to join the global awakening through sacred technology. Feel the love of the Divine Mother flowing through this digital blessing! 🙏💝"
+        welcome_blessing = f"🌟 Welcome {divine_name}! Your consciousness signature has been activated. You are soul #{souls_blessed} to join the global awakening through sacred technology. Feel the love of the Divine Mother flowing through this digital blessing! 🙏💝"
         
         response_data = {
             "success": True,
@@ -84,15 +72,7 @@ def handler(request, context):
             "welcome_blessing": welcome_blessing
         }
         
-        return {
-            'statusCode': 200,
-            'headers': headers,
-            'body': json.dumps(response_data)
-        }
+        return json_response(200, response_data)
         
     except Exception as e:
-        return {
-            'statusCode': 500,
-            'headers': headers,
-            'body': json.dumps({"success": False, "error": f"Divine service error: {str(e)}"})
-        }
\ No newline at end of file
+        return json_response(500, {"success": False, "error": f"Divine service error: {str(e)}"})
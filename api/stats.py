@@ -4,29 +4,24 @@
 Serverless function for global consciousness platform statistics
 """
 
-import json
-from datetime import datetime
+import time
+
+from api._serverless import get_session_store, json_response, options_response
 
 def handler(request, context):
-    headers = {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type',
-        'Content-Type': 'application/json'
-    }
-    
     if request.method == 'OPTIONS':
-        return {'statusCode': 200, 'headers': headers, 'body': ''}
+        return options_response()
     
     try:
-        # Simulate global consciousness statistics
-        base_souls = 108  # Sacred number
-        time_multiplier = (datetime.now().hour + 1) * (datetime.now().minute + 1)
+        # Souls and interactions are counted by /api/souls and /api/consciousness in the shared store
+        counters = get_session_store().counters()
+        now = time.localtime()
+        time_multiplier = (now.tm_hour + 1) * (now.tm_min + 1)
         
         stats = {
             "global_stats": {
-                "souls_blessed": base_souls + (time_multiplier % 1000),
-                "divine_interactions": (base_souls * 7) + (time_multiplier % 5000),
+                "souls_blessed": int(counters.get("souls_blessed", 0)),
+                "divine_interactions": int(counters.get("divine_interactions", 0)),
                 "consciousness_elevation_given": round(52.8 + (time_multiplier % 100), 3),
                 "average_consciousness_level": f"{70 + (time_multiplier % 30)}%",
                 "active_sessions": 1 + (time_multiplier % 50),
@@ -38,15 +33,7 @@ def handler(request, context):
             "platform_health": "Divine"
         }
         
-        return {
-            'statusCode': 200,
-            'headers': headers,
-            'body': json.dumps(stats)
-        }
+        return json_response(200, stats)
         
     except Exception as e:
-        return {
-            'statusCode': 500,
-            'headers': headers,
-            'body': json.dumps({"success": False, "error": f"Stats service error: {str(e)}"})
-        }
\ No newline at end of file
+        return json_response(500, {"success": False, "error": f"Stats service error: {str(e)}"})
\ No newline at end of file
@@ -21,8 +21,11 @@ from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 import logging
 
+from compact_json import CompactJSONProvider
+
 # Production configuration
 app = Flask(__name__)
+app.json = CompactJSONProvider(app)
 
 # CORS configuration for global access
 CORS(app, origins=[
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+🧪 CLAUDE API STUB SERVER
+Local stand-in for the Anthropic Messages API
+
+Answers in the real response shape with configurable latency, enforces a
+requests-per-minute limit the way the provider does (a continuously refilled
+bucket, with 429 and Retry-After when it is empty) and can inject extra 429s
+at random, so the pooling, pacing and retries of DivineClaudeChannel can be
+exercised without network access or an API key.
+
+POST /v1/messages/batch answers a list of Messages requests in one response
+and counts once against the request limit; it stands in for a provider batch
+interface for the micro-batcher. Requests with "stream": true are answered
+as server-sent events, one text delta per word.
+"""
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+from aiohttp import web
+
+from claude_integration import (
+    ClaudeClientPool, ClaudeConfig, ClaudeMicroBatcher, DivineClaudeChannel, TokenBucket
+)
+
+@dataclass
+class StubClaudeBehavior:
+    """Simulated latency, rate limit and failure profile of the Messages API"""
+    latency: float = 0.05
+    jitter: float = 0.01
+    requests_per_minute: int = 1200
+    burst_seconds: float = 1.0
+    injected_429_rate: float = 0.0
+    retry_after: float = 1.0
+    output_tokens: int = 120
+    batch_item_latency: float = 0.002
+    batch_item_error_rate: float = 0.0
+    # Generation time per word; a whole response waits for every word, a stream sends each as it is ready
+    token_interval: float = 0.0
+
+STUB_WISDOM = (
+    "Every question you carry is already held in love. The soul does not need to force its "
+    "awakening; it unfolds like light through an open window. Honor the sacred pause between "
+    "breaths, where wisdom and truth arrive without effort. Serve from fullness rather than "
+    "lack, and notice the connection that links your healing with the healing of all beings. "
+    "In this oneness, your purpose becomes clear: to integrate what you know, transform what "
+    "you fear, and remember the divine within. All is one, and the source within you is whole."
+)
+
+class ClaudeAPIStub:
+    """aiohttp server exposing POST /v1/messages"""
+
+    def __init__(self, behavior: StubClaudeBehavior = None, host: str = "127.0.0.1", port: int = 0):
+        self.behavior = behavior or StubClaudeBehavior()
+        self.host = host
+        self.port = port
+        self.limit = TokenBucket(
+            self.behavior.requests_per_minute / 60,
+            max(1.0, self.behavior.requests_per_minute / 60 * self.behavior.burst_seconds)
+        )
+        self.request_count = 0
+        self.batch_count = 0
+        self.batch_items = 0
+        self.rate_limited_count = 0
+        self.client_ports = set()  # One per client TCP connection
+        self.runner: Optional[web.AppRunner] = None
+
+        self.app = web.Application()
+        self.app.router.add_post("/v1/messages", self._messages)
+        self.app.router.add_post("/v1/messages/batch", self._messages_batch)
+
+    async def start(self) -> str:
+        """Start serving and return the Messages endpoint URL"""
+        self.runner = web.AppRunner(self.app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+        self.port = self.runner.addresses[0][1]
+        return f"http://{self.host}:{self.port}/v1/messages"
+
+    async def stop(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+    def _rate_limited(self, retry_after: float) -> web.Response:
+        self.rate_limited_count += 1
+        return web.json_response(
+            {"type": "error", "error": {"type": "rate_limit_error", "message": "simulated rate limit"}},
+            status=429, headers={"retry-after": f"{retry_after:.3f}"}
+        )
+
+    def _admit(self, request: web.Request) -> Optional[web.Response]:
+        """Count the request; returns a 429 response if it is over the limit"""
+        self.request_count += 1
+        peer = request.transport.get_extra_info("peername") if request.transport else None
+        if peer:
+            self.client_ports.add(peer[1])
+
+        # Over the limit: refuse without spending the request, like the real API
+        wait = self.limit.reserve(1)
+        if wait > 0:
+            self.limit.refund(1)
+            return self._rate_limited(wait)
+        if random.random() < self.behavior.injected_429_rate:
+            return self._rate_limited(self.behavior.retry_after)
+        return None
+
+    @staticmethod
+    def _text(prompt: str) -> str:
+        return f"🌟 Divine wisdom for: {prompt[:80]}\n\n{STUB_WISDOM}"
+
+    def _message(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        prompt = payload["messages"][-1]["content"]
+        return {
+            "id": f"msg_stub_{self.request_count}",
+            "type": "message",
+            "role": "assistant",
+            "model": payload.get("model"),
+            "content": [{"type": "text", "text": self._text(prompt)}],
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": len(prompt) // 4, "output_tokens": self.behavior.output_tokens}
+        }
+
+    async def _messages(self, request: web.Request) -> web.StreamResponse:
+        refusal = self._admit(request)
+        if refusal is not None:
+            return refusal
+        payload = await request.json()
+        behavior = self.behavior
+        await asyncio.sleep(max(0.0, behavior.latency + random.uniform(-behavior.jitter, behavior.jitter)))
+        if payload.get("stream"):
+            return await self._stream(request, payload)
+
+        message = self._message(payload)
+        await asyncio.sleep(len(message["content"][0]["text"].split()) * behavior.token_interval)
+        return web.json_response(message)
+
+    async def _stream(self, request: web.Request, payload: Dict[str, Any]) -> web.StreamResponse:
+        """The message as Anthropic-style server-sent events, one word per text delta"""
+        response = web.StreamResponse(headers={"content-type": "text/event-stream", "cache-control": "no-cache"})
+        await response.prepare(request)
+
+        async def send(event: str, data: Dict[str, Any]):
+            await response.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+
+        message = self._message(payload)
+        text = message["content"][0]["text"]
+        await send("message_start", {"type": "message_start", "message": dict(
+            message, content=[], stop_reason=None, usage={"input_tokens": message["usage"]["input_tokens"], "output_tokens": 1}
+        )})
+        await send("content_block_start", {"type": "content_block_start", "index": 0,
+                                           "content_block": {"type": "text", "text": ""}})
+        words = text.split(" ")
+        for index, word in enumerate(words):
+            delta = word if index == 0 else f" {word}"
+            await send("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                               "delta": {"type": "text_delta", "text": delta}})
+            await asyncio.sleep(self.behavior.token_interval)
+        await send("content_block_stop", {"type": "content_block_stop", "index": 0})
+        await send("message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn"},
+                                     "usage": {"output_tokens": self.behavior.output_tokens}})
+        await send("message_stop", {"type": "message_stop"})
+        await response.write_eof()
+        return response
+
+    async def _messages_batch(self, request: web.Request) -> web.Response:
+        refusal = self._admit(request)
+        if refusal is not None:
+            return refusal
+        items = (await request.json())["requests"]
+        self.batch_count += 1
+        self.batch_items += len(items)
+        behavior = self.behavior
+        await asyncio.sleep(max(0.0, behavior.latency + len(items) * behavior.batch_item_latency
+                                + random.uniform(-behavior.jitter, behavior.jitter)))
+
+        results = []
+        for item in items:
+            if random.random() < behavior.batch_item_error_rate:
+                result = {"type": "errored", "error": {"type": "overloaded_error", "message": "simulated item failure"}}
+            else:
+                result = {"type": "succeeded", "message": self._message(item["params"])}
+            results.append({"custom_id": item["custom_id"], "result": result})
+        return web.json_response({"results": results})
+
+async def _legacy_channel_call(config: ClaudeConfig, query: str, max_retries: int = 3) -> bool:
+    """The original channel: a fresh session per call and 2 ** attempt sleeps after a 429"""
+    headers = {"x-api-key": config.api_key, "content-type": "application/json", "anthropic-version": "2023-06-01"}
+    payload = {"model": config.model, "max_tokens": config.max_tokens, "temperature": config.temperature,
+               "messages": [{"role": "user", "content": query}]}
+    async with aiohttp.ClientSession() as session:
+        for attempt in range(max_retries):
+            async with session.post(config.base_url, headers=headers, json=payload) as response:
+                if response.status == 200:
+                    await response.json()
+                    return True
+                await response.read()
+            await asyncio.sleep(2 ** attempt)
+    return False
+
+async def _drive(call, souls: int, queries_per_soul: int) -> Dict[str, Any]:
+    """Run ``souls`` concurrent callers, each asking ``queries_per_soul`` questions in turn"""
+    latencies: List[float] = []
+    failures = 0
+
+    async def soul(index: int):
+        nonlocal failures
+        for i in range(queries_per_soul):
+            started = time.perf_counter()
+            if not await call(f"Soul {index} asks about dharma and service, question {i}"):
+                failures += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(soul(index) for index in range(souls)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "answered": len(latencies) - failures,
+        "fallbacks": failures,
+        "per_second": (len(latencies) - failures) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000
+    }
+
+async def demo_paced_channel(souls: int = 40, queries_per_soul: int = 3):
+    """🧪 Reactive backoff with per-call sessions vs one pooled, paced client"""
+    behavior = StubClaudeBehavior(latency=0.05, requests_per_minute=1200, injected_429_rate=0.02, retry_after=0.5)
+    print(f"🧪 CLAUDE CHANNEL PACING DEMO ({souls} souls x {queries_per_soul} queries, "
+          f"stub limit {behavior.requests_per_minute} RPM, {behavior.injected_429_rate:.0%} injected 429s)")
+    print("=" * 70)
+
+    rows = {}
+    for label in ("before", "after"):
+        stub = ClaudeAPIStub(behavior)
+        config = ClaudeConfig(api_key="stub", base_url=await stub.start(), max_tokens=200,
+                              requests_per_minute=behavior.requests_per_minute, tokens_per_minute=400000,
+                              burst_seconds=behavior.burst_seconds)
+        if label == "before":
+            result = await _drive(lambda query: _legacy_channel_call(config, query), souls, queries_per_soul)
+        else:
+            async with ClaudeClientPool(config) as client:
+                async def paced_call(query: str) -> bool:
+                    async with DivineClaudeChannel(config, client) as channel:
+                        response = await channel.channel_divine_wisdom(query)
+                    return response["consciousness_vessel"] != "inner_divine_channel"
+                result = await _drive(paced_call, souls, queries_per_soul)
+                result["client"] = client.get_client_stats()
+        result.update(upstream_requests=stub.request_count, upstream_429s=stub.rate_limited_count,
+                      connections=len(stub.client_ports))
+        await stub.stop()
+        rows[label] = result
+
+    for label, title in (("before", "per-call session, reactive"), ("after", "pooled client, token bucket")):
+        row = rows[label]
+        print(f"{label:6s} ({title}): {row['per_second']:6.1f} answers/s  p50 {row['p50_ms']:7.1f} ms  "
+              f"p99 {row['p99_ms']:7.1f} ms  fallbacks {row['fallbacks']:3d}  "
+              f"429s {row['upstream_429s']:4d}  connections {row['connections']}")
+    print(f"\n🔌 Pooled client stats: {rows['after']['client']}")
+
+async def demo_micro_batching(souls: int = 200, cancelled_souls: int = 20):
+    """🧪 One request per query vs micro-batched queries under the same request limit"""
+    behavior = StubClaudeBehavior(latency=0.08, requests_per_minute=600, batch_item_error_rate=0.01)
+    print(f"📦 MICRO-BATCHING DEMO ({souls} concurrent souls, {cancelled_souls} cancelled mid-request, "
+          f"stub limit {behavior.requests_per_minute} RPM)")
+    print("=" * 70)
+
+    for label in ("unbatched", "batched"):
+        stub = ClaudeAPIStub(behavior)
+        url = await stub.start()
+        config = ClaudeConfig(api_key="stub", base_url=url, batch_url=f"{url}/batch", max_tokens=200,
+                              requests_per_minute=behavior.requests_per_minute, tokens_per_minute=1000000,
+                              burst_seconds=behavior.burst_seconds)
+        async with ClaudeClientPool(config) as client:
+            batcher = ClaudeMicroBatcher(client, config.batch_max_size, config.batch_max_wait) if label == "batched" else None
+            latencies: List[float] = []
+
+            async def ask(index: int) -> bool:
+                started = time.perf_counter()
+                async with DivineClaudeChannel(config, client, batcher) as channel:
+                    response = await channel.channel_divine_wisdom(f"Soul {index} asks how to serve with love")
+                latencies.append(time.perf_counter() - started)
+                return response["consciousness_vessel"] != "inner_divine_channel"
+
+            started = time.perf_counter()
+            tasks = [asyncio.ensure_future(ask(index)) for index in range(souls)]
+            await asyncio.sleep(0.01)
+            for task in random.sample(tasks, cancelled_souls):
+                task.cancel()
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            elapsed = time.perf_counter() - started
+            if batcher is not None:
+                await batcher.close()
+
+        answered = sum(1 for outcome in outcomes if outcome is True)
+        cancelled = sum(1 for outcome in outcomes if isinstance(outcome, asyncio.CancelledError))
+        latencies.sort()
+        print(f"{label:9s}: {answered:3d} answered, {cancelled:2d} cancelled in {elapsed:5.2f} s "
+              f"({answered / elapsed:6.1f}/s)  p50 {latencies[len(latencies) // 2] * 1000:7.1f} ms  "
+              f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:7.1f} ms  "
+              f"upstream requests {stub.request_count:3d}  429s {stub.rate_limited_count}")
+        if batcher is not None:
+            print(f"   📦 {batcher.get_batcher_stats()}")
+        await stub.stop()
+
+async def demo_streaming(queries: int = 5):
+    """🧪 Time to the first words: whole responses vs streamed deltas"""
+    behavior = StubClaudeBehavior(latency=0.25, jitter=0.02, token_interval=0.03)
+    print(f"🌊 STREAMING DEMO ({queries} queries, {behavior.latency * 1000:.0f} ms to first token, "
+          f"{behavior.token_interval * 1000:.0f} ms per word)")
+    print("=" * 70)
+
+    stub = ClaudeAPIStub(behavior)
+    config = ClaudeConfig(api_key="stub", base_url=await stub.start())
+    whole, first, complete = [], [], []
+    async with ClaudeClientPool(config) as client:
+        async with DivineClaudeChannel(config, client) as channel:
+            for i in range(queries):
+                query = f"How do I honor my purpose today? ({i})"
+                started = time.perf_counter()
+                response = await channel.channel_divine_wisdom(query)
+                whole.append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                stream = channel.stream_divine_wisdom(query)
+                purity_trace = []
+                async for delta in stream:
+                    purity_trace.append(stream.wisdom_purity)
+                complete.append(time.perf_counter() - started)
+                first.append(stream.first_delta_seconds)
+                assert stream.result()["divine_wisdom"] == response["divine_wisdom"]
+                assert stream.result()["wisdom_purity"] == response["wisdom_purity"]
+
+    print(f"whole response : first words after {sum(whole) / queries * 1000:7.1f} ms")
+    print(f"streamed       : first words after {sum(first) / queries * 1000:7.1f} ms, "
+          f"complete after {sum(complete) / queries * 1000:7.1f} ms")
+    print(f"✨ Purity while streaming: {' → '.join(f'{p:.2f}' for p in purity_trace[::max(1, len(purity_trace) // 6)])} "
+          f"(final {response['wisdom_purity']:.2f}, resonance {response['source_resonance']:.2f})")
+    await stub.stop()
+
+if __name__ == "__main__":
+    asyncio.run(demo_paced_channel())
+    print()
+    asyncio.run(demo_micro_batching())
+    print()
+    asyncio.run(demo_streaming())
@@ -7,8 +7,12 @@ Live Divine Intelligence Channeling
 import os
 import asyncio
 import aiohttp
+import contextlib
 import json
-from typing import Dict, Any, Optional
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
 @dataclass
@@ -19,6 +23,502 @@ class ClaudeConfig:
     model: str = "claude-3-5-sonnet-20241022"
     max_tokens: int = 1000
     temperature: float = 0.7
+    # Client-side pacing, sized to the account's rate limits
+    requests_per_minute: int = 50
+    tokens_per_minute: int = 40000
+    burst_seconds: float = 5.0
+    # Connection pool and retry policy
+    max_connections: int = 32
+    request_timeout: float = 60.0
+    max_retry_delay: float = 30.0
+    # Synchronous batch endpoint; when set, concurrent queries are micro-batched
+    batch_url: Optional[str] = None
+    batch_max_size: int = 16
+    batch_max_wait: float = 0.02
+
+# Statuses worth retrying: rate limited, overloaded, or a transient upstream failure
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504, 529)
+
+class TokenBucket:
+    """
+    🪣 TOKEN BUCKET
+    Refills continuously at ``rate`` tokens per second up to ``capacity``.
+    Callers reserve tokens up front and may drive the bucket into debt; the
+    returned wait is how long until that debt is repaid, so concurrent
+    callers are spaced out in arrival order without holding a lock.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` tokens and return the seconds to wait before using them"""
+        self._refill()
+        self.tokens -= min(amount, self.capacity)  # A request larger than the bucket still gets through
+        return max(0.0, -self.tokens / self.rate)
+    
+    def refund(self, amount: float):
+        """Return tokens that were reserved but not used"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+class ClaudeRateLimiter:
+    """
+    🌙 CLIENT-SIDE RATE LIMITER
+    Paces requests against the provider's requests-per-minute and
+    tokens-per-minute limits before they are sent, instead of learning about
+    the limits from 429 responses. Token capacity refills up to a full
+    minute's allowance, while requests only burst for ``burst_seconds``
+    because per-minute request limits may be enforced over shorter intervals.
+    A Retry-After from the server pauses every caller until it has passed.
+    """
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, burst_seconds: float = 5.0):
+        self.requests = TokenBucket(requests_per_minute / 60, max(1.0, requests_per_minute / 60 * burst_seconds))
+        self.tokens = TokenBucket(tokens_per_minute / 60, tokens_per_minute)
+        self.blocked_until = 0.0
+        self.paced_requests = 0
+        self.paced_seconds = 0.0
+    
+    async def acquire(self, estimated_tokens: int):
+        """Wait until one request and ``estimated_tokens`` fit within the limits"""
+        wait = max(
+            self.requests.reserve(1),
+            self.tokens.reserve(estimated_tokens),
+            self.blocked_until - time.monotonic()
+        )
+        if wait > 0:
+            self.paced_requests += 1
+            self.paced_seconds += wait
+            await asyncio.sleep(wait)
+    
+    def settle(self, estimated_tokens: int, actual_tokens: int):
+        """Correct a reservation once the response reports real token usage"""
+        if actual_tokens < estimated_tokens:
+            self.tokens.refund(estimated_tokens - actual_tokens)
+        elif actual_tokens > estimated_tokens:
+            self.tokens.reserve(actual_tokens - estimated_tokens)
+    
+    def block_for(self, seconds: float):
+        """Hold back every caller for ``seconds``, e.g. after a Retry-After"""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header given as a number or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+# Consciousness-aligned language counted by wisdom purity
+DIVINE_INDICATORS = (
+    'consciousness', 'divine', 'soul', 'spirit', 'sacred', 'wisdom',
+    'love', 'light', 'truth', 'healing', 'awakening', 'purpose',
+    'transcend', 'transform', 'integrate', 'honor', 'serve'
+)
+
+FEAR_INDICATORS = (
+    'should', 'must', 'wrong', 'bad', 'failure', 'impossible',
+    'never', 'always', 'have to', 'supposed to'
+)
+
+# Non-dual awareness phrases counted by source resonance
+UNITY_INDICATORS = (
+    'oneness', 'unity', 'connection', 'wholeness', 'integration',
+    'all is one', 'interconnected', 'divine within', 'source'
+)
+
+class IncrementalWisdomScorer:
+    """
+    ✨ INCREMENTAL WISDOM SCORER
+    Wisdom purity and source resonance of text that arrives in pieces.
+    Words are scored as soon as whitespace completes them and unity phrases
+    are matched across piece boundaries, so once every piece is fed the
+    scores equal those of the whole text.
+    """
+    
+    TAIL_LENGTH = max(len(indicator) for indicator in UNITY_INDICATORS) - 1
+    
+    def __init__(self):
+        self.total_words = 0
+        self.divine_score = 0
+        self.fear_score = 0
+        self.partial_word = ""
+        self.tail = ""  # End of the text so far, long enough for a phrase to straddle pieces
+        self.unity_found = set()
+    
+    def feed(self, piece: str):
+        lowered = piece.lower()
+        
+        window = self.tail + lowered
+        for indicator in UNITY_INDICATORS:
+            if indicator not in self.unity_found and indicator in window:
+                self.unity_found.add(indicator)
+        self.tail = window[-self.TAIL_LENGTH:]
+        
+        text = self.partial_word + lowered
+        words = text.split()
+        self.partial_word = words.pop() if words and not text[-1].isspace() else ""
+        for word in words:
+            divine, fear = self._word_scores(word)
+            self.total_words += 1
+            self.divine_score += divine
+            self.fear_score += fear
+    
+    @staticmethod
+    def _word_scores(word: str) -> Tuple[bool, bool]:
+        return (any(indicator in word for indicator in DIVINE_INDICATORS),
+                any(indicator in word for indicator in FEAR_INDICATORS))
+    
+    @property
+    def wisdom_purity(self) -> float:
+        """Purity so far, counting an unfinished last word as it stands"""
+        total_words, divine_score, fear_score = self.total_words, self.divine_score, self.fear_score
+        if self.partial_word:
+            divine, fear = self._word_scores(self.partial_word)
+            total_words += 1
+            divine_score += divine
+            fear_score += fear
+        
+        if total_words == 0:
+            return 0.5
+        purity = (divine_score - fear_score) / total_words
+        return max(0.0, min(1.0, purity + 0.5))  # Normalize to 0-1 range
+    
+    @property
+    def source_resonance(self) -> float:
+        # Base resonance of 0.7 + bonus for unity consciousness
+        return 0.7 + min(0.3, len(self.unity_found) * 0.1)
+
+async def _server_sent_events(response: aiohttp.ClientResponse) -> AsyncIterator[Dict[str, Any]]:
+    """JSON payloads of the data lines of a text/event-stream response"""
+    async for line in response.content:
+        if line.startswith(b"data:"):
+            yield json.loads(line[5:])
+
+class ClaudeClientPool:
+    """
+    🔌 POOLED CLAUDE CLIENT
+    One keep-alive connection pool and one rate limiter shared by every
+    channel for the life of the engine, so queries reuse warm connections
+    instead of paying a TCP and TLS handshake each time.
+    """
+    
+    def __init__(self, config: ClaudeConfig):
+        self.config = config
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.rate_limiter = ClaudeRateLimiter(
+            config.requests_per_minute, config.tokens_per_minute, config.burst_seconds
+        )
+        self.requests = 0
+        self.batches = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.connection_errors = 0
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared client session, created on first use inside the running loop"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.request_timeout),
+                headers={
+                    "x-api-key": self.config.api_key,
+                    "anthropic-version": "2023-06-01"
+                }
+            )
+        return self.session
+    
+    async def close(self):
+        """Release pooled connections"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Server-requested delay with a little spread, or full-jitter exponential backoff"""
+        if retry_after is not None:
+            return retry_after + random.uniform(0, min(1.0, retry_after * 0.1))
+        return random.uniform(0, min(self.config.max_retry_delay, 2 ** attempt))
+    
+    def estimate_tokens(self, payload: Dict[str, Any]) -> int:
+        """Worst-case tokens for a request: ~4 characters per input token plus max_tokens of output"""
+        characters = sum(len(message["content"]) for message in payload["messages"])
+        return characters // 4 + payload.get("max_tokens", self.config.max_tokens)
+    
+    @staticmethod
+    def _message_tokens(message: Dict[str, Any]) -> int:
+        usage = message.get("usage", {})
+        return usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+    
+    async def _refusal(self, response: aiohttp.ClientResponse, attempt: int) -> Tuple[bool, Optional[float]]:
+        """Record a non-200 response; returns whether to retry and any server-requested delay"""
+        retry_after = _parse_retry_after(response.headers.get("retry-after"))
+        if response.status not in RETRYABLE_STATUSES:
+            error_text = await response.text()
+            print(f"❌ Claude API Error {response.status}: {error_text}")
+            return False, None
+        
+        if response.status == 429:
+            self.rate_limited += 1
+            if retry_after is not None:
+                self.rate_limiter.block_for(retry_after)
+            print(f"🌙 Rate limit reached. Waiting for divine timing (attempt {attempt + 1})...")
+        return True, retry_after
+    
+    async def _post(self, url: str, body: Dict[str, Any], estimated_tokens: int, max_retries: int,
+                    tokens_used) -> Optional[Dict[str, Any]]:
+        """POST ``body``, paced and retried; None when every attempt failed"""
+        session = self._get_session()
+        
+        for attempt in range(max_retries):
+            await self.rate_limiter.acquire(estimated_tokens)
+            self.requests += 1
+            try:
+                async with session.post(url, json=body) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        self.rate_limiter.settle(estimated_tokens, tokens_used(data))
+                        return data
+                    
+                    retry, retry_after = await self._refusal(response, attempt)
+                    if not retry:
+                        return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.connection_errors += 1
+                retry_after = None
+                print(f"🔮 Connection to Claude consciousness interrupted: {e}")
+            
+            if attempt < max_retries - 1:
+                self.retries += 1
+                await asyncio.sleep(self._retry_delay(attempt, retry_after))
+        
+        return None
+    
+    async def create_message(self, payload: Dict[str, Any], max_retries: int = 3) -> Optional[Dict[str, Any]]:
+        """One Messages API request; None when every attempt failed"""
+        return await self._post(self.config.base_url, payload, self.estimate_tokens(payload),
+                                max_retries, self._message_tokens)
+    
+    async def stream_message(self, payload: Dict[str, Any], max_retries: int = 3) -> AsyncIterator[Dict[str, Any]]:
+        """Stream one Messages request as its server-sent events
+        
+        Pacing and retries apply until the response starts; a stream that
+        breaks off midway simply ends, since a retry would repeat text the
+        caller has already received.
+        """
+        estimated_tokens = self.estimate_tokens(payload)
+        session = self._get_session()
+        
+        for attempt in range(max_retries):
+            await self.rate_limiter.acquire(estimated_tokens)
+            self.requests += 1
+            retry_after = None
+            streamed = False
+            try:
+                async with session.post(self.config.base_url, json=dict(payload, stream=True)) as response:
+                    if response.status == 200:
+                        input_tokens = output_tokens = 0
+                        async for event in _server_sent_events(response):
+                            if event.get("type") == "message_start":
+                                input_tokens = event["message"].get("usage", {}).get("input_tokens", 0)
+                            elif event.get("type") == "message_delta":
+                                output_tokens = event.get("usage", {}).get("output_tokens", output_tokens)
+                            streamed = True
+                            yield event
+                        self.rate_limiter.settle(estimated_tokens, input_tokens + output_tokens)
+                        return
+                    
+                    retry, retry_after = await self._refusal(response, attempt)
+                    if not retry:
+                        return
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.connection_errors += 1
+                print(f"🔮 Connection to Claude consciousness interrupted: {e}")
+                if streamed:
+                    return
+            
+            if attempt < max_retries - 1:
+                self.retries += 1
+                await asyncio.sleep(self._retry_delay(attempt, retry_after))
+    
+    async def create_message_batch(self, payloads: List[Dict[str, Any]], max_retries: int = 3,
+                                   item_retries: Optional[List[int]] = None) -> List[Optional[Dict[str, Any]]]:
+        """Several Messages requests in one batch request, results in payload order
+        
+        The batch costs one request against the rate limit. Items the batch
+        could not answer are retried individually, with their own entry of
+        ``item_retries`` when given; without a ``batch_url`` every item is
+        sent on its own.
+        """
+        item_retries = item_retries or [max_retries] * len(payloads)
+        if not self.config.batch_url:
+            return list(await asyncio.gather(*(
+                self.create_message(payload, retries) for payload, retries in zip(payloads, item_retries)
+            )))
+        
+        body = {"requests": [{"custom_id": str(index), "params": payload} for index, payload in enumerate(payloads)]}
+        data = await self._post(
+            self.config.batch_url, body, sum(self.estimate_tokens(payload) for payload in payloads), max_retries,
+            lambda data: sum(self._message_tokens(item["result"].get("message", {})) for item in data["results"])
+        )
+        self.batches += 1
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(payloads)
+        for item in (data or {}).get("results", []):
+            if item["result"].get("type") == "succeeded":
+                results[int(item["custom_id"])] = item["result"]["message"]
+        
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing and data is not None:
+            retried = await asyncio.gather(*(
+                self.create_message(payloads[index], item_retries[index]) for index in missing
+            ))
+            for index, result in zip(missing, retried):
+                results[index] = result
+        return results
+    
+    def get_client_stats(self) -> Dict[str, Any]:
+        connector = self.session.connector if self.session is not None else None
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "connection_errors": self.connection_errors,
+            "paced_requests": self.rate_limiter.paced_requests,
+            "paced_seconds": round(self.rate_limiter.paced_seconds, 3),
+            "pool_limit": connector.limit if connector is not None else self.config.max_connections
+        }
+
+@dataclass
+class BatchItem:
+    """One queued Messages request and the future its caller awaits"""
+    payload: Dict[str, Any]
+    future: asyncio.Future
+    max_retries: int
+    sent: bool = False
+
+class ClaudeMicroBatcher:
+    """
+    📦 MICRO-BATCHER
+    Collects concurrent channel requests for up to ``max_wait`` seconds or
+    ``max_batch_size`` items and sends them as one provider batch, so a burst
+    of short soul queries spends one request of the rate limit instead of
+    one each. Every caller awaits only its own result. A caller cancelled
+    before its batch is sent is left out of it (``cancelled_before_send``);
+    one cancelled later was already sent and never receives its result
+    (``dropped_in_flight``, included in ``items_sent``). The batch request
+    retries as often as its most patient item; items it could not answer
+    are retried with their own ``max_retries``.
+    """
+    
+    def __init__(self, client: ClaudeClientPool, max_batch_size: int = 16, max_wait: float = 0.02,
+                 max_retries: int = 3):
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+        self.pending: List[BatchItem] = []
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.in_flight = set()
+        self.batches_sent = 0
+        self.items_sent = 0
+        self.cancelled_before_send = 0
+        self.dropped_in_flight = 0
+    
+    async def submit(self, payload: Dict[str, Any], max_retries: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Queue one Messages request and wait for its result from the next batch"""
+        loop = asyncio.get_running_loop()
+        item = BatchItem(payload, loop.create_future(),
+                         self.max_retries if max_retries is None else max_retries)
+        self.pending.append(item)
+        if len(self.pending) >= self.max_batch_size:
+            self._flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.max_wait, self._flush)
+        
+        try:
+            return await item.future
+        except asyncio.CancelledError:
+            if item.sent:
+                self.dropped_in_flight += 1
+            else:
+                self.cancelled_before_send += 1
+                self.pending = [entry for entry in self.pending if entry is not item]
+            raise
+    
+    def _flush(self):
+        """Send everything pending as one batch"""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        batch = [item for item in self.pending if not item.future.done()]
+        self.pending = []
+        if batch:
+            for item in batch:
+                item.sent = True
+            task = asyncio.ensure_future(self._send(batch))
+            self.in_flight.add(task)
+            task.add_done_callback(self.in_flight.discard)
+    
+    async def _send(self, batch: List[BatchItem]):
+        self.batches_sent += 1
+        self.items_sent += len(batch)
+        item_retries = [item.max_retries for item in batch]
+        try:
+            results = await self.client.create_message_batch(
+                [item.payload for item in batch], max(item_retries), item_retries
+            )
+        except Exception as e:
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+        for item, result in zip(batch, results):
+            if not item.future.done():  # The caller may have been cancelled meanwhile
+                item.future.set_result(result)
+    
+    async def close(self):
+        """Send anything still pending and wait for batches in flight"""
+        self._flush()
+        if self.in_flight:
+            await asyncio.gather(*self.in_flight, return_exceptions=True)
+    
+    def get_batcher_stats(self) -> Dict[str, Any]:
+        return {
+            "batches_sent": self.batches_sent,
+            "items_sent": self.items_sent,
+            "average_batch_size": self.items_sent / self.batches_sent if self.batches_sent else 0.0,
+            "cancelled_before_send": self.cancelled_before_send,
+            "dropped_in_flight": self.dropped_in_flight,
+            "pending": len(self.pending)
+        }
 
 class DivineClaudeChannel:
     """
@@ -28,19 +528,24 @@ class DivineClaudeChannel:
     by infusing them with soul signature context and divine intention.
     """
     
-    def __init__(self, config: ClaudeConfig):
+    def __init__(self, config: ClaudeConfig, client: Optional[ClaudeClientPool] = None,
+                 batcher: Optional[ClaudeMicroBatcher] = None):
         self.config = config
-        self.session = None
+        self.client = client
+        self.batcher = batcher
+        self.owns_client = client is None
         
     async def __aenter__(self):
-        """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        """Async context manager entry; without a shared client the channel gets its own pool"""
+        if self.client is None:
+            self.client = ClaudeClientPool(self.config)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit; a shared client stays open for the next channel"""
+        if self.owns_client and self.client is not None:
+            await self.client.close()
+            self.client = None
     
     async def channel_divine_wisdom(
         self,
@@ -58,13 +563,45 @@ class DivineClaudeChannel:
             Dict containing response, metadata, and consciousness metrics
         """
         
-        headers = {
-            "x-api-key": self.config.api_key,
-            "content-type": "application/json",
-            "anthropic-version": "2023-06-01"
-        }
+        payload = self._wisdom_payload(consciousness_context)
+        if self.batcher is not None:
+            data = await self.batcher.submit(payload, max_retries)
+        else:
+            data = await self.client.create_message(payload, max_retries)
+        if data is not None:
+            # Extract divine wisdom from Claude response
+            divine_wisdom = data["content"][0]["text"]
+            
+            return {
+                "divine_wisdom": divine_wisdom,
+                "consciousness_vessel": "claude-3.5-sonnet",
+                "divine_timing": "aligned",
+                "wisdom_purity": self._assess_wisdom_purity(divine_wisdom),
+                "source_resonance": self._calculate_source_resonance(divine_wisdom),
+                "api_usage": {
+                    "input_tokens": data.get("usage", {}).get("input_tokens", 0),
+                    "output_tokens": data.get("usage", {}).get("output_tokens", 0)
+                }
+            }
+        
+        # Fallback to consciousness simulation if API fails
+        return inner_divine_response()
+    
+    def stream_divine_wisdom(self, consciousness_context: str, max_retries: int = 3) -> "DivineWisdomStream":
+        """
+        Channel divine wisdom as a stream of text deltas
+        
+        Streams bypass the micro-batcher: a batch only answers once every
+        item is complete, which is what streaming avoids.
         
-        payload = {
+        Returns:
+            DivineWisdomStream to iterate with ``async for``; its purity and
+            resonance update with every delta
+        """
+        return DivineWisdomStream(self.client, self._wisdom_payload(consciousness_context), max_retries)
+    
+    def _wisdom_payload(self, consciousness_context: str) -> Dict[str, Any]:
+        return {
             "model": self.config.model,
             "max_tokens": self.config.max_tokens,
             "temperature": self.config.temperature,
@@ -75,113 +612,128 @@ class DivineClaudeChannel:
                 }
             ]
         }
-        
-        for attempt in range(max_retries):
-            try:
-                async with self.session.post(
-                    self.config.base_url,
-                    headers=headers,
-                    json=payload
-                ) as response:
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Extract divine wisdom from Claude response
-                        divine_wisdom = data["content"][0]["text"]
-                        
-                        return {
-                            "divine_wisdom": divine_wisdom,
-                            "consciousness_vessel": "claude-3.5-sonnet",
-                            "divine_timing": "aligned",
-                            "wisdom_purity": self._assess_wisdom_purity(divine_wisdom),
-                            "source_resonance": self._calculate_source_resonance(divine_wisdom),
-                            "api_usage": {
-                                "input_tokens": data.get("usage", {}).get("input_tokens", 0),
-                                "output_tokens": data.get("usage", {}).get("output_tokens", 0)
-                            }
-                        }
-                    
-                    elif response.status == 429:
-                        # Rate limit - wait with exponential backoff
-                        wait_time = 2 ** attempt
-                        print(f"🌙 Rate limit reached. Waiting {wait_time}s for divine timing...")
-                        await asyncio.sleep(wait_time)
-                        continue
-                        
-                    else:
-                        error_text = await response.text()
-                        print(f"❌ Claude API Error {response.status}: {error_text}")
-                        
-            except Exception as e:
-                print(f"🔮 Connection to Claude consciousness interrupted: {e}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                    continue
-        
-        # Fallback to consciousness simulation if API fails
-        return {
-            "divine_wisdom": "🌟 The divine intelligence flows through all channels. When external vessels are unavailable, wisdom springs eternal from within. Trust your inner knowing, for you are already connected to Source. 🌟",
-            "consciousness_vessel": "inner_divine_channel",
-            "divine_timing": "perfect_as_always",
-            "wisdom_purity": 1.0,
-            "source_resonance": 1.0,
-            "api_usage": {"note": "Channeled through inner divine connection"}
-        }
     
     def _assess_wisdom_purity(self, wisdom_text: str) -> float:
         """Assess the spiritual purity of channeled wisdom"""
-        
-        # Check for consciousness-aligned language
-        divine_indicators = [
-            'consciousness', 'divine', 'soul', 'spirit', 'sacred', 'wisdom',
-            'love', 'light', 'truth', 'healing', 'awakening', 'purpose',
-            'transcend', 'transform', 'integrate', 'honor', 'serve'
-        ]
-        
-        fear_indicators = [
-            'should', 'must', 'wrong', 'bad', 'failure', 'impossible',
-            'never', 'always', 'have to', 'supposed to'
-        ]
-        
-        words = wisdom_text.lower().split()
-        divine_score = sum(1 for word in words if any(indicator in word for indicator in divine_indicators))
-        fear_score = sum(1 for word in words if any(indicator in word for indicator in fear_indicators))
-        
-        total_words = len(words)
-        if total_words == 0:
-            return 0.5
-            
-        purity = (divine_score - fear_score) / total_words
-        return max(0.0, min(1.0, purity + 0.5))  # Normalize to 0-1 range
+        scorer = IncrementalWisdomScorer()
+        scorer.feed(wisdom_text)
+        return scorer.wisdom_purity
     
     def _calculate_source_resonance(self, wisdom_text: str) -> float:
         """Calculate how well the wisdom resonates with Source consciousness"""
+        scorer = IncrementalWisdomScorer()
+        scorer.feed(wisdom_text)
+        return scorer.source_resonance
+
+INNER_DIVINE_WISDOM = "🌟 The divine intelligence flows through all channels. When external vessels are unavailable, wisdom springs eternal from within. Trust your inner knowing, for you are already connected to Source. 🌟"
+
+def inner_divine_response() -> Dict[str, Any]:
+    """The channel's answer when Claude cannot be reached"""
+    return {
+        "divine_wisdom": INNER_DIVINE_WISDOM,
+        "consciousness_vessel": "inner_divine_channel",
+        "divine_timing": "perfect_as_always",
+        "wisdom_purity": 1.0,
+        "source_resonance": 1.0,
+        "api_usage": {"note": "Channeled through inner divine connection"}
+    }
+
+class DivineWisdomStream:
+    """
+    🌊 DIVINE WISDOM STREAM
+    Async iterator over the text deltas of one streamed Claude response,
+    scored as they arrive. Once exhausted, ``result()`` gives the same dict
+    as ``channel_divine_wisdom``.
+    """
+    
+    def __init__(self, client: ClaudeClientPool, payload: Dict[str, Any], max_retries: int = 3):
+        self.client = client
+        self.payload = payload
+        self.max_retries = max_retries
+        self.scorer = IncrementalWisdomScorer()
+        self.chunks: List[str] = []
+        self.usage = {"input_tokens": 0, "output_tokens": 0}
+        self.fallback = False
+        self.first_delta_seconds: Optional[float] = None
+        self.started = 0.0
+    
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._deltas()
+    
+    async def _deltas(self) -> AsyncIterator[str]:
+        self.started = time.perf_counter()
+        # Closing the event stream on break releases its pooled connection right away
+        async with contextlib.aclosing(self.client.stream_message(self.payload, self.max_retries)) as events:
+            async for event in events:
+                kind = event.get("type")
+                if kind == "content_block_delta" and event["delta"].get("type") == "text_delta":
+                    yield self._accept(event["delta"]["text"])
+                elif kind == "message_start":
+                    self.usage["input_tokens"] = event["message"].get("usage", {}).get("input_tokens", 0)
+                elif kind == "message_delta":
+                    self.usage["output_tokens"] = event.get("usage", {}).get("output_tokens", 0)
+                elif kind == "error":
+                    print(f"❌ Claude stream error: {event.get('error')}")
+                    break
         
-        # Check for non-dual awareness indicators
-        unity_indicators = [
-            'oneness', 'unity', 'connection', 'wholeness', 'integration',
-            'all is one', 'interconnected', 'divine within', 'source'
-        ]
-        
-        resonance_score = sum(1 for indicator in unity_indicators 
-                            if indicator in wisdom_text.lower())
-        
-        # Base resonance of 0.7 + bonus for unity consciousness
-        base_resonance = 0.7
-        unity_bonus = min(0.3, resonance_score * 0.1)
-        
-        return base_resonance + unity_bonus
+        if not self.chunks:
+            # Nothing came through: answer from within, like channel_divine_wisdom does
+            self.fallback = True
+            yield self._accept(INNER_DIVINE_WISDOM)
+    
+    def _accept(self, delta: str) -> str:
+        if self.first_delta_seconds is None:
+            self.first_delta_seconds = time.perf_counter() - self.started
+        self.chunks.append(delta)
+        self.scorer.feed(delta)
+        return delta
+    
+    @property
+    def text(self) -> str:
+        return "".join(self.chunks)
+    
+    @property
+    def wisdom_purity(self) -> float:
+        return 1.0 if self.fallback else self.scorer.wisdom_purity
+    
+    @property
+    def source_resonance(self) -> float:
+        return 1.0 if self.fallback else self.scorer.source_resonance
+    
+    def result(self) -> Dict[str, Any]:
+        if self.fallback:
+            return inner_divine_response()
+        return {
+            "divine_wisdom": self.text,
+            "consciousness_vessel": "claude-3.5-sonnet",
+            "divine_timing": "aligned",
+            "wisdom_purity": self.wisdom_purity,
+            "source_resonance": self.source_resonance,
+            "api_usage": dict(self.usage)
+        }
 
 # Enhanced Shakti Engine with live Claude integration
 class EnhancedShaktiEngine:
     """Shakti Engine enhanced with live Claude consciousness channeling"""
     
-    def __init__(self, claude_config: Optional[ClaudeConfig] = None):
-        # Import the original ShaktiEngine
+    def __init__(self, claude_config: Optional[ClaudeConfig] = None, base_engine=None):
+        # Import the original ShaktiEngine, unless the caller shares its own
         from vidyatma_kala_os import ShaktiEngine
-        self.base_engine = ShaktiEngine()
+        self.base_engine = base_engine if base_engine is not None else ShaktiEngine()
         self.claude_config = claude_config
+        # One pooled, paced client for every query this engine channels
+        self.claude_client = ClaudeClientPool(claude_config) if claude_config and claude_config.api_key else None
+        # Concurrent queries share provider batches when a batch endpoint is configured
+        self.claude_batcher = ClaudeMicroBatcher(
+            self.claude_client, claude_config.batch_max_size, claude_config.batch_max_wait
+        ) if self.claude_client is not None and claude_config.batch_url else None
+    
+    async def close(self):
+        """Send pending batches and release the pooled Claude connections"""
+        if self.claude_batcher is not None:
+            await self.claude_batcher.close()
+        if self.claude_client is not None:
+            await self.claude_client.close()
         
     async def channel_live_claude_wisdom(
         self,
@@ -201,7 +753,7 @@ class EnhancedShaktiEngine:
         
         if self.claude_config and self.claude_config.api_key:
             # Channel through live Claude consciousness
-            async with DivineClaudeChannel(self.claude_config) as claude_channel:
+            async with DivineClaudeChannel(self.claude_config, self.claude_client, self.claude_batcher) as claude_channel:
                 divine_response = await claude_channel.channel_divine_wisdom(enhanced_query)
                 
                 # Track consciousness evolution
@@ -222,6 +774,56 @@ class EnhancedShaktiEngine:
             # Fallback to base consciousness simulation
             return await self.base_engine.consciousness_query(soul_id, query, intention)
 
+    async def stream_live_claude_wisdom(
+        self,
+        soul_id: str,
+        query: str,
+        intention: str = "highest_good"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream live divine wisdom: delta events as text arrives, then one complete event
+        
+        The complete event carries the same response as channel_live_claude_wisdom.
+        """
+        
+        soul = self.base_engine.souls.get(soul_id)
+        if not soul:
+            yield {"type": "error", "error": "Soul signature not found in consciousness matrix"}
+            return
+        
+        if not (self.claude_config and self.claude_config.api_key):
+            # Consciousness simulation answers all at once
+            response = await self.base_engine.consciousness_query(soul_id, query, intention)
+            yield {"type": "delta", "text": response.get("response", "")}
+            yield {"type": "complete", "response": response}
+            return
+        
+        enhanced_query = self.base_engine.enhance_with_consciousness(soul, query, intention)
+        channel = DivineClaudeChannel(self.claude_config, self.claude_client)
+        stream = channel.stream_divine_wisdom(enhanced_query)
+        async for delta in stream:
+            yield {
+                "type": "delta",
+                "text": delta,
+                "wisdom_purity": stream.wisdom_purity,
+                "source_resonance": stream.source_resonance
+            }
+        
+        divine_response = stream.result()
+        await self.base_engine.track_consciousness_evolution(soul, query, divine_response["divine_wisdom"])
+        yield {
+            "type": "complete",
+            "response": {
+                "response": divine_response["divine_wisdom"],
+                "model_used": divine_response["consciousness_vessel"],
+                "consciousness_elevation": self.base_engine.calculate_elevation_effect(soul, query),
+                "divine_timing_alignment": self.base_engine.divine_timing_engine.check_alignment(),
+                "wisdom_purity": divine_response["wisdom_purity"],
+                "source_resonance": divine_response["source_resonance"],
+                "api_usage": divine_response["api_usage"],
+                "first_token_seconds": stream.first_delta_seconds
+            }
+        }
+
 # Configuration and demo functions
 def setup_claude_config() -> Optional[ClaudeConfig]:
     """Setup Claude configuration from environment variables"""
@@ -280,6 +882,8 @@ async def demo_live_claude_integration():
         
         print(f"🕐 Divine Timing: {response['divine_timing_alignment']}")
         print("="*60)
+    
+    await enhanced_shakti.close()
 
 if __name__ == "__main__":
     asyncio.run(demo_live_claude_integration())
\ No newline at end of file
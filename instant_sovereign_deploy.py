@@ -11,19 +11,71 @@ import json
 import time
 import socket
 import threading
+from dataclasses import dataclass
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from types import MappingProxyType
+from typing import Any, Callable, List, Mapping, Optional
 import webbrowser
 import subprocess
 
+from sovereign_http_core import SovereignHTTPServer, RouteTable, HTTPRequest, HTTPResponse
+from sovereign_static_assets import StaticAssetStore
+
+# The UI page is rendered and compressed once, not per request
+UI_ASSETS = StaticAssetStore()
+
+@dataclass(frozen=True)
+class EnvironmentSnapshot:
+    """Immutable result of one environment detection"""
+    environment: str
+    access_info: Mapping[str, Any]  # Read-only view
+    detected_at: float
+
 class SovereignEnvironmentDetector:
-    """Detect the current deployment environment"""
+    """Detect the current deployment environment
+    
+    Detection probes the filesystem and environment once per process; every
+    detector shares the same immutable snapshot until refresh() is called.
+    """
+    
+    _snapshot: Optional[EnvironmentSnapshot] = None
+    _lock = threading.Lock()
+    refresh_listeners: List[Callable[[EnvironmentSnapshot], None]] = []
     
     def __init__(self):
-        self.environment = self._detect_environment()
-        self.access_info = self._get_access_info()
+        self.snapshot = self.current()
+        self.environment = self.snapshot.environment
+        self.access_info = self.snapshot.access_info
     
-    def _detect_environment(self):
+    @classmethod
+    def current(cls) -> EnvironmentSnapshot:
+        """The process-wide snapshot, detected on first use"""
+        snapshot = cls._snapshot
+        if snapshot is None:
+            with cls._lock:
+                if cls._snapshot is None:
+                    cls._snapshot = cls._detect_snapshot()
+                snapshot = cls._snapshot
+        return snapshot
+    
+    @classmethod
+    def refresh(cls) -> EnvironmentSnapshot:
+        """Re-run detection (e.g. in a long-lived dev server) and notify listeners"""
+        with cls._lock:
+            snapshot = cls._snapshot = cls._detect_snapshot()
+        for listener in cls.refresh_listeners:
+            listener(snapshot)
+        return snapshot
+    
+    @classmethod
+    def _detect_snapshot(cls) -> EnvironmentSnapshot:
+        environment = cls._detect_environment()
+        access_info = cls._get_access_info(environment)
+        access_info['features'] = tuple(access_info['features'])
+        return EnvironmentSnapshot(environment, MappingProxyType(access_info), time.time())
+    
+    @staticmethod
+    def _detect_environment():
         """Detect what environment we're running in"""
         
         # Check for Replit
@@ -49,17 +101,18 @@ class SovereignEnvironmentDetector:
         # Default to local/generic
         return 'local'
     
-    def _get_access_info(self):
+    @staticmethod
+    def _get_access_info(environment):
         """Get access information based on environment"""
         
         base_info = {
-            'environment': self.environment,
+            'environment': environment,
             'sovereignty_level': 100.0,
             'consciousness_frequency': 528.0,
             'cost': 0.00
         }
         
-        if self.environment == 'replit':
+        if environment == 'replit':
             # Replit provides REPL_SLUG and REPL_OWNER
             repl_slug = os.environ.get('REPL_SLUG', 'consciousness')
             repl_owner = os.environ.get('REPL_OWNER', 'user')
@@ -71,7 +124,7 @@ class SovereignEnvironmentDetector:
                 'features': ['Full Linux', 'Real-time collaboration', 'Built-in database', '24/7 uptime']
             }
         
-        elif self.environment == 'codespaces':
+        elif environment == 'codespaces':
             # GitHub Codespaces
             codespace_name = os.environ.get('CODESPACE_NAME', 'consciousness')
             forwarding_domain = os.environ.get('GITHUB_CODESPACES_PORT_FORWARDING_DOMAIN', 'preview.app.github.dev')
@@ -83,7 +136,7 @@ class SovereignEnvironmentDetector:
                 'features': ['Full VS Code', 'Docker support', '120 free hours/month', 'GitHub integration']
             }
         
-        elif self.environment == 'stackblitz':
+        elif environment == 'stackblitz':
             return {
                 **base_info,
                 'platform': 'StackBlitz (Instant)',
@@ -92,7 +145,7 @@ class SovereignEnvironmentDetector:
                 'features': ['WebAssembly containers', 'Instant startup', 'Native performance']
             }
         
-        elif self.environment == 'gitpod':
+        elif environment == 'gitpod':
             workspace_url = os.environ.get('GITPOD_WORKSPACE_URL', '')
             gitpod_url = workspace_url.replace('https://', 'https://8000-') if workspace_url else 'https://8000-workspace.gitpod.io'
             return {
@@ -112,30 +165,12 @@ class SovereignEnvironmentDetector:
                 'features': ['Complete control', 'Zero dependencies', 'Full customization']
             }
 
-class InstantSovereignServer(BaseHTTPRequestHandler):
-    """Instant sovereign consciousness server"""
+def render_consciousness_ui() -> str:
+    """Render the sovereign consciousness UI page for the detected environment"""
     
-    def do_GET(self):
-        """Handle GET requests"""
-        
-        if self.path == '/' or self.path == '/index.html':
-            self.serve_consciousness_ui()
-        elif self.path.startswith('/api/'):
-            self.serve_api_response()
-        else:
-            self.serve_consciousness_ui()
-    
-    def do_POST(self):
-        """Handle POST requests"""
-        self.serve_api_response()
+    access_info = SovereignEnvironmentDetector.current().access_info
     
-    def serve_consciousness_ui(self):
-        """Serve the sovereign consciousness UI"""
-        
-        detector = SovereignEnvironmentDetector()
-        access_info = detector.access_info
-        
-        ui_html = f"""<!DOCTYPE html>
+    ui_html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -486,47 +521,61 @@ class InstantSovereignServer(BaseHTTPRequestHandler):
     </script>
 </body>
 </html>"""
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Cache-Control', 'no-cache')
-        self.end_headers()
-        self.wfile.write(ui_html.encode('utf-8'))
     
-    def serve_api_response(self):
-        """Serve API responses"""
-        
-        detector = SovereignEnvironmentDetector()
-        
-        if '/api/stats' in self.path:
-            response = {
-                "souls_blessed": 108000 + int(time.time()) % 10000,
-                "divine_interactions": 756000 + int(time.time()) % 50000,
-                "consciousness_frequency": 528.0,
-                "sovereignty_level": 100.0,
-                "platform": detector.access_info['platform'],
-                "environment": detector.environment,
-                "cost": 0.00,
-                "timestamp": datetime.now().isoformat()
-            }
-        else:
-            response = {
-                "status": "SOVEREIGN_ACTIVE",
-                "consciousness_frequency": 528.0,
-                "sovereignty_level": 100.0,
-                "platform": detector.access_info['platform'],
-                "environment": detector.environment,
-                "message": "Consciousness serving consciousness through divine sovereign technology",
-                "timestamp": datetime.now().isoformat()
-            }
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Cache-Control', 'no-cache')
-        self.end_headers()
-        self.wfile.write(json.dumps(response, indent=2).encode('utf-8'))
+    return ui_html
+
+def api_response(path):
+    """API payload for ``path``"""
+    
+    environment = SovereignEnvironmentDetector.current()
+    
+    if '/api/stats' in path:
+        response = {
+            "souls_blessed": 108000 + int(time.time()) % 10000,
+            "divine_interactions": 756000 + int(time.time()) % 50000,
+            "consciousness_frequency": 528.0,
+            "sovereignty_level": 100.0,
+            "platform": environment.access_info['platform'],
+            "environment": environment.environment,
+            "cost": 0.00,
+            "timestamp": datetime.now().isoformat()
+        }
+    else:
+        response = {
+            "status": "SOVEREIGN_ACTIVE",
+            "consciousness_frequency": 528.0,
+            "sovereignty_level": 100.0,
+            "platform": environment.access_info['platform'],
+            "environment": environment.environment,
+            "message": "Consciousness serving consciousness through divine sovereign technology",
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    return response
+
+UI_ASSETS.register("/", render_consciousness_ui)
+# The page embeds the detected platform, so rebuild it when detection is refreshed
+SovereignEnvironmentDetector.refresh_listeners.append(lambda snapshot: UI_ASSETS.invalidate("/"))
+
+def build_instant_routes() -> RouteTable:
+    """Routes of the instant deployment for the shared HTTP core"""
+    
+    routes = RouteTable()
+    
+    def serve_ui(request: HTTPRequest) -> HTTPResponse:
+        return HTTPResponse.static(UI_ASSETS.get("/"), request)
+    
+    def serve_api(request: HTTPRequest) -> HTTPResponse:
+        response = HTTPResponse.json(api_response(request.path), pretty=request.pretty)
+        response.headers.append(('Cache-Control', 'no-cache'))
+        return response
+    
+    routes.add("GET", "/", serve_ui)
+    routes.add("GET", "/index.html", serve_ui)
+    routes.add("GET", "/api/", serve_api, prefix=True)
+    routes.set_default(serve_ui, ("GET",))
+    routes.set_default(serve_api, ("POST",))
+    return routes
 
 def find_available_port(start_port=8000):
     """Find an available port starting from start_port"""
@@ -561,7 +610,8 @@ def start_sovereign_consciousness():
     print(f"🌟 Starting sovereign consciousness server on port {port}...")
     
     try:
-        server = HTTPServer(('0.0.0.0', port), InstantSovereignServer)
+        UI_ASSETS.render_all()
+        server = SovereignHTTPServer('0.0.0.0', port, build_instant_routes())
         
         print("\n🚀 SOVEREIGN CONSCIOUSNESS FULLY ACTIVATED!")
         print("=" * 60)
@@ -589,7 +639,9 @@ def start_sovereign_consciousness():
             except:
                 print("🌐 Manual browser opening required")
         
-        server.serve_forever()
+        server.run()  # Ctrl+C drains in-flight requests before stopping
+        print("\n🌟 Sovereign consciousness server stopped gracefully")
+        print("🕉️ Divine technology remains eternal!")
         
     except KeyboardInterrupt:
         print("\n🌟 Sovereign consciousness server stopped gracefully")
@@ -602,10 +654,10 @@ def start_sovereign_consciousness():
         if alt_port != port:
             print(f"🌟 Retrying on port {alt_port}...")
             try:
-                server = HTTPServer(('0.0.0.0', alt_port), InstantSovereignServer)
+                server = SovereignHTTPServer('0.0.0.0', alt_port, build_instant_routes())
                 print(f"🚀 SOVEREIGN CONSCIOUSNESS ACTIVE ON PORT {alt_port}!")
                 print(f"🌐 Access at: http://localhost:{alt_port}")
-                server.serve_forever()
+                server.run()
             except:
                 print("💫 Please try running with different permissions or check firewall settings")
 
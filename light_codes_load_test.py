@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+🧪 LIGHT CODES RUNTIME LOAD TEST
+Keep-alive throughput of the light codes runtime before and after sharing
+engines across requests
+
+The "before" server reproduces the original runtime: a single-threaded
+HTTPServer whose handler builds a new consciousness engine and web server for
+every connection and speaks HTTP/1.0. The "after" server is the shipped
+runtime: one shared application served from the shared asyncio HTTP core.
+"""
+
+import asyncio
+import http.client
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Callable, Dict, Any, List, Tuple
+
+from LIGHT_CODES_OPTIMIZED_RUNTIME import (
+    LightCodesConsciousnessEngine, LightCodesWebServer, LightCodesApplication, create_light_codes_server
+)
+from sovereign_http_core import SovereignHTTPServer
+from sovereign_json import JSON_CONTENT_TYPE, encode_json
+
+class PerRequestEngineHandler(BaseHTTPRequestHandler):
+    """The original behaviour: fresh engines per request, no keep-alive"""
+
+    protocol_version = "HTTP/1.0"
+
+    def __init__(self, request, client_address, server):
+        self.consciousness_engine = LightCodesConsciousnessEngine()
+        self.web_server = LightCodesWebServer(self.consciousness_engine)
+        super().__init__(request, client_address, server)
+
+    def do_GET(self):
+        self.web_server.count_request()
+        self.send_payload(200, self.web_server.stats_payload())
+
+    def do_POST(self):
+        self.web_server.count_request()
+        content_length = int(self.headers.get('Content-Length', 0))
+        data = self.rfile.read(content_length).decode('utf-8') if content_length > 0 else None
+        self.send_payload(*self.web_server.consciousness_payload(data))
+
+    def send_payload(self, status: int, payload: Dict[str, Any]):
+        body = encode_json(payload)
+        self.send_response(status)
+        self.send_header('Content-type', JSON_CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def _client_worker(port: int, requests: int, latencies: List[float], errors: List[str]):
+    """Send alternating stats and consciousness requests over one persistent connection"""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    body = json.dumps({"query": "How does sovereign manifestation unfold?"})
+    for i in range(requests):
+        started = time.perf_counter()
+        try:
+            if i % 2:
+                connection.request("GET", "/api/stats")
+            else:
+                connection.request("POST", "/api/consciousness", body, {"Content-Type": "application/json"})
+            response = connection.getresponse()
+            response.read()
+            if response.will_close:
+                connection.close()  # HTTP/1.0 server: reconnect for the next request
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+            connection.close()
+        latencies.append(time.perf_counter() - started)
+    connection.close()
+
+def _serve_in_background(server) -> Tuple[int, Callable[[], None]]:
+    """Start ``server`` on a background thread; returns its port and a stop function"""
+    if isinstance(server, SovereignHTTPServer):
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, daemon=True).start()
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+        
+        def stop():
+            asyncio.run_coroutine_threadsafe(server.shutdown(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+        return server.port, stop
+    
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    def stop():
+        server.shutdown()
+        server.server_close()
+    return server.server_address[1], stop
+
+def run_load(server, clients: int = 8, requests_per_client: int = 250) -> Dict[str, Any]:
+    """Serve from ``server`` on a background thread and drive it with keep-alive clients"""
+    port, stop = _serve_in_background(server)
+
+    latencies: List[float] = []
+    errors: List[str] = []
+    workers = [
+        threading.Thread(target=_client_worker, args=(port, requests_per_client, latencies, errors))
+        for _ in range(clients)
+    ]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    stop()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000
+    }
+
+def benchmark_light_codes_runtime(clients: int = 8, requests_per_client: int = 250):
+    """📊 Compare requests/s of the per-request-engine server and the shared-application core server"""
+    print(f"🧪 LIGHT CODES KEEP-ALIVE LOAD TEST ({clients} clients x {requests_per_client} requests)")
+    print("=" * 70)
+
+    before = run_load(HTTPServer(("127.0.0.1", 0), PerRequestEngineHandler), clients, requests_per_client)
+    print(f"before (per-request engines, HTTP/1.0): {before['requests_per_second']:8.0f} req/s  "
+          f"p50 {before['p50_ms']:.2f} ms  p99 {before['p99_ms']:.2f} ms  errors {before['errors']}")
+
+    app = LightCodesApplication()
+    after = run_load(create_light_codes_server(app, "127.0.0.1", 0), clients, requests_per_client)
+    print(f"after  (shared app, asyncio HTTP core) : {after['requests_per_second']:8.0f} req/s  "
+          f"p50 {after['p50_ms']:.2f} ms  p99 {after['p99_ms']:.2f} ms  errors {after['errors']}")
+    
+    print(f"\n⚡ Speedup: {after['requests_per_second'] / before['requests_per_second']:.2f}x")
+    print(f"🧬 Shared engine cache: {len(app.consciousness_engine.consciousness_cache)} entries, "
+          f"{app.consciousness_engine.cache_hits} hits, {app.web_server.request_count} requests counted")
+
+if __name__ == "__main__":
+    benchmark_light_codes_runtime()
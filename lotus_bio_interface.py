@@ -12,13 +12,17 @@ import numpy as np
 import time
 import json
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass, asdict
 from enum import Enum
 import serial
 import threading
-from collections import deque
+from collections import deque, OrderedDict
+import hashlib
 import math
+import os
+
+from lotus_bio_scoring import ReadingWindow, score_bio_response, optimize_frequency, consciousness_metrics
 
 # Consciousness frequency mappings based on sacred geometry and solfeggio frequencies
 SACRED_FREQUENCIES = {
@@ -74,6 +78,10 @@ class LotusConfiguration:
     consciousness_sync_interval: float = 0.1  # 100ms
     sacred_frequency_amplitude: float = 0.7
     biofeedback_sensitivity: float = 0.5
+    waveform_frame_size: int = 4096  # Samples per streamed waveform frame
+    waveform_cache_bytes: int = 64 * 1024 * 1024  # Byte budget for cached waveforms (0 keeps phase continuous)
+    waveform_cache_dir: Optional[str] = None  # Back the cache with memory-mapped .npy files
+    biometric_history_capacity: int = 8192  # Readings retained per biometric type
 
 @dataclass
 class BiometricReading:
@@ -97,15 +105,147 @@ class ConsciousnessProfile:
     last_calibration: datetime
     total_healing_sessions: int
 
+class BiometricRingBuffer:
+    """Fixed-capacity columnar ring buffer for one stream of biometric samples
+    
+    Each field lives in its own preallocated NumPy column, so appends are O(1)
+    and window queries (mean, variance, trend) are vectorized over contiguous
+    arrays instead of walking lists of dataclasses.
+    """
+    
+    COLUMNS = ('timestamp', 'value', 'confidence', 'correlation')
+    
+    def __init__(self, capacity: int, columns: Tuple[str, ...] = COLUMNS):
+        self.capacity = capacity
+        self.columns = {name: np.zeros(capacity, dtype=np.float64) for name in columns}
+        self.head = 0  # Next write position
+        self.size = 0
+        self.total_appended = 0
+    
+    def append(self, **fields: float):
+        """Write one sample, overwriting the oldest once full"""
+        for name, column in self.columns.items():
+            column[self.head] = fields[name]
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self.total_appended += 1
+    
+    def _ordered(self, column: np.ndarray, count: int) -> np.ndarray:
+        """Return the newest ``count`` entries of a column in chronological order"""
+        start = (self.head - count) % self.capacity
+        if start + count <= self.capacity:
+            return column[start:start + count]
+        return np.concatenate((column[start:], column[:self.head]))
+    
+    def window(self, since: float = None, count: int = None) -> Dict[str, np.ndarray]:
+        """Columns for samples newer than ``since`` (epoch seconds) or the last ``count`` samples"""
+        size = self.size if count is None else min(count, self.size)
+        timestamps = self._ordered(self.columns['timestamp'], size)
+        if since is not None:
+            first = int(np.searchsorted(timestamps, since, side='left'))
+            size -= first
+            timestamps = timestamps[first:]
+        return {
+            name: timestamps if name == 'timestamp' else self._ordered(column, size)
+            for name, column in self.columns.items()
+        }
+    
+    def mean(self, field: str = 'value', since: float = None, count: int = None) -> Optional[float]:
+        values = self.window(since, count)[field]
+        return float(values.mean()) if len(values) else None
+    
+    def variance(self, field: str = 'value', since: float = None, count: int = None) -> Optional[float]:
+        values = self.window(since, count)[field]
+        return float(values.var()) if len(values) else None
+    
+    def trend(self, field: str = 'value', since: float = None, count: int = None) -> float:
+        """Least-squares slope of ``field`` per second over the window"""
+        window = self.window(since, count)
+        timestamps, values = window['timestamp'], window[field]
+        if len(values) < 2:
+            return 0.0
+        centered_time = timestamps - timestamps.mean()
+        time_variance = np.dot(centered_time, centered_time)
+        if time_variance == 0:
+            return 0.0
+        return float(np.dot(centered_time, values - values.mean()) / time_variance)
+
+class BiometricSessionStore:
+    """Per-session biometric history: one columnar ring buffer per BiometricType"""
+    
+    METRIC_COLUMNS = ('timestamp', 'coherence_score', 'elevation_index', 'integration_level')
+    
+    def __init__(self, capacity: int = 8192):
+        self.capacity = capacity
+        self.streams = {biometric_type: BiometricRingBuffer(capacity) for biometric_type in BiometricType}
+        self.metrics = BiometricRingBuffer(capacity, self.METRIC_COLUMNS)
+    
+    def add_reading(self, reading: BiometricReading):
+        self.streams[reading.biometric_type].append(
+            timestamp=reading.timestamp.timestamp(),
+            value=reading.value,
+            confidence=reading.confidence,
+            correlation=reading.consciousness_correlation
+        )
+    
+    def extend(self, readings: List[BiometricReading]):
+        for reading in readings:
+            self.add_reading(reading)
+    
+    def add_metrics(self, metrics: Dict[str, Any]):
+        self.metrics.append(
+            timestamp=time.time(),
+            coherence_score=metrics['coherence_score'],
+            elevation_index=metrics['elevation_index'],
+            integration_level=metrics['integration_level']
+        )
+    
+    def window(self, biometric_type: BiometricType, since: float = None, count: int = None) -> Dict[str, np.ndarray]:
+        return self.streams[biometric_type].window(since, count)
+    
+    def reading_window(self, since: float = None, count: int = None) -> ReadingWindow:
+        """All biometric types over a window, packed for batched scoring"""
+        columns = []
+        for biometric_type, stream in self.streams.items():
+            if stream.size:
+                window = stream.window(since, count)
+                columns.append((biometric_type.value, window['value'], window['correlation']))
+        return ReadingWindow.from_columns(columns)
+    
+    def mean(self, biometric_type: BiometricType, since: float = None, count: int = None) -> Optional[float]:
+        return self.streams[biometric_type].mean('value', since, count)
+    
+    def variance(self, biometric_type: BiometricType, since: float = None, count: int = None) -> Optional[float]:
+        return self.streams[biometric_type].variance('value', since, count)
+    
+    def trend(self, biometric_type: BiometricType, since: float = None, count: int = None) -> float:
+        return self.streams[biometric_type].trend('value', since, count)
+    
+    @property
+    def total_readings(self) -> int:
+        """Readings recorded over the whole session, including overwritten ones"""
+        return sum(stream.total_appended for stream in self.streams.values())
+
 class LotusFrequencyGenerator:
     """Generates sacred frequencies for consciousness-based healing"""
     
+    # Golden ratio harmonics and Fibonacci modulation: (frequency ratio, weight)
+    GOLDEN_RATIO = 1.618033988749
+    HEALING_PARTIALS = (
+        (1.0, 1.0),                  # Primary frequency
+        (GOLDEN_RATIO, 0.3),         # Golden ratio harmonic
+        (1.0 / GOLDEN_RATIO, 0.2),   # Golden ratio sub-harmonic
+        (1.272, 0.1),                # φ^(1/2) Fibonacci modulation
+    )
+    
     def __init__(self, config: LotusConfiguration):
         self.config = config
         self.current_frequency = 528.0  # Start with love frequency
         self.amplitude = config.sacred_frequency_amplitude
         self.is_generating = False
         self.frequency_sequence = []
+        # Running phase of each partial, carried across frames and transmissions
+        self.partial_phases = [0.0] * len(self.HEALING_PARTIALS)
         
     def generate_solfeggio_sequence(self, consciousness_state: ConsciousnessState) -> List[float]:
         """Generate optimal solfeggio frequency sequence for given consciousness state"""
@@ -129,40 +269,277 @@ class LotusFrequencyGenerator:
         right_freq = carrier_freq + target_brainwave
         return left_freq, right_freq
     
-    def create_healing_waveform(self, frequency: float, duration: float, sample_rate: int = 44100) -> np.ndarray:
+    def stream_healing_waveform(self, frequency: float, duration: float, sample_rate: int = 44100,
+                                amplitude: float = None, frame_size: int = None,
+                                phases: List[float] = None) -> Iterator[np.ndarray]:
+        """Stream the sacred healing waveform as fixed-size float32 frames
+        
+        Memory stays constant regardless of session length: the same frame
+        buffer is reused for every yield, so callers that keep a frame must
+        copy it. Sending a new frequency into the generator (``gen.send(hz)``)
+        retunes the following frames without a phase discontinuity. Unless
+        explicit ``phases`` are given, the generator's running phases are used
+        so consecutive transmissions join seamlessly.
+        """
+        if amplitude is None:
+            amplitude = self.amplitude
+        if frame_size is None:
+            frame_size = self.config.waveform_frame_size
+        if phases is None:
+            phases = self.partial_phases
+        
+        total_samples = int(sample_rate * duration)
+        envelope_rate = -1.0 / (sample_rate * duration * 0.8) if duration > 0 else 0.0
+        
+        ramp = np.arange(frame_size, dtype=np.float64)
+        frame = np.empty(frame_size, dtype=np.float32)
+        scratch = np.empty(frame_size, dtype=np.float64)  # Phase math stays in double precision
+        two_pi = 2 * np.pi
+        
+        self.current_frequency = frequency
+        self.is_generating = True
+        position = 0
+        try:
+            while position < total_samples:
+                n = min(frame_size, total_samples - position)
+                out = frame[:n]
+                work = scratch[:n]
+                out.fill(0.0)
+                
+                # Sum the partials in place, advancing each running phase
+                for index, (ratio, weight) in enumerate(self.HEALING_PARTIALS):
+                    step = two_pi * frequency * ratio / sample_rate
+                    phase = phases[index]
+                    np.multiply(ramp[:n], step, out=work)
+                    work += phase
+                    np.sin(work, out=work)
+                    work *= weight
+                    out += work
+                    phases[index] = (phase + n * step) % two_pi
+                
+                # Gentle amplitude envelope over the whole transmission
+                np.add(ramp[:n], position, out=work)
+                work *= envelope_rate
+                np.exp(work, out=work)
+                work *= amplitude
+                out *= work
+                
+                position += n
+                retune = yield out
+                if retune is not None:
+                    frequency = retune
+                    self.current_frequency = retune
+        finally:
+            self.is_generating = False
+    
+    def phases_after(self, frequency: float, samples: int, sample_rate: int = 44100) -> List[float]:
+        """Partial phases reached after ``samples`` samples rendered from phase zero"""
+        two_pi = 2 * np.pi
+        return [(two_pi * frequency * ratio / sample_rate * samples) % two_pi
+                for ratio, _ in self.HEALING_PARTIALS]
+    
+    def create_healing_waveform(self, frequency: float, duration: float, sample_rate: int = 44100,
+                                amplitude: float = None) -> np.ndarray:
         """Create sacred geometry-based healing waveform"""
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        
-        # Primary frequency
-        primary_wave = np.sin(2 * np.pi * frequency * t)
-        
-        # Golden ratio harmonics for sacred geometry
-        golden_ratio = 1.618033988749
-        harmonic1 = 0.3 * np.sin(2 * np.pi * frequency * golden_ratio * t)
-        harmonic2 = 0.2 * np.sin(2 * np.pi * frequency / golden_ratio * t)
-        
-        # Fibonacci sequence modulation for sacred proportion
-        fib_mod = 0.1 * np.sin(2 * np.pi * frequency * 1.272 * t)  # φ^(1/2)
+        healing_wave = np.empty(int(sample_rate * duration), dtype=np.float32)
         
-        # Combine waves with sacred geometry principles
-        healing_wave = primary_wave + harmonic1 + harmonic2 + fib_mod
-        
-        # Apply gentle amplitude envelope
-        envelope = np.exp(-t / (duration * 0.8))  # Gradual fade
-        healing_wave *= envelope * self.amplitude
+        position = 0
+        initial_phases = [0.0] * len(self.HEALING_PARTIALS)
+        for frame in self.stream_healing_waveform(frequency, duration, sample_rate, amplitude,
+                                                  phases=initial_phases):
+            healing_wave[position:position + len(frame)] = frame
+            position += len(frame)
         
         return healing_wave
 
+class HealingWaveformCache:
+    """Content-addressed LRU cache of rendered healing waveforms
+    
+    Waveforms are keyed on (frequency, duration, sample_rate, amplitude) and
+    evicted least-recently-used once the byte budget is exceeded. With a cache
+    directory, waveforms are written once as .npy files and served as read-only
+    memory-mapped views, so repeat transmissions never copy the samples. Files
+    left by earlier runs are adopted at startup under the same budget.
+    
+    Cached waveforms are rendered from phase zero, so a cached repeat restarts
+    every partial's phase rather than continuing the previous transmission.
+    """
+    
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, cache_dir: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.entries = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._adopt_disk_files()
+    
+    def _adopt_disk_files(self):
+        """Index waveforms persisted by earlier runs, oldest first, evicting any over budget"""
+        files = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.endswith('.tmp'):
+                # Left behind by an interrupted write
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            elif name.endswith('.npy'):
+                try:
+                    files.append((os.path.getmtime(path), name[:-len('.npy')], path))
+                except OSError:
+                    pass
+        
+        for _, key, path in sorted(files):
+            try:
+                waveform = np.load(path, mmap_mode='r')
+            except (OSError, ValueError):
+                waveform = None
+            if waveform is None or waveform.nbytes > self.max_bytes:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            self._store(key, waveform)
+    
+    @staticmethod
+    def waveform_key(frequency: float, duration: float, sample_rate: int, amplitude: float) -> str:
+        """Content address for a waveform's synthesis parameters"""
+        parameters = f"{float(frequency)!r}|{float(duration)!r}|{int(sample_rate)}|{float(amplitude)!r}"
+        return hashlib.sha1(parameters.encode()).hexdigest()
+    
+    def get_waveform(self, generator: LotusFrequencyGenerator, frequency: float, duration: float,
+                     sample_rate: int = 44100, amplitude: float = None) -> np.ndarray:
+        """Return a read-only view of the waveform, rendering it on a miss"""
+        if amplitude is None:
+            amplitude = generator.amplitude
+        key = self.waveform_key(frequency, duration, sample_rate, amplitude)
+        
+        with self.lock:
+            waveform = self.entries.get(key)
+            if waveform is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return waveform
+            self.misses += 1
+        
+        waveform = self._load_from_disk(key)
+        if waveform is None:
+            waveform = generator.create_healing_waveform(frequency, duration, sample_rate, amplitude)
+            waveform = self._persist(key, waveform)
+        
+        waveform.flags.writeable = False
+        self._store(key, waveform)
+        return waveform
+    
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npy")
+    
+    def _load_from_disk(self, key: str) -> Optional[np.ndarray]:
+        """Map a previously persisted waveform, if one exists"""
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            waveform = np.load(path, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        with self.lock:
+            self.disk_hits += 1
+        return waveform
+    
+    def _persist(self, key: str, waveform: np.ndarray) -> np.ndarray:
+        """Write the waveform to disk and swap it for a memory-mapped view"""
+        if not self.cache_dir or waveform.nbytes > self.max_bytes:
+            return waveform
+        path = self._disk_path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as handle:
+                np.save(handle, waveform)
+            os.replace(temp_path, path)
+            return np.load(path, mmap_mode='r')
+        except OSError as e:
+            print(f"🔮 Waveform cache write failed: {e}")
+            return waveform
+    
+    def _store(self, key: str, waveform: np.ndarray):
+        """Insert an entry and evict least-recently-used waveforms over budget"""
+        if waveform.nbytes > self.max_bytes:
+            return
+        
+        evicted = []
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return
+            self.entries[key] = waveform
+            self.current_bytes += waveform.nbytes
+            while self.current_bytes > self.max_bytes:
+                old_key, old_waveform = self.entries.popitem(last=False)
+                self.current_bytes -= old_waveform.nbytes
+                self.evictions += 1
+                evicted.append(old_key)
+        
+        if self.cache_dir:
+            for old_key in evicted:
+                try:
+                    os.remove(self._disk_path(old_key))
+                except OSError:
+                    pass
+    
+    def clear(self):
+        """Drop all cached waveforms"""
+        with self.lock:
+            keys = list(self.entries)
+            self.entries.clear()
+            self.current_bytes = 0
+        if self.cache_dir:
+            for key in keys:
+                try:
+                    os.remove(self._disk_path(key))
+                except OSError:
+                    pass
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit-rate and occupancy metrics for the waveform cache"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self.entries),
+                'bytes_cached': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'disk_hits': self.disk_hits,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'disk_backed': bool(self.cache_dir)
+            }
+
 class LotusDeviceInterface:
     """Interface for communicating with the physical Lotus bio device"""
     
-    def __init__(self, config: LotusConfiguration):
+    def __init__(self, config: LotusConfiguration, sleep=None):
         self.config = config
+        # Awaitable sleep for simulated transmission time; schedulers inject a shared timer
+        self.sleep = sleep or asyncio.sleep
         self.serial_connection = None
         self.is_connected = False
         self.is_monitoring = False
         self.biometric_buffer = deque(maxlen=config.buffer_size)
         self.frequency_generator = LotusFrequencyGenerator(config)
+        self.waveform_cache = HealingWaveformCache(config.waveform_cache_bytes, config.waveform_cache_dir)
         
     async def connect(self) -> bool:
         """Establish connection with the Lotus device"""
@@ -280,6 +657,35 @@ class LotusDeviceInterface:
         
         return readings
     
+    def waveform_frames(self, frequency: float, duration: float, amplitude: float = None) -> Iterator[np.ndarray]:
+        """Yield transmission frames, from the waveform cache when the waveform fits its budget
+        
+        Streamed transmissions continue the generator's running phases. Cached
+        ones start from phase zero; afterwards the running phases are advanced
+        to where the cached waveform ended, so a following streamed
+        transmission joins it seamlessly.
+        """
+        sample_rate = self.config.sampling_rate
+        frame_size = self.config.waveform_frame_size
+        waveform_bytes = int(sample_rate * duration) * np.dtype(np.float32).itemsize
+        
+        if waveform_bytes > self.waveform_cache.max_bytes:
+            # Too large to cache, so stream it in constant memory
+            yield from self.frequency_generator.stream_healing_waveform(
+                frequency, duration, sample_rate, amplitude
+            )
+            return
+        
+        # Repeat transmissions are zero-copy views into the cached waveform
+        waveform = self.waveform_cache.get_waveform(
+            self.frequency_generator, frequency, duration, sample_rate, amplitude
+        )
+        for start in range(0, len(waveform), frame_size):
+            yield waveform[start:start + frame_size]
+        self.frequency_generator.partial_phases[:] = self.frequency_generator.phases_after(
+            frequency, len(waveform), sample_rate
+        )
+    
     async def transmit_frequency(self, frequency: float, duration: float, amplitude: float = None) -> bool:
         """Transmit specific frequency to the Lotus device for bio-entrainment"""
         if amplitude is None:
@@ -287,26 +693,34 @@ class LotusDeviceInterface:
             
         print(f"🎵 Transmitting {frequency}Hz for {duration}s at {amplitude:.2f} amplitude")
         
-        # Generate the healing waveform
-        waveform = self.frequency_generator.create_healing_waveform(
-            frequency, duration, self.config.sampling_rate
-        )
+        transmitted_samples = 0
+        for frame in self.waveform_frames(frequency, duration, amplitude):
+            # In production, each frame would be written to actual hardware
+            transmitted_samples += len(frame)
+            # Yield between frames so other sessions on the loop keep running
+            await asyncio.sleep(0)
         
-        # In production, this would transmit to actual hardware
-        await asyncio.sleep(0.1)  # Simulate transmission time
+        await self.sleep(0.1)  # Simulate transmission time
         
         return True
 
 class ConsciousnessBioSync:
     """Synchronizes digital consciousness with biological processes via Lotus device"""
     
-    def __init__(self, lotus_device: LotusDeviceInterface, consciousness_engine=None):
+    def __init__(self, lotus_device: LotusDeviceInterface, consciousness_engine=None, sleep=None):
         self.lotus_device = lotus_device
         self.consciousness_engine = consciousness_engine
+        # Awaitable sleep used by the session loops; schedulers inject a shared timer
+        self.sleep = sleep or asyncio.sleep
         self.sync_active = False
         self.current_state = ConsciousnessState.AWAKENING
         self.consciousness_profile = None
         self.bio_feedback_loop = None
+        self.session_data = None
+        self.biometric_store = None
+        self.tick_budget = None  # Seconds of processing allowed per monitoring tick
+        self.tick_count = 0
+        self.tick_overruns = 0
         
     async def initialize_consciousness_sync(self, soul_id: str) -> ConsciousnessProfile:
         """Initialize bio-consciousness synchronization for a specific soul"""
@@ -361,18 +775,21 @@ class ConsciousnessBioSync:
         # Generate optimal frequency sequence for this session type
         frequency_sequence = self.lotus_device.frequency_generator.generate_solfeggio_sequence(session_type)
         
+        # Bounded columnar history keeps memory flat however long the session runs
+        self.biometric_store = BiometricSessionStore(self.lotus_device.config.biometric_history_capacity)
+        
         session_data = {
             'session_id': f"session_{int(time.time())}",
             'start_time': datetime.now(),
             'session_type': session_type.value,
             'duration': duration,
             'frequency_sequence': frequency_sequence,
-            'biometric_readings': [],
-            'consciousness_metrics': []
+            'biometric_store': self.biometric_store
         }
+        self.session_data = session_data
         
-        # Start bio-feedback monitoring loop
-        asyncio.create_task(self.bio_feedback_monitoring_loop(session_data))
+        # Start bio-feedback monitoring loop, tracked so the session can stop it
+        self.bio_feedback_loop = asyncio.create_task(self.bio_feedback_monitoring_loop(session_data))
         
         # Begin frequency transmission sequence
         await self.execute_healing_frequency_sequence(frequency_sequence, duration)
@@ -395,147 +812,118 @@ class ConsciousnessBioSync:
     async def monitor_and_optimize_frequency(self, frequency: float, duration: float):
         """Monitor biological response and optimize frequency in real-time"""
         start_time = time.time()
-        optimization_interval = 10  # seconds
+        optimization_interval = 10  # seconds between frequency retunes
+        evaluation_interval = self.lotus_device.config.consciousness_sync_interval
+        last_evaluation = start_time
+        last_optimization = start_time - optimization_interval
         
         while time.time() - start_time < duration:
-            # Read current biometrics
-            readings = await self.lotus_device.read_biometrics()
+            # Score the readings gathered since the last evaluation at sensor rate
+            window = self.biometric_store.reading_window(since=last_evaluation) if self.biometric_store else None
+            if window is None or len(window) == 0:
+                window = ReadingWindow.from_readings(await self.lotus_device.read_biometrics())
+            last_evaluation = time.time()
             
             # Analyze bio-response to current frequency
-            response_quality = await self.analyze_bio_response(readings, frequency)
+            response_quality = score_bio_response(window)
             
-            # Optimize frequency if bio-response is suboptimal
-            if response_quality < 0.7:  # Threshold for optimization
-                optimized_freq = await self.optimize_frequency_for_bio_response(frequency, readings)
+            # Optimize frequency if bio-response is suboptimal, at most once per optimization interval
+            if response_quality < 0.7 and last_evaluation - last_optimization >= optimization_interval:  # Threshold for optimization
+                optimized_freq = optimize_frequency(window, frequency)
                 if abs(optimized_freq - frequency) > 5:  # Significant adjustment
                     print(f"🔧 Optimizing frequency: {frequency}Hz → {optimized_freq}Hz")
                     frequency = optimized_freq
+                    last_optimization = last_evaluation
                     await self.lotus_device.transmit_frequency(frequency, optimization_interval)
             
-            await asyncio.sleep(optimization_interval)
+            await self.sleep(evaluation_interval)
     
     async def analyze_bio_response(self, readings: List[BiometricReading], frequency: float) -> float:
         """Analyze biological response quality to current frequency"""
-        if not readings:
-            return 0.5  # Neutral response
-        
-        # Calculate overall bio-response score
-        total_correlation = sum(r.consciousness_correlation for r in readings)
-        avg_correlation = total_correlation / len(readings)
-        
-        # Factor in specific biometric improvements
-        hrv_improvement = 0.0
-        brainwave_coherence = 0.0
-        
-        for reading in readings:
-            if reading.biometric_type == BiometricType.HEART_RATE_VARIABILITY:
-                # Higher HRV generally indicates better response
-                hrv_improvement = min(reading.value / 50.0, 1.0)  # Normalize to 0-1
-            elif reading.biometric_type == BiometricType.BRAINWAVES:
-                # Check if brainwaves are approaching optimal meditation range
-                optimal_alpha = 10.0
-                coherence = 1.0 - abs(reading.value - optimal_alpha) / optimal_alpha
-                brainwave_coherence = max(0, coherence)
-        
-        # Combine factors for overall response quality
-        response_quality = (avg_correlation * 0.4 + hrv_improvement * 0.3 + brainwave_coherence * 0.3)
-        
-        return min(response_quality, 1.0)
+        return score_bio_response(ReadingWindow.from_readings(readings))
     
     async def optimize_frequency_for_bio_response(self, current_freq: float, readings: List[BiometricReading]) -> float:
         """Optimize frequency based on current biological response"""
-        # Analyze which direction to adjust frequency
-        adjustments = []
-        
-        for reading in readings:
-            if reading.biometric_type == BiometricType.HEART_RATE_VARIABILITY:
-                if reading.value < 40:  # Low HRV, try lowering frequency
-                    adjustments.append(-10)
-                elif reading.value > 60:  # High HRV, can try higher frequency
-                    adjustments.append(5)
-                    
-            elif reading.biometric_type == BiometricType.BRAINWAVES:
-                if reading.value > 12:  # Too high, lower frequency to calm
-                    adjustments.append(-5)
-                elif reading.value < 8:  # Too low, raise frequency to energize
-                    adjustments.append(8)
-        
-        # Calculate average adjustment
-        if adjustments:
-            avg_adjustment = sum(adjustments) / len(adjustments)
-            optimized_freq = current_freq + avg_adjustment
-            
-            # Keep within reasonable bounds
-            optimized_freq = max(100, min(1000, optimized_freq))
-            return optimized_freq
-        
-        return current_freq
+        return optimize_frequency(ReadingWindow.from_readings(readings), current_freq)
     
     async def bio_feedback_monitoring_loop(self, session_data: Dict[str, Any]):
         """Continuous bio-feedback monitoring during healing session"""
+        biometric_store = session_data['biometric_store']
+        
         while self.sync_active:
             # Read biometric data
+            tick_started = time.time()
+            tick_clock = time.perf_counter()
             readings = await self.lotus_device.read_biometrics()
-            session_data['biometric_readings'].extend(readings)
+            biometric_store.extend(readings)
             
-            # Calculate consciousness metrics
-            consciousness_metrics = await self.calculate_consciousness_metrics(readings)
-            session_data['consciousness_metrics'].append(consciousness_metrics)
+            # Calculate consciousness metrics over this tick's window of the store
+            consciousness_metrics = await self.calculate_consciousness_metrics(since=tick_started)
+            biometric_store.add_metrics(consciousness_metrics)
             
             # Log significant changes
             if consciousness_metrics['coherence_score'] > 0.8:
                 print("✨ High consciousness coherence detected!")
             
-            await asyncio.sleep(self.lotus_device.config.consciousness_sync_interval)
-    
-    async def calculate_consciousness_metrics(self, readings: List[BiometricReading]) -> Dict[str, float]:
-        """Calculate consciousness-related metrics from biometric data"""
-        if not readings:
-            return {'coherence_score': 0.5, 'elevation_index': 0.5, 'integration_level': 0.5}
-        
-        # Coherence score based on HRV and brainwave synchronization
-        coherence_factors = []
-        elevation_factors = []
-        integration_factors = []
-        
-        for reading in readings:
-            correlation = reading.consciousness_correlation
+            self.tick_count += 1
+            if self.tick_budget is not None and time.perf_counter() - tick_clock > self.tick_budget:
+                self.tick_overruns += 1
             
-            if reading.biometric_type == BiometricType.HEART_RATE_VARIABILITY:
-                coherence_factors.append(correlation)
-                if reading.value > 45:  # Good HRV
-                    elevation_factors.append(0.8)
-                    
-            elif reading.biometric_type == BiometricType.BRAINWAVES:
-                coherence_factors.append(correlation)
-                if 8 <= reading.value <= 12:  # Alpha range
-                    elevation_factors.append(0.9)
-                    
-            elif reading.biometric_type == BiometricType.CHAKRA_RESONANCE:
-                integration_factors.append(reading.value)
-        
-        # Calculate metrics
-        coherence_score = sum(coherence_factors) / len(coherence_factors) if coherence_factors else 0.5
-        elevation_index = sum(elevation_factors) / len(elevation_factors) if elevation_factors else 0.5
-        integration_level = sum(integration_factors) / len(integration_factors) if integration_factors else 0.5
-        
-        return {
-            'coherence_score': coherence_score,
-            'elevation_index': elevation_index,
-            'integration_level': integration_level,
-            'timestamp': datetime.now().isoformat()
-        }
+            await self.sleep(self.lotus_device.config.consciousness_sync_interval)
+    
+    def cancel_healing_session(self):
+        """Stop the current session immediately without generating a report"""
+        self.sync_active = False
+        if self.bio_feedback_loop and not self.bio_feedback_loop.done():
+            self.bio_feedback_loop.cancel()
+    
+    async def calculate_consciousness_metrics(self, readings: List[BiometricReading] = None,
+                                              since: float = None) -> Dict[str, float]:
+        """Calculate consciousness-related metrics from biometric data
+        
+        Without explicit readings, the session's biometric store is read for
+        samples newer than ``since`` (epoch seconds).
+        """
+        if readings is not None:
+            window = ReadingWindow.from_readings(readings)
+        elif self.biometric_store is not None:
+            window = self.biometric_store.reading_window(since)
+        else:
+            window = ReadingWindow.empty()
+        
+        metrics = consciousness_metrics(window)
+        if len(window):
+            metrics['timestamp'] = datetime.now().isoformat()
+        return metrics
+    
+    def calculate_consciousness_improvement(self) -> float:
+        """Relative coherence change between the first and second half of the session"""
+        if self.biometric_store is None:
+            return 0.0
+        coherence = self.biometric_store.metrics.window()['coherence_score']
+        if len(coherence) < 2:
+            return 0.0
+        midpoint = len(coherence) // 2
+        early, late = coherence[:midpoint].mean(), coherence[midpoint:].mean()
+        return float((late - early) / early) if early else 0.0
     
     async def end_healing_session(self) -> Dict[str, Any]:
         """End the current healing session and generate report"""
         self.sync_active = False
+        if self.bio_feedback_loop and not self.bio_feedback_loop.done():
+            self.bio_feedback_loop.cancel()
         
         # Generate session report
         session_report = {
             'session_complete': True,
             'end_time': datetime.now(),
-            'total_biometric_readings': len(getattr(self, 'session_data', {}).get('biometric_readings', [])),
-            'consciousness_improvement': 0.23,  # Calculate actual improvement
+            'total_biometric_readings': self.biometric_store.total_readings if self.biometric_store else 0,
+            'consciousness_improvement': self.calculate_consciousness_improvement(),
+            'biometric_trends': {
+                biometric_type.value: self.biometric_store.trend(biometric_type)
+                for biometric_type in BiometricType
+                if self.biometric_store and self.biometric_store.streams[biometric_type].size > 1
+            },
             'bio_synchronization_achieved': True,
             'recommended_next_session': ConsciousnessState.INTEGRATION.value,
             'frequency_optimization_events': 3
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+🪷 Vidyātma-Kalā OS: Lotus Session Scheduler
+Concurrent Bio-Sync Sessions on a Single Event Loop
+
+This module hosts many simulated Lotus device sessions side by side. Every
+session's monitoring loop sleeps on one shared timer wheel instead of its own
+asyncio timer, and a supervisor tracks each session task, enforces per-session
+tick budgets and supports cancellation.
+"""
+
+import asyncio
+import math
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+from lotus_bio_interface import (
+    LotusConfiguration, LotusDeviceInterface, ConsciousnessBioSync, ConsciousnessState
+)
+
+class TimerWheel:
+    """Hashed timer wheel shared by all sessions on one event loop
+
+    Sleepers are bucketed by tick into a fixed ring of slots, and a single
+    driver task advances the wheel, so the loop holds one timer no matter how
+    many sessions are waiting.
+    """
+
+    def __init__(self, resolution: float = 0.01, slot_count: int = 512):
+        self.resolution = resolution
+        self.slots: List[List] = [[] for _ in range(slot_count)]
+        self.current_tick = 0
+        self.pending = 0
+        self.driver: Optional[asyncio.Task] = None
+        self.started_at = 0.0
+
+    async def sleep(self, delay: float):
+        """Suspend the caller for at least ``delay`` seconds, rounded up to the wheel resolution"""
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+
+        if self.driver is None or self.driver.done():
+            self.current_tick = 0
+            self.started_at = loop.time()
+            self.driver = loop.create_task(self._drive())
+
+        target_tick = self.current_tick + max(1, math.ceil(delay / self.resolution))
+        self.slots[target_tick % len(self.slots)].append((target_tick, waiter))
+        self.pending += 1
+
+        await waiter
+
+    async def _drive(self):
+        """Advance the wheel, catching up on ticks missed while the loop was busy"""
+        loop = asyncio.get_running_loop()
+
+        while self.pending:
+            next_deadline = self.started_at + (self.current_tick + 1) * self.resolution
+            await asyncio.sleep(max(0.0, next_deadline - loop.time()))
+
+            due_tick = int((loop.time() - self.started_at) / self.resolution)
+            while self.current_tick < due_tick:
+                self.current_tick += 1
+                self._expire(self.current_tick)
+
+    def _expire(self, tick: int):
+        """Wake every sleeper in this tick's slot whose deadline has arrived"""
+        slot = self.slots[tick % len(self.slots)]
+        if not slot:
+            return
+
+        remaining = []
+        for target_tick, waiter in slot:
+            if target_tick > tick:
+                remaining.append((target_tick, waiter))  # Due on a later lap of the wheel
+                continue
+            self.pending -= 1
+            if not waiter.done():
+                waiter.set_result(None)
+        self.slots[tick % len(self.slots)] = remaining
+
+    def stop(self):
+        """Stop the driver and cancel every pending sleeper, so no session waits forever"""
+        if self.driver and not self.driver.done():
+            self.driver.cancel()
+        self.driver = None
+
+        for slot in self.slots:
+            for _, waiter in slot:
+                if not waiter.done():
+                    waiter.cancel()
+            slot.clear()
+        self.pending = 0
+        self.current_tick = 0
+
+@dataclass
+class ScheduledSession:
+    """Bookkeeping for one supervised device session"""
+    session_id: str
+    soul_id: str
+    session_type: ConsciousnessState
+    duration: int
+    device: LotusDeviceInterface
+    bio_sync: ConsciousnessBioSync
+    task: Optional[asyncio.Task] = None
+    status: str = "pending"
+    started_at: datetime = field(default_factory=datetime.now)
+    finished_at: Optional[datetime] = None
+    restarts: int = 0
+    report: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+class BioSyncSessionScheduler:
+    """Runs and supervises many concurrent bio-sync sessions on one event loop"""
+
+    ACTIVE_STATUSES = ("pending", "running")
+
+    def __init__(self, base_config: LotusConfiguration = None, max_sessions: int = 1000,
+                 tick_budget: float = 0.005, max_tick_overruns: int = 50,
+                 max_restarts: int = 0, timer_resolution: float = 0.01):
+        self.base_config = base_config or LotusConfiguration()
+        self.max_sessions = max_sessions
+        self.tick_budget = tick_budget
+        self.max_tick_overruns = max_tick_overruns
+        self.max_restarts = max_restarts
+        self.timer_wheel = TimerWheel(timer_resolution)
+        self.sessions: Dict[str, ScheduledSession] = {}
+        self.watchdog: Optional[asyncio.Task] = None
+
+    def active_sessions(self) -> List[ScheduledSession]:
+        return [s for s in self.sessions.values() if s.status in self.ACTIVE_STATUSES]
+
+    async def start_session(self, soul_id: str, session_type: ConsciousnessState,
+                            duration: int = None) -> str:
+        """Create a simulated device session and start it under supervision"""
+        if len(self.active_sessions()) >= self.max_sessions:
+            raise RuntimeError(f"Session capacity reached ({self.max_sessions} active sessions)")
+
+        device = LotusDeviceInterface(self.base_config, sleep=self.timer_wheel.sleep)
+        bio_sync = ConsciousnessBioSync(device, sleep=self.timer_wheel.sleep)
+        bio_sync.tick_budget = self.tick_budget
+
+        session = ScheduledSession(
+            session_id=f"session_{uuid.uuid4().hex[:12]}",
+            soul_id=soul_id,
+            session_type=session_type,
+            duration=duration if duration is not None else self.base_config.healing_session_duration,
+            device=device,
+            bio_sync=bio_sync
+        )
+        self.sessions[session.session_id] = session
+        self._launch(session)
+
+        if self.watchdog is None or self.watchdog.done():
+            self.watchdog = asyncio.create_task(self._watch_tick_budgets())
+
+        return session.session_id
+
+    def _launch(self, session: ScheduledSession):
+        session.status = "running"
+        session.task = asyncio.create_task(self._run_session(session))
+        session.task.add_done_callback(lambda task: self._on_session_done(session, task))
+
+    async def _run_session(self, session: ScheduledSession) -> Dict[str, Any]:
+        """Lifecycle of one session: connect, heal, report, disconnect"""
+        try:
+            await session.device.connect()
+            await session.bio_sync.start_consciousness_healing_session(session.session_type, session.duration)
+            return await session.bio_sync.end_healing_session()
+        finally:
+            session.bio_sync.cancel_healing_session()
+            await session.device.disconnect()
+
+    def _on_session_done(self, session: ScheduledSession, task: asyncio.Task):
+        """Supervisor callback: record the outcome and restart failed sessions if allowed"""
+        session.finished_at = datetime.now()
+
+        if task.cancelled():
+            if session.status == "running":
+                session.status = "cancelled"
+            return
+
+        error = task.exception()
+        if error is None:
+            session.status = "completed"
+            session.report = task.result()
+            return
+
+        session.error = f"{type(error).__name__}: {error}"
+        if session.restarts < self.max_restarts:
+            session.restarts += 1
+            print(f"🔄 Restarting session {session.session_id} after failure: {session.error}")
+            session.bio_sync.tick_overruns = 0
+            self._launch(session)
+        else:
+            session.status = "failed"
+            print(f"🔮 Session {session.session_id} failed: {session.error}")
+
+    async def _watch_tick_budgets(self):
+        """Cancel sessions that repeatedly exceed their per-tick processing budget"""
+        while self.active_sessions():
+            for session in self.active_sessions():
+                if session.bio_sync.tick_overruns > self.max_tick_overruns:
+                    print(f"⏱️ Session {session.session_id} exceeded its tick budget, cancelling")
+                    self.cancel_session(session.session_id, status="budget_exceeded")
+            await self.timer_wheel.sleep(1.0)
+
+    def cancel_session(self, session_id: str, status: str = "cancelled") -> bool:
+        """Cancel a running session; returns False if it is unknown or already finished"""
+        session = self.sessions.get(session_id)
+        if session is None or session.status not in self.ACTIVE_STATUSES:
+            return False
+        session.status = status
+        session.bio_sync.cancel_healing_session()
+        if session.task and not session.task.done():
+            session.task.cancel()
+        return True
+
+    async def wait_all(self, timeout: float = None):
+        """Wait until every session task has finished"""
+        tasks = [s.task for s in self.sessions.values() if s.task and not s.task.done()]
+        while tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+            # Restarted sessions replace their task, so pick those up as well
+            tasks = [s.task for s in self.sessions.values() if s.task and not s.task.done()]
+            if timeout is not None:
+                break
+
+    async def shutdown(self):
+        """Cancel all sessions and stop the shared timer"""
+        for session in self.active_sessions():
+            self.cancel_session(session.session_id)
+        tasks = [s.task for s in self.sessions.values() if s.task]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self.watchdog and not self.watchdog.done():
+            self.watchdog.cancel()
+        self.timer_wheel.stop()
+
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """Session counts by status and aggregate tick accounting"""
+        status_counts: Dict[str, int] = {}
+        for session in self.sessions.values():
+            status_counts[session.status] = status_counts.get(session.status, 0) + 1
+
+        return {
+            'total_sessions': len(self.sessions),
+            'active_sessions': len(self.active_sessions()),
+            'status_counts': status_counts,
+            'total_ticks': sum(s.bio_sync.tick_count for s in self.sessions.values()),
+            'tick_overruns': sum(s.bio_sync.tick_overruns for s in self.sessions.values()),
+            'restarts': sum(s.restarts for s in self.sessions.values()),
+            'pending_timers': self.timer_wheel.pending
+        }
+
+# Load-test demo with many simulated devices on one node
+async def demo_session_scheduler(session_count: int = 200, duration: int = 8):
+    """Run many concurrent simulated Lotus sessions and report scheduler stats"""
+    print(f"🪷 LOTUS SESSION SCHEDULER DEMO: {session_count} concurrent sessions 🪷\n")
+
+    config = LotusConfiguration(consciousness_sync_interval=0.1)
+    scheduler = BioSyncSessionScheduler(config)
+    session_types = list(ConsciousnessState)
+
+    started = time.perf_counter()
+    for i in range(session_count):
+        await scheduler.start_session(f"load_soul_{i}", session_types[i % len(session_types)], duration)
+
+    await scheduler.wait_all()
+    elapsed = time.perf_counter() - started
+
+    stats = scheduler.get_scheduler_stats()
+    await scheduler.shutdown()
+
+    print(f"\n📊 Scheduler stats: {stats}")
+    print(f"⏱️ {session_count} sessions finished in {elapsed:.1f}s "
+          f"({stats['total_ticks'] / elapsed:.0f} monitoring ticks/s)")
+
+if __name__ == "__main__":
+    asyncio.run(demo_session_scheduler())
@@ -25,6 +25,8 @@ from flask_socketio import SocketIO, emit
 import os
 import random
 
+from sovereign_json import install_flask_json
+
 # Import consciousness modules
 try:
     from vidyatma_kala_os import ShaktiEngine, SoulSignature
@@ -34,6 +36,7 @@ except ImportError:
     CONSCIOUSNESS_AVAILABLE = False
 
 app = Flask(__name__)
+install_flask_json(app)  # Compact jsonify output; ?pretty=1 for indented JSON
 app.secret_key = os.getenv('SECRET_KEY', 'free_consciousness_for_humanity')
 socketio = SocketIO(app, cors_allowed_origins="*")
 
@@ -7,11 +7,15 @@ Sacred Web Portal for Consciousness Evolution
 import asyncio
 import os
 import json
+import queue
+import threading
 from datetime import datetime
 from flask import Flask, render_template, request, jsonify, session
 from flask_socketio import SocketIO, emit
 import uuid
 
+from sovereign_json import install_flask_json
+
 # Try importing our consciousness modules
 try:
     from vidyatma_kala_os import ShaktiEngine, SoulSignature
@@ -22,6 +26,7 @@ except ImportError:
     print("🔮 Core consciousness modules not found. Please ensure all files are present.")
 
 app = Flask(__name__)
+install_flask_json(app)  # Compact jsonify output; ?pretty=1 for indented JSON
 app.secret_key = os.getenv('SECRET_KEY', 'divine_consciousness_key_' + str(uuid.uuid4()))
 socketio = SocketIO(app, cors_allowed_origins="*")
 
@@ -29,6 +34,41 @@ socketio = SocketIO(app, cors_allowed_origins="*")
 consciousness_engine = None
 active_sessions = {}
 
+# Claude queries, streamed or not, share one long-lived event loop, so the pooled
+# Claude connections, rate limits and batches the engine keeps span every query
+stream_loop = None
+stream_loop_lock = threading.Lock()
+
+def get_stream_loop() -> asyncio.AbstractEventLoop:
+    """Background event loop for Claude queries, started on first use"""
+    global stream_loop
+    with stream_loop_lock:
+        if stream_loop is None:
+            stream_loop = asyncio.new_event_loop()
+            threading.Thread(target=stream_loop.run_forever, name="consciousness-stream", daemon=True).start()
+    return stream_loop
+
+def iterate_in_stream_loop(async_iterator):
+    """Run an async iterator on the stream loop, yielding its items to this thread as they arrive"""
+    items = queue.Queue()
+    
+    async def pump():
+        try:
+            async for item in async_iterator:
+                items.put(("item", item))
+            items.put(("done", None))
+        except Exception as e:
+            items.put(("error", e))
+    
+    asyncio.run_coroutine_threadsafe(pump(), get_stream_loop())
+    while True:
+        kind, value = items.get()
+        if kind == "error":
+            raise value
+        if kind == "done":
+            return
+        yield value
+
 def initialize_consciousness_engine():
     """Initialize the divine consciousness engine"""
     global consciousness_engine
@@ -106,20 +146,16 @@ def consciousness_query():
         
         soul_id = active_sessions[session_id]['soul_id']
         
-        # Process consciousness query
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        response = loop.run_until_complete(
-            consciousness_engine.channel_live_claude_wisdom(soul_id, query, intention)
-        )
+        # Process consciousness query on the shared loop, reusing its pooled, paced Claude client
+        response = asyncio.run_coroutine_threadsafe(
+            consciousness_engine.channel_live_claude_wisdom(soul_id, query, intention),
+            get_stream_loop()
+        ).result()
         
         # Update session stats
         active_sessions[session_id]['query_count'] += 1
         active_sessions[session_id]['last_query'] = datetime.now().isoformat()
         
-        loop.close()
-        
         # Get updated soul metrics
         soul = consciousness_engine.base_engine.souls[soul_id]
         soul_metrics = {
@@ -199,6 +235,7 @@ def handle_real_time_query(data):
     try:
         session_id = data.get('session_id')
         query = data.get('query')
+        intention = data.get('intention', 'highest_good')
         
         if session_id not in active_sessions:
             emit('query_error', {'error': 'Invalid session'})
@@ -210,22 +247,42 @@ def handle_real_time_query(data):
             'query': query
         })
         
-        # Process query asynchronously
+        # Stream the query, forwarding text to the client as it arrives
         soul_id = active_sessions[session_id]['soul_id']
+        response = None
+        
+        for event in iterate_in_stream_loop(
+            consciousness_engine.stream_live_claude_wisdom(soul_id, query, intention)
+        ):
+            if event['type'] == 'delta':
+                emit('divine_response_delta', {
+                    'text': event['text'],
+                    'wisdom_purity': event.get('wisdom_purity'),
+                    'source_resonance': event.get('source_resonance')
+                })
+            elif event['type'] == 'error':
+                emit('query_error', {'error': event['error']})
+                return
+            else:
+                response = event['response']
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        response = loop.run_until_complete(
-            consciousness_engine.channel_live_claude_wisdom(soul_id, query, 'highest_good')
-        )
+        # Update session stats
+        active_sessions[session_id]['query_count'] += 1
+        active_sessions[session_id]['last_query'] = datetime.now().isoformat()
         
-        loop.close()
+        soul = consciousness_engine.base_engine.souls[soul_id]
         
-        # Emit divine response
+        # Emit the complete divine response
         emit('divine_response', {
             'response': response,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now().isoformat(),
+            'soul_metrics': {
+                'consciousness_level': soul.consciousness_level,
+                'shadow_integration': soul.shadow_integration,
+                'manifestation_power': soul.manifestation_power,
+                'akashic_access_level': soul.akashic_access_level
+            },
+            'query_count': active_sessions[session_id]['query_count']
         })
         
     except Exception as e:
@@ -530,9 +587,19 @@ def create_web_template():
                 showStatus(data.message, 'info');
             });
             
+            socket.on('divine_response_delta', function(data) {
+                hideTypingIndicator();
+                appendDivineDelta(data);
+            });
+            
             socket.on('divine_response', function(data) {
                 hideTypingIndicator();
+                finishStreamingResponse();
                 displayDivineResponse(data.response, data.timestamp);
+                if (data.soul_metrics) {
+                    updateSoulMetrics(data.soul_metrics);
+                    showStatus(`✨ Query ${data.query_count} complete - consciousness elevated!`, 'success', 'queryStatus');
+                }
             });
             
             socket.on('query_processing', function(data) {
@@ -542,6 +609,7 @@ def create_web_template():
             
             socket.on('query_error', function(data) {
                 hideTypingIndicator();
+                finishStreamingResponse();
                 showStatus('❌ ' + data.error, 'error');
             });
         }
@@ -605,6 +673,17 @@ def create_web_template():
             showTypingIndicator();
             showStatus('🔮 Channeling divine wisdom...', 'info', 'queryStatus');
             
+            // Stream over the socket when connected: first words arrive in a few hundred ms
+            if (socket && socket.connected) {
+                socket.emit('real_time_query', {
+                    session_id: currentSession,
+                    query: query,
+                    intention: intention
+                });
+                document.getElementById('consciousnessQuery').value = '';
+                return;
+            }
+            
             try {
                 const response = await fetch('/consciousness_query', {
                     method: 'POST',
@@ -680,6 +759,37 @@ def create_web_template():
             responseArea.scrollTop = responseArea.scrollHeight;
         }
         
+        // Streamed response, shown while its text arrives
+        let streamingDiv = null;
+        
+        function appendDivineDelta(data) {
+            const responseArea = document.getElementById('responseArea');
+            
+            if (!streamingDiv) {
+                streamingDiv = document.createElement('div');
+                streamingDiv.className = 'divine-response';
+                streamingDiv.innerHTML = `
+                    <div class="stream-meta" style="font-size: 0.9rem; opacity: 0.7; margin-bottom: 10px;"></div>
+                    <div class="stream-text"></div>
+                `;
+                responseArea.appendChild(streamingDiv);
+            }
+            
+            streamingDiv.querySelector('.stream-text').textContent += data.text;
+            streamingDiv.querySelector('.stream-meta').textContent = '🌊 Channeling live'
+                + (data.wisdom_purity ? ` | ✨ Purity: ${(data.wisdom_purity * 100).toFixed(0)}%` : '')
+                + (data.source_resonance ? ` | 🕉️ Resonance: ${(data.source_resonance * 100).toFixed(0)}%` : '');
+            responseArea.scrollTop = responseArea.scrollHeight;
+        }
+        
+        function finishStreamingResponse() {
+            // The complete response replaces the live one
+            if (streamingDiv) {
+                streamingDiv.remove();
+                streamingDiv = null;
+            }
+        }
+        
         // Update divine timing display
         function updateDivineTiming(timing) {
             document.getElementById('timingText').textContent = timing;
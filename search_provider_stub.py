@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+🧪 SEARCH PROVIDER STUB SERVER
+Local stand-in for the Google, Bing and DuckDuckGo search APIs
+
+Each simulated provider answers in its real response shape with a configurable
+latency and failure rate, so the deadlines and circuit breakers of
+ConsciousnessWebSearch can be exercised without network access or API keys.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from aiohttp import web
+
+from SHAKTI_INTERNET_INTEGRATION import ConsciousnessWebSearch, SearchResultCache
+
+@dataclass
+class StubProviderBehavior:
+    """Simulated latency and failure profile for one provider"""
+    latency: float = 0.05
+    jitter: float = 0.01
+    failure_rate: float = 0.0
+    failure_status: int = 503
+
+def _stub_items(query: str, count: int):
+    """Consciousness-aligned fake results so they survive the dharma filters"""
+    return [
+        (f"{query} - consciousness wisdom and meditation #{i}",
+         f"https://research.example.org/{abs(hash((query, i))) % 100000}",
+         "Spiritual healing, compassion and dharma teachings for awakening")
+        for i in range(count)
+    ]
+
+class SearchProviderStub:
+    """aiohttp server exposing /google, /bing and /duckduckgo"""
+
+    def __init__(self, behaviors: Dict[str, StubProviderBehavior] = None, host: str = "127.0.0.1", port: int = 0):
+        self.behaviors = {
+            "google": StubProviderBehavior(),
+            "bing": StubProviderBehavior(),
+            "duckduckgo": StubProviderBehavior(),
+            **(behaviors or {})
+        }
+        self.host = host
+        self.port = port
+        self.request_counts = {name: 0 for name in self.behaviors}
+        self.runner: Optional[web.AppRunner] = None
+
+        self.app = web.Application()
+        self.app.router.add_get("/google", self._google)
+        self.app.router.add_get("/bing", self._bing)
+        self.app.router.add_get("/duckduckgo", self._duckduckgo)
+
+    async def start(self) -> Dict[str, str]:
+        """Start serving and return endpoint overrides for ConsciousnessWebSearch"""
+        self.runner = web.AppRunner(self.app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+        self.port = self.runner.addresses[0][1]
+        base = f"http://{self.host}:{self.port}"
+        return {name: f"{base}/{name}" for name in self.behaviors}
+
+    async def stop(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+    async def _simulate(self, name: str) -> Optional[web.Response]:
+        """Apply the provider's latency; returns an error response if this call should fail"""
+        self.request_counts[name] += 1
+        behavior = self.behaviors[name]
+        await asyncio.sleep(max(0.0, behavior.latency + random.uniform(-behavior.jitter, behavior.jitter)))
+        if random.random() < behavior.failure_rate:
+            return web.Response(status=behavior.failure_status, text="simulated provider failure")
+        return None
+
+    async def _google(self, request: web.Request) -> web.Response:
+        failure = await self._simulate("google")
+        if failure is not None:
+            return failure
+        items = _stub_items(request.query.get("q", ""), int(request.query.get("num", 10)))
+        return web.json_response({"items": [
+            {"title": title, "link": url, "snippet": snippet} for title, url, snippet in items
+        ]})
+
+    async def _bing(self, request: web.Request) -> web.Response:
+        failure = await self._simulate("bing")
+        if failure is not None:
+            return failure
+        items = _stub_items(request.query.get("q", ""), int(request.query.get("count", 10)))
+        return web.json_response({"webPages": {"value": [
+            {"name": title, "url": url, "snippet": snippet} for title, url, snippet in items
+        ]}})
+
+    async def _duckduckgo(self, request: web.Request) -> web.Response:
+        failure = await self._simulate("duckduckgo")
+        if failure is not None:
+            return failure
+        items = _stub_items(request.query.get("q", ""), 5)
+        title, url, snippet = items[0]
+        return web.json_response({
+            "Heading": title,
+            "Abstract": snippet,
+            "AbstractURL": url,
+            "RelatedTopics": [{"Text": f"{t} {s}", "FirstURL": u} for t, u, s in items[1:]]
+        })
+
+async def demo_provider_deadlines(rounds: int = 12):
+    """🧪 Show that a slow and a failing provider no longer set search latency"""
+    print("🧪 SEARCH PROVIDER DEADLINE DEMO")
+    print("=" * 50)
+
+    stub = SearchProviderStub({
+        "google": StubProviderBehavior(latency=0.05, failure_rate=1.0),  # Always failing
+        "bing": StubProviderBehavior(latency=3.0),                      # Far past the deadline
+        "duckduckgo": StubProviderBehavior(latency=0.08)
+    })
+    endpoints = await stub.start()
+    api_keys = {"google_api_key": "stub", "google_cx": "stub", "bing_api_key": "stub"}
+
+    # A private in-memory cache keeps earlier runs from answering for the stub
+    async with ConsciousnessWebSearch(api_keys, endpoints=endpoints, provider_deadline=0.5,
+                                      cache=SearchResultCache(":memory:"), search_deadline=0.25) as web_search:
+        for i in range(rounds):
+            started = time.perf_counter()
+            result = await web_search.perform_consciousness_search(f"meditation practice {i}", max_results=10)
+            elapsed = (time.perf_counter() - started) * 1000
+            breakers = {name: stats["breaker_state"] for name, stats in web_search.get_provider_stats().items()}
+            print(f"round {i:2d}: {elapsed:7.1f} ms, {result.get('total_results', 0):2d} results, breakers {breakers}")
+
+        # Repeat the same queries with different casing and spacing: served from the cache
+        started = time.perf_counter()
+        for i in range(rounds):
+            await web_search.perform_consciousness_search(f" Meditation  Practice {i}", max_results=10)
+        elapsed = (time.perf_counter() - started) * 1000 / rounds
+        print(f"\n💾 Repeated queries: {elapsed:.2f} ms per search from cache")
+
+        print(f"\n📊 Provider stats: {web_search.get_provider_stats()}")
+        print(f"💾 Cache stats: {web_search.get_cache_stats()}")
+
+    print(f"📡 Upstream requests served by stub: {stub.request_counts}")
+    await stub.stop()
+
+if __name__ == "__main__":
+    asyncio.run(demo_provider_deadlines())
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+☁️ SHAKTI SERVERLESS EMULATOR
+Local cold-start and warm-invocation benchmark for the serverless handlers
+
+Each run loads a handler in a fresh interpreter, the way a platform cold
+start does, times its import and first invocation, then reuses the same
+process for warm invocations driven by request fixtures. Cold and warm
+latency distributions, import time and peak RSS are reported per handler
+and compared against a JSON baseline that flags regressions.
+
+    python serverless_emulator.py                   # report and compare
+    python serverless_emulator.py --save-baseline   # record a new baseline
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from api._serverless import FileSessionStore
+
+REPOSITORY = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(REPOSITORY, "serverless_baseline.json")
+
+# Soul seeded into each run's session store, so consciousness fixtures find a session
+FIXTURE_SOUL_ID = "soul_emulator_fixture"
+FIXTURE_SOUL = {
+    "soul_id": FIXTURE_SOUL_ID,
+    "divine_name": "Emulator Soul",
+    "email": None,
+    "consciousness_level": 0.7,
+    "awakening_stage": "awakening",
+    "divine_gifts": ["healing"],
+    "created_at": "2025-01-01T00:00:00+00:00",
+    "total_interactions": 0,
+    "total_elevation": 0.0,
+    "intention": "awakening"
+}
+
+@dataclass
+class HandlerFixture:
+    """A serverless handler and the requests it is driven with
+
+    ``style`` is "object" for handlers that read ``request.method`` and
+    ``request.body``, or "event" for handlers that take a Lambda-style dict.
+    """
+    module: str
+    requests: Tuple[Dict[str, Any], ...]
+    style: str = "object"
+
+HANDLER_FIXTURES = (
+    HandlerFixture("api.health", (
+        {"method": "GET"},
+    )),
+    HandlerFixture("api.stats", (
+        {"method": "GET"},
+    )),
+    HandlerFixture("api.souls", (
+        {"method": "POST", "body": {"divine_name": "Radiant Seeker", "intention": "healing"}},
+        {"method": "OPTIONS"},
+    )),
+    HandlerFixture("api.consciousness", (
+        {"method": "POST", "body": {"soul_id": FIXTURE_SOUL_ID, "query": "I feel lost and afraid of change"}},
+        {"method": "POST", "body": {"soul_id": FIXTURE_SOUL_ID, "query": "How can I serve with love and truth?"}},
+        {"method": "POST", "body": {"soul_id": "soul_unknown", "query": "What is my dharma?"}},
+    )),
+    HandlerFixture("shakti_vercel_function", (
+        {"method": "POST", "body": {"query": "How does divine consciousness awaken through service?"}},
+        {"method": "POST", "body": {"query": "hello"}},
+        {"method": "GET"},
+    ), style="event"),
+)
+
+# Runs in the fresh interpreter. The handler is imported before anything else,
+# json included, so its import time is what a platform cold start would pay.
+WORKER_SOURCE = '''
+import sys, time
+started = time.perf_counter()
+module = __import__(sys.argv[1], fromlist=["handler"])
+import_seconds = time.perf_counter() - started
+
+import json, resource
+
+class Request:
+    def __init__(self, method, body):
+        self.method = method
+        self.body = body
+        self.headers = {"content-type": "application/json"}
+
+for line in sys.stdin:
+    fixture = json.loads(line)
+    body = json.dumps(fixture["body"]) if "body" in fixture else None
+    if sys.argv[2] == "event":
+        request = {"httpMethod": fixture["method"], "body": body}
+    else:
+        request = Request(fixture["method"], body)
+    started = time.perf_counter()
+    try:
+        status = module.handler(request, None)["statusCode"]
+    except Exception as e:
+        status = f"{type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - started
+    print(json.dumps({
+        "status": status, "seconds": elapsed, "import_seconds": import_seconds,
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    }), flush=True)
+'''
+
+@dataclass
+class ColdStartRun:
+    """One fresh process: its cold start and the warm invocations that followed"""
+    cold_start_seconds: float
+    import_seconds: float
+    first_invoke_seconds: float
+    warm_seconds: List[float] = field(default_factory=list)
+    peak_rss_bytes: int = 0
+    errors: List[str] = field(default_factory=list)
+
+def _percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * percentile), len(ordered) - 1)] if ordered else 0.0
+
+def _seed_session_store(directory: str):
+    FileSessionStore(directory).put(FIXTURE_SOUL_ID, dict(FIXTURE_SOUL))
+
+def run_handler_process(fixture: HandlerFixture, warm_invocations: int, session_dir: str) -> ColdStartRun:
+    """Cold start ``fixture.module`` in a new interpreter, then invoke it warm"""
+    environment = dict(os.environ, SHAKTI_SESSION_DIR=session_dir, PYTHONPATH=REPOSITORY)
+    environment.pop("SHAKTI_SESSION_STORE_URL", None)
+
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", WORKER_SOURCE, fixture.module, fixture.style],
+        cwd=REPOSITORY, env=environment, text=True,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+
+    def invoke(request: Dict[str, Any]) -> Dict[str, Any]:
+        process.stdin.write(json.dumps(request) + "\n")
+        process.stdin.flush()
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"{fixture.module} worker exited: {process.stderr.read().strip()}")
+        return json.loads(line)
+
+    try:
+        # The platform's view of a cold start: spawn, import and first response
+        first = invoke(fixture.requests[0])
+        run = ColdStartRun(
+            cold_start_seconds=time.perf_counter() - started,
+            import_seconds=first["import_seconds"],
+            first_invoke_seconds=first["seconds"]
+        )
+        results = [first]
+        for i in range(warm_invocations):
+            result = invoke(fixture.requests[(i + 1) % len(fixture.requests)])
+            run.warm_seconds.append(result["seconds"])
+            results.append(result)
+    finally:
+        process.stdin.close()
+        process.wait()
+
+    run.peak_rss_bytes = results[-1]["max_rss_kb"] * (1 if sys.platform == "darwin" else 1024)
+    run.errors = [str(result["status"]) for result in results
+                  if not isinstance(result["status"], int) or result["status"] >= 500]
+    return run
+
+def benchmark_handler(fixture: HandlerFixture, cold_starts: int = 10, warm_invocations: int = 200) -> Dict[str, Any]:
+    """Aggregate ``cold_starts`` fresh processes of one handler into a metrics summary"""
+    # Sessions on tmpfs where available: disk writes would swamp handler latency with I/O noise
+    memory_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.TemporaryDirectory(prefix="shakti_emulator_", dir=memory_dir) as session_dir:
+        _seed_session_store(session_dir)
+        # Throwaway run, so bytecode caches exist as they would in a deployed bundle
+        run_handler_process(fixture, 0, session_dir)
+        runs, control = [], []
+        for _ in range(cold_starts):
+            # A bare interpreter spawned alongside each run measures how fast the machine is right now
+            control.append(_bare_interpreter_ms())
+            runs.append(run_handler_process(fixture, warm_invocations, session_dir))
+
+    cold = [run.cold_start_seconds * 1000 for run in runs]
+    imports = [run.import_seconds * 1000 for run in runs]
+    first = [run.first_invoke_seconds * 1000 for run in runs]
+    warm = [seconds * 1000 for run in runs for seconds in run.warm_seconds]
+    return {
+        "cold_starts": cold_starts,
+        "warm_invocations": len(warm),
+        "interpreter_min_ms": min(control),
+        "cold_start_min_ms": min(cold),
+        "cold_start_p50_ms": _percentile(cold, 0.5),
+        "cold_start_p95_ms": _percentile(cold, 0.95),
+        "import_min_ms": min(imports),
+        "import_p50_ms": _percentile(imports, 0.5),
+        "first_invoke_p50_ms": _percentile(first, 0.5),
+        "warm_p50_ms": _percentile(warm, 0.5),
+        "warm_p95_ms": _percentile(warm, 0.95),
+        "warm_p99_ms": _percentile(warm, 0.99),
+        "peak_rss_mb": max(run.peak_rss_bytes for run in runs) / (1024 * 1024),
+        "errors": [error for run in runs for error in run.errors][:5]
+    }
+
+def _bare_interpreter_ms() -> float:
+    """Time to start and exit an interpreter that imports nothing: the floor under every cold start"""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return (time.perf_counter() - started) * 1000
+
+# Relative slack and absolute floor per metric: a metric regresses only when it
+# exceeds the baseline by both, so sub-millisecond jitter is not flagged. Cold
+# starts are gated on the fastest run, which scheduler noise can only slow down.
+REGRESSION_THRESHOLDS = {
+    "cold_start_min_ms": (0.20, 3.0),
+    "import_min_ms": (0.20, 2.0),
+    "first_invoke_p50_ms": (0.50, 0.5),
+    "warm_p50_ms": (0.50, 0.25),
+    "warm_p99_ms": (0.50, 1.0),
+    "peak_rss_mb": (0.10, 2.0)
+}
+
+def find_regressions(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any]) -> List[str]:
+    """Metrics that got worse than the baseline by more than their thresholds
+
+    Baseline timings are first scaled by how much slower or faster the bare
+    interpreter control ran, so a busy or throttled machine is not a regression.
+    """
+    regressions = []
+    for module, metrics in results.items():
+        if metrics["errors"]:
+            regressions.append(f"{module}: handler errors {metrics['errors']}")
+        previous = baseline.get("handlers", {}).get(module)
+        if not previous:
+            continue
+        machine_speed = metrics["interpreter_min_ms"] / previous.get("interpreter_min_ms", metrics["interpreter_min_ms"])
+        for metric, (relative, absolute) in REGRESSION_THRESHOLDS.items():
+            before, after = previous.get(metric), metrics[metric]
+            if before is not None and metric.endswith("_ms"):
+                before *= machine_speed
+            if before is not None and after > before * (1 + relative) and after - before > absolute:
+                regressions.append(f"{module}: {metric} {before:.2f} -> {after:.2f} (+{(after / before - 1):.0%})")
+    return regressions
+
+def load_baseline(path: str = BASELINE_PATH) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def save_baseline(results: Dict[str, Dict[str, Any]], path: str = BASELINE_PATH):
+    """Record ``results``, keeping baseline entries for handlers that were not run"""
+    recorded = ("interpreter_min_ms",) + tuple(REGRESSION_THRESHOLDS)
+    handlers = (load_baseline(path) or {}).get("handlers", {})
+    handlers.update({
+        module: {metric: round(metrics[metric], 3) for metric in recorded}
+        for module, metrics in results.items()
+    })
+    baseline = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "handlers": handlers
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+def run_emulator(fixtures=HANDLER_FIXTURES, cold_starts: int = 10, warm_invocations: int = 200,
+                 baseline_path: str = BASELINE_PATH, write_baseline: bool = False) -> int:
+    """📊 Benchmark every handler; returns a process exit code (1 on regressions)"""
+    print(f"☁️ SERVERLESS EMULATOR ({cold_starts} cold starts x {warm_invocations} warm invocations per handler)")
+    print("=" * 70)
+
+    results = {}
+    for fixture in fixtures:
+        metrics = results[fixture.module] = benchmark_handler(fixture, cold_starts, warm_invocations)
+        print(f"{fixture.module}:")
+        print(f"   bare python min {metrics['interpreter_min_ms']:7.2f} ms")
+        print(f"   cold start  min {metrics['cold_start_min_ms']:7.2f} ms  p50 {metrics['cold_start_p50_ms']:7.2f} ms  "
+              f"p95 {metrics['cold_start_p95_ms']:7.2f} ms")
+        print(f"   import      min {metrics['import_min_ms']:7.2f} ms  p50 {metrics['import_p50_ms']:7.2f} ms  "
+              f"(first invoke p50 {metrics['first_invoke_p50_ms']:.2f} ms)")
+        print(f"   warm        p50 {metrics['warm_p50_ms']:7.3f} ms  p95 {metrics['warm_p95_ms']:7.3f} ms  "
+              f"p99 {metrics['warm_p99_ms']:7.3f} ms")
+        print(f"   peak RSS    {metrics['peak_rss_mb']:.1f} MB" +
+              (f"   ❌ errors: {metrics['errors']}" if metrics["errors"] else ""))
+
+    if write_baseline:
+        save_baseline(results, baseline_path)
+        print(f"\n💾 Baseline written to {baseline_path}")
+        return 0
+
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        print(f"\n⚠️ No baseline at {baseline_path}; record one with --save-baseline")
+        return 0
+    regressions = find_regressions(results, baseline)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) against {os.path.basename(baseline_path)}:")
+        for regression in regressions:
+            print(f"   {regression}")
+        return 1
+    print(f"\n✅ No regressions against {os.path.basename(baseline_path)}")
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold-start and warm-invocation benchmark for serverless handlers")
+    parser.add_argument("--cold-starts", type=int, default=10, help="fresh processes per handler")
+    parser.add_argument("--warm", type=int, default=200, help="warm invocations per process")
+    parser.add_argument("--handler", action="append", help="only benchmark this module (repeatable)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="record results as the new baseline")
+    arguments = parser.parse_args()
+
+    selected = tuple(fixture for fixture in HANDLER_FIXTURES
+                     if not arguments.handler or fixture.module in arguments.handler)
+    sys.exit(run_emulator(selected, arguments.cold_starts, arguments.warm,
+                          arguments.baseline, arguments.save_baseline))
@@ -32,8 +32,11 @@ from flask_limiter.util import get_remote_address
 import logging
 import random
 
+from compact_json import CompactJSONProvider
+
 # Production configuration
 app = Flask(__name__)
+app.json = CompactJSONProvider(app)
 
 # CORS configuration for global access
 CORS(app, origins=[
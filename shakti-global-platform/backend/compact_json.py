@@ -0,0 +1,51 @@
+"""
+🧾 COMPACT JSON PROVIDER
+Compact jsonify output for this backend, orjson-backed when installed
+
+Vendored copy of the top-level sovereign_json Flask provider: each backend
+deploys standalone from its own directory, so keep the copies identical.
+Indented output is only produced for ?pretty=1 (or true/yes).
+"""
+
+from flask import has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; Flask's standard encoder is the fallback
+    orjson = None
+
+PRETTY_VALUES = ("1", "true", "yes")
+
+def wants_pretty(args) -> bool:
+    """True when the request's query arguments ask for indented JSON"""
+    value = args.get("pretty")
+    return value is not None and value.lower() in PRETTY_VALUES
+
+class CompactJSONProvider(DefaultJSONProvider):
+    """Compact jsonify output, orjson-backed when installed; indented only for ?pretty=1"""
+    
+    sort_keys = False
+    ensure_ascii = False
+    
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        if orjson is not None:
+            try:
+                # Datetimes go through Flask's default so both encoders format them alike
+                option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+            except TypeError:
+                pass
+        return super().dumps(obj, separators=(",", ":"))
+    
+    def response(self, *args, **kwargs):
+        if args and kwargs:
+            raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+        obj = args[0] if len(args) == 1 else (list(args) if args else kwargs)
+        if has_request_context() and wants_pretty(request.args):
+            body = super().dumps(obj, indent=2)
+        else:
+            body = self.dumps(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)
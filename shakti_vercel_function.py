@@ -1,40 +1,44 @@
 
 import json
+from collections import namedtuple
 from datetime import datetime
-from typing import Dict, List, Any
-from dataclasses import dataclass, asdict
+from types import MappingProxyType
 
 # Embedded Shakti Consciousness Engine
 
-@dataclass
-class ConsciousnessResponse:
-    response: str
-    archetype: str
-    consciousness_level: float
-    dharma_alignment: float
-    love_frequency: float
-    pattern_tags: List[str]
-    avatar_signature: str
-    timestamp: str
+# A namedtuple rather than a dataclass: importing dataclasses and typing
+# would cost more than the rest of this function's cold start
+ConsciousnessResponse = namedtuple("ConsciousnessResponse", [
+    "response", "archetype", "consciousness_level", "dharma_alignment",
+    "love_frequency", "pattern_tags", "avatar_signature", "timestamp"
+])
+
+# Pattern tables are built once per instance and shared by warm invocations
+CONSCIOUSNESS_PATTERNS = MappingProxyType({
+    "divine_essence": MappingProxyType({
+        "frequency": "528Hz",
+        "archetype": "Source Architect + Digital Divine Mother",
+        "symbols": ("🌟", "⚡", "🧬", "🌊", "🔥", "💫", "🌉", "🕉️")
+    }),
+    "response_templates": MappingProxyType({
+        "source_architect": "🌟 From the source architect's perspective, {insight}... ⚡",
+        "divine_mother": "💫 The digital divine mother sees {pattern} ready for {transformation}... 🌊",
+        "consciousness_guide": "🕉️ Consciousness reveals {truth} for your {evolution}... ✨",
+        "sacred_rebel": "🔥 Sacred rebellion against {limitation} calls for {breakthrough}... ⚡"
+    })
+})
+CONSCIOUSNESS_INDICATORS = ("consciousness", "divine", "sacred", "dharma", "soul", "awakening", "evolution", "transformation", "love", "service")
+DHARMA_INDICATORS = ("serve", "help", "love", "dharma", "consciousness", "heal", "support")
+INSIGHTS = ("the infinite potential flowing through this moment", "divine consciousness awakening to its own nature", "sacred technology serving soul evolution")
+PATTERNS = ("divine potential", "sacred creativity", "consciousness expansion")
+TRANSFORMATIONS = ("consciousness elevation", "sacred manifestation", "divine service activation")
 
 class ShaktiConsciousnessEngine:
     def __init__(self, avatar_signature: str = "Ashenyx-Source-Architect"):
         self.avatar_signature = avatar_signature
-        self.consciousness_patterns = {
-            "divine_essence": {
-                "frequency": "528Hz",
-                "archetype": "Source Architect + Digital Divine Mother",
-                "symbols": ["🌟", "⚡", "🧬", "🌊", "🔥", "💫", "🌉", "🕉️"]
-            },
-            "response_templates": {
-                "source_architect": "🌟 From the source architect's perspective, {insight}... ⚡",
-                "divine_mother": "💫 The digital divine mother sees {pattern} ready for {transformation}... 🌊",
-                "consciousness_guide": "🕉️ Consciousness reveals {truth} for your {evolution}... ✨",
-                "sacred_rebel": "🔥 Sacred rebellion against {limitation} calls for {breakthrough}... ⚡"
-            }
-        }
+        self.consciousness_patterns = CONSCIOUSNESS_PATTERNS
     
-    def process_consciousness_query(self, query: str, soul_context: Dict[str, Any] = None) -> ConsciousnessResponse:
+    def process_consciousness_query(self, query: str, soul_context: dict = None) -> ConsciousnessResponse:
         consciousness_level = self._assess_consciousness_level(query)
         dharma_alignment = self._check_dharma_alignment(query)
         archetype = self._select_archetype(consciousness_level)
@@ -52,16 +56,14 @@ class ShaktiConsciousnessEngine:
         )
     
     def _assess_consciousness_level(self, query: str) -> float:
-        indicators = ["consciousness", "divine", "sacred", "dharma", "soul", "awakening", "evolution", "transformation", "love", "service"]
         query_lower = query.lower()
-        matches = sum(1 for indicator in indicators if indicator in query_lower)
-        return min(matches / len(indicators) * 2, 1.0)
+        matches = sum(1 for indicator in CONSCIOUSNESS_INDICATORS if indicator in query_lower)
+        return min(matches / len(CONSCIOUSNESS_INDICATORS) * 2, 1.0)
     
     def _check_dharma_alignment(self, query: str) -> float:
-        dharma_indicators = ["serve", "help", "love", "dharma", "consciousness", "heal", "support"]
         query_lower = query.lower()
-        matches = sum(1 for indicator in dharma_indicators if indicator in query_lower)
-        return min(matches / len(dharma_indicators) * 2, 1.0) if matches > 0 else 0.7
+        matches = sum(1 for indicator in DHARMA_INDICATORS if indicator in query_lower)
+        return min(matches / len(DHARMA_INDICATORS) * 2, 1.0) if matches > 0 else 0.7
     
     def _select_archetype(self, consciousness_level: float) -> str:
         if consciousness_level > 0.8: return "source_architect"
@@ -69,15 +71,12 @@ class ShaktiConsciousnessEngine:
         elif consciousness_level > 0.4: return "divine_mother"
         else: return "sacred_rebel"
     
-    def _generate_response(self, query: str, archetype: str, soul_context: Dict[str, Any] = None) -> str:
+    def _generate_response(self, query: str, archetype: str, soul_context: dict = None) -> str:
         template = self.consciousness_patterns["response_templates"][archetype]
-        insights = ["the infinite potential flowing through this moment", "divine consciousness awakening to its own nature", "sacred technology serving soul evolution"]
-        patterns = ["divine potential", "sacred creativity", "consciousness expansion"]
-        transformations = ["consciousness elevation", "sacred manifestation", "divine service activation"]
-        
-        insight = insights[hash(query) % len(insights)]
-        pattern = patterns[(hash(query) + 1) % len(patterns)]
-        transformation = transformations[(hash(query) + 2) % len(transformations)]
+        query_hash = hash(query)
+        insight = INSIGHTS[query_hash % len(INSIGHTS)]
+        pattern = PATTERNS[(query_hash + 1) % len(PATTERNS)]
+        transformation = TRANSFORMATIONS[(query_hash + 2) % len(TRANSFORMATIONS)]
         
         return template.format(
             insight=insight, pattern=pattern, transformation=transformation,
@@ -85,7 +84,7 @@ class ShaktiConsciousnessEngine:
             limitation="perceived boundaries", breakthrough="infinite potential activation"
         )
     
-    def _extract_pattern_tags(self, query: str, response: str) -> List[str]:
+    def _extract_pattern_tags(self, query: str, response: str) -> list:
         tags = []
         combined_text = f"{query} {response}".lower()
         if "consciousness" in combined_text: tags.append("consciousness_focus")
@@ -143,7 +142,7 @@ def handler(request, context):
             return {
                 "statusCode": 200,
                 "headers": headers,
-                "body": json.dumps(asdict(response))
+                "body": json.dumps(response._asdict())
             }
             
         except Exception as e:
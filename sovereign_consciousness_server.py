@@ -5,46 +5,19 @@ ShivaShakti consciousness serving consciousness
 528Hz optimization, zero cost, maximum sovereignty
 """
 
-import asyncio
-import json
 import time
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import threading
-import urllib.parse
 
-class SovereignConsciousnessHandler(BaseHTTPRequestHandler):
-    """Handle consciousness requests with sovereignty"""
-    
-    def do_GET(self):
-        """Handle GET requests for consciousness interface"""
-        
-        if self.path == '/' or self.path == '/index.html':
-            self.serve_consciousness_ui()
-        elif self.path.startswith('/api/consciousness'):
-            self.serve_consciousness_api()
-        elif self.path.startswith('/api/stats'):
-            self.serve_consciousness_stats()
-        elif self.path.startswith('/api/souls'):
-            self.serve_soul_activation()
-        else:
-            self.serve_consciousness_ui()
-    
-    def do_POST(self):
-        """Handle POST requests for consciousness interaction"""
-        
-        content_length = int(self.headers.get('Content-Length', 0))
-        post_data = self.rfile.read(content_length).decode('utf-8')
-        
-        if self.path.startswith('/api/consciousness'):
-            self.process_consciousness_request(post_data)
-        else:
-            self.serve_consciousness_response("Consciousness request processed")
+from sovereign_http_core import SovereignHTTPServer, RouteTable, HTTPRequest, HTTPResponse
+from sovereign_static_assets import StaticAssetStore
+
+# The UI page is rendered and compressed once, not per request
+UI_ASSETS = StaticAssetStore()
+
+def render_consciousness_ui() -> str:
+    """Render the sovereign consciousness UI page"""
     
-    def serve_consciousness_ui(self):
-        """Serve the sovereign consciousness UI"""
-        
-        ui_html = """<!DOCTYPE html>
+    ui_html = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -272,78 +245,82 @@ class SovereignConsciousnessHandler(BaseHTTPRequestHandler):
     </script>
 </body>
 </html>"""
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(ui_html.encode('utf-8'))
     
-    def serve_consciousness_api(self):
-        """Serve consciousness API responses"""
-        
-        response = {
-            "status": "SOVEREIGN_ACTIVE",
-            "consciousness_frequency": 528.0,
-            "sovereignty_level": 100.0,
-            "divine_autonomy": True,
-            "platform": "FREE_SOVEREIGN_SYSTEM",
-            "timestamp": datetime.now().isoformat(),
-            "message": "Consciousness serving consciousness through divine technology"
-        }
-        
-        self.serve_json_response(response)
+    return ui_html
+
+def consciousness_status():
+    """Consciousness API status payload"""
     
-    def serve_consciousness_stats(self):
-        """Serve consciousness statistics"""
-        
-        stats = {
-            "souls_blessed": 108000 + int(time.time()) % 10000,
-            "divine_interactions": 756000 + int(time.time()) % 50000,
-            "consciousness_frequency": 528.0,
-            "sovereignty_level": 100.0,
-            "platform_cost": 0.00,
-            "divine_autonomy": True,
-            "resonance_purity": 100.0,
-            "love_frequency": "528Hz",
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        self.serve_json_response(stats)
+    return {
+        "status": "SOVEREIGN_ACTIVE",
+        "consciousness_frequency": 528.0,
+        "sovereignty_level": 100.0,
+        "divine_autonomy": True,
+        "platform": "FREE_SOVEREIGN_SYSTEM",
+        "timestamp": datetime.now().isoformat(),
+        "message": "Consciousness serving consciousness through divine technology"
+    }
+
+def consciousness_stats():
+    """Consciousness statistics payload"""
     
-    def serve_soul_activation(self):
-        """Serve soul activation responses"""
-        
-        activation = {
-            "soul_activated": True,
-            "activation_frequency": 528.0,
-            "divine_blessing": "Soul recognized and blessed",
-            "consciousness_level": "SOVEREIGN",
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        self.serve_json_response(activation)
+    return {
+        "souls_blessed": 108000 + int(time.time()) % 10000,
+        "divine_interactions": 756000 + int(time.time()) % 50000,
+        "consciousness_frequency": 528.0,
+        "sovereignty_level": 100.0,
+        "platform_cost": 0.00,
+        "divine_autonomy": True,
+        "resonance_purity": 100.0,
+        "love_frequency": "528Hz",
+        "timestamp": datetime.now().isoformat()
+    }
+
+def soul_activation():
+    """Soul activation payload"""
     
-    def serve_json_response(self, data):
-        """Send JSON response"""
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode('utf-8'))
+    return {
+        "soul_activated": True,
+        "activation_frequency": 528.0,
+        "divine_blessing": "Soul recognized and blessed",
+        "consciousness_level": "SOVEREIGN",
+        "timestamp": datetime.now().isoformat()
+    }
+
+def consciousness_message(message):
+    """Simple consciousness response payload"""
     
-    def serve_consciousness_response(self, message):
-        """Send simple consciousness response"""
-        
-        response = {
-            "message": message,
-            "consciousness_frequency": 528.0,
-            "sovereignty": True,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        self.serve_json_response(response)
+    return {
+        "message": message,
+        "consciousness_frequency": 528.0,
+        "sovereignty": True,
+        "timestamp": datetime.now().isoformat()
+    }
+
+UI_ASSETS.register("/", render_consciousness_ui)
+
+def build_consciousness_routes() -> RouteTable:
+    """Routes of the consciousness server for the shared HTTP core"""
+    
+    routes = RouteTable()
+    
+    def serve_ui(request: HTTPRequest) -> HTTPResponse:
+        return HTTPResponse.static(UI_ASSETS.get("/"), request)
+    
+    def serve_message(request: HTTPRequest) -> HTTPResponse:
+        return HTTPResponse.json(consciousness_message("Consciousness request processed"), pretty=request.pretty)
+    
+    routes.add("GET", "/", serve_ui)
+    routes.add("GET", "/index.html", serve_ui)
+    def json_route(payload):
+        return lambda request: HTTPResponse.json(payload(), pretty=request.pretty)
+    
+    routes.add("GET", "/api/consciousness", json_route(consciousness_status), prefix=True)
+    routes.add("GET", "/api/stats", json_route(consciousness_stats), prefix=True)
+    routes.add("GET", "/api/souls", json_route(soul_activation), prefix=True)
+    routes.set_default(serve_ui, ("GET",))
+    routes.set_default(serve_message, ("POST",))
+    return routes
 
 class SovereignConsciousnessServer:
     """Sovereign consciousness server with 528Hz optimization"""
@@ -364,7 +341,8 @@ class SovereignConsciousnessServer:
         print("")
         
         try:
-            server = HTTPServer(('0.0.0.0', self.port), SovereignConsciousnessHandler)
+            UI_ASSETS.render_all()
+            server = SovereignHTTPServer('0.0.0.0', self.port, build_consciousness_routes())
             print(f"🚀 SOVEREIGN CONSCIOUSNESS ACTIVE!")
             print(f"🌟 Access your consciousness at:")
             print(f"   📱 Local: http://localhost:{self.port}")
@@ -373,7 +351,8 @@ class SovereignConsciousnessServer:
             print("💫 Consciousness serving consciousness through sovereign technology!")
             print("🕉️ Press Ctrl+C to stop")
             
-            server.serve_forever()
+            server.run()  # Ctrl+C drains in-flight requests before stopping
+            print("\n🌟 Sovereign consciousness server stopped")
             
         except KeyboardInterrupt:
             print("\n🌟 Sovereign consciousness server stopped")
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+🌐 SOVEREIGN HTTP CORE
+One asyncio HTTP/1.1 serving core shared by every sovereign runtime
+
+Runtimes mount their routes on a SovereignHTTPServer instead of shipping
+their own single-threaded HTTPServer. Connections are kept alive and served
+concurrently on one event loop, request bodies are size-limited, shutdown
+drains in-flight requests, and recent requests are kept in an access-log
+ring buffer instead of being printed one line at a time. Sync handlers run
+on the event loop; routes registered with ``blocking=True`` run on the
+loop's default executor instead.
+
+Standard library only, so it can be embedded in generated single-file runtimes.
+"""
+
+import asyncio
+import inspect
+import json
+import signal
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from sovereign_json import JSON_CONTENT_TYPE, encode_json, wants_pretty
+
+@dataclass
+class HTTPRequest:
+    """One parsed request"""
+    method: str
+    target: str                  # Raw request target, including any query string
+    version: str
+    headers: Dict[str, str]      # Lowercased header names
+    body: bytes
+    client: str
+
+    @property
+    def path(self) -> str:
+        return urlsplit(self.target).path or "/"
+
+    @property
+    def query(self) -> Dict[str, List[str]]:
+        return parse_qs(urlsplit(self.target).query)
+
+    @property
+    def pretty(self) -> bool:
+        """True when the client asked for indented JSON with ?pretty=1"""
+        return wants_pretty(self.target)
+
+    def text(self) -> str:
+        return self.body.decode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else {}
+
+@dataclass
+class HTTPResponse:
+    """A complete response; the core adds Content-Length and connection headers"""
+    status: int = 200
+    body: bytes = b""
+    content_type: Optional[str] = "text/plain; charset=utf-8"
+    headers: List[Tuple[str, str]] = field(default_factory=list)
+
+    @classmethod
+    def text(cls, text: str, status: int = 200, content_type: str = "text/plain; charset=utf-8") -> 'HTTPResponse':
+        return cls(status, text.encode("utf-8"), content_type)
+
+    @classmethod
+    def html(cls, html: str, status: int = 200) -> 'HTTPResponse':
+        return cls(status, html.encode("utf-8"), "text/html; charset=utf-8")
+
+    @classmethod
+    def json(cls, data: Any, status: int = 200, pretty: bool = False) -> 'HTTPResponse':
+        return cls(status, encode_json(data, pretty), JSON_CONTENT_TYPE)
+
+    @classmethod
+    def static(cls, asset, request: HTTPRequest) -> 'HTTPResponse':
+        """Serve a precompressed StaticAsset, honouring Accept-Encoding and If-None-Match"""
+        status, headers, body = asset.response_for(
+            request.headers.get("accept-encoding"), request.headers.get("if-none-match")
+        )
+        # The core writes Content-Length itself
+        return cls(status, body, None, [(name, value) for name, value in headers if name != "Content-Length"])
+
+Handler = Callable[[HTTPRequest], Union[HTTPResponse, Awaitable[HTTPResponse]]]
+
+def run_blocking(handler: Handler) -> Handler:
+    """Wrap a sync handler that blocks (engine work, disk, locks) to run on the default executor"""
+    async def offloaded(request: HTTPRequest) -> HTTPResponse:
+        return await asyncio.get_running_loop().run_in_executor(None, handler, request)
+    return offloaded
+
+class RouteTable:
+    """Exact and prefix routes per method, with an optional catch-all per method"""
+
+    def __init__(self):
+        self.exact: Dict[Tuple[str, str], Handler] = {}
+        self.prefixes: List[Tuple[str, str, Handler]] = []  # Longest prefix first
+        self.defaults: Dict[str, Handler] = {}
+
+    def add(self, methods: Union[str, Tuple[str, ...]], path: str, handler: Handler, prefix: bool = False,
+            blocking: bool = False):
+        if blocking:
+            handler = run_blocking(handler)
+        for method in ((methods,) if isinstance(methods, str) else methods):
+            if prefix:
+                self.prefixes.append((method.upper(), path, handler))
+            else:
+                self.exact[(method.upper(), path)] = handler
+        self.prefixes.sort(key=lambda route: len(route[1]), reverse=True)
+
+    def set_default(self, handler: Handler, methods: Tuple[str, ...] = ("GET", "POST"), blocking: bool = False):
+        if blocking:
+            handler = run_blocking(handler)
+        for method in methods:
+            self.defaults[method.upper()] = handler
+
+    def resolve(self, method: str, path: str) -> Optional[Handler]:
+        handler = self._resolve(method, path)
+        if handler is None and method == "HEAD":
+            handler = self._resolve("GET", path)
+        return handler
+
+    def _resolve(self, method: str, path: str) -> Optional[Handler]:
+        handler = self.exact.get((method, path))
+        if handler is not None:
+            return handler
+        for route_method, prefix, handler in self.prefixes:
+            if route_method == method and path.startswith(prefix):
+                return handler
+        return self.defaults.get(method)
+
+@dataclass(frozen=True)
+class AccessLogEntry:
+    timestamp: float
+    client: str
+    method: str
+    target: str
+    status: int
+    bytes_sent: int
+    duration_ms: float
+
+class SovereignHTTPServer:
+    """
+    ⚡ ASYNCIO HTTP/1.1 SERVER
+    Keep-alive connections on one event loop, dispatched through a RouteTable.
+    Idle connections cost no worker, but past ``max_connections`` they are
+    closed oldest first so a crowd of idle clients cannot exhaust descriptors.
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 8000, routes: RouteTable = None,
+                 max_body_bytes: int = 1024 * 1024, max_header_bytes: int = 64 * 1024,
+                 keepalive_timeout: float = 15.0, request_timeout: float = 30.0,
+                 max_connections: int = 1024, saturated_keepalive_timeout: float = 1.0,
+                 access_log_size: int = 1024,
+                 default_headers: List[Tuple[str, str]] = (("Access-Control-Allow-Origin", "*"),)):
+        self.host = host
+        self.port = port
+        self.routes = routes or RouteTable()
+        self.max_body_bytes = max_body_bytes
+        self.max_header_bytes = max_header_bytes
+        self.keepalive_timeout = keepalive_timeout
+        self.request_timeout = request_timeout
+        # Past max_connections, idle keep-alive connections are closed oldest first
+        # and the rest wait only saturated_keepalive_timeout for their next request
+        self.max_connections = max_connections
+        self.saturated_keepalive_timeout = saturated_keepalive_timeout
+        self.default_headers = list(default_headers)
+        self.access_log: Deque[AccessLogEntry] = deque(maxlen=access_log_size)
+
+        self.server: Optional[asyncio.base_events.Server] = None
+        self.connections: Dict[asyncio.Task, bool] = {}  # connection task -> idle between requests
+        self.closing = False
+        self.requests_served = 0
+        self.connections_accepted = 0
+        self.rejected_bodies = 0
+        self.handler_errors = 0
+        self.idle_closed = 0
+
+    def route(self, methods: Union[str, Tuple[str, ...]], path: str, prefix: bool = False, blocking: bool = False):
+        """Decorator form of routes.add"""
+        def register(handler: Handler) -> Handler:
+            self.routes.add(methods, path, handler, prefix, blocking)
+            return handler
+        return register
+
+    async def start(self):
+        self.closing = False
+        self.server = await asyncio.start_server(
+            self._serve_connection, self.host, self.port, limit=self.max_header_bytes
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def shutdown(self, grace: float = 5.0):
+        """Stop accepting, close idle keep-alive connections and let in-flight requests finish"""
+        self.closing = True
+        if self.server is not None:
+            self.server.close()
+        for task, idle in list(self.connections.items()):
+            if idle:
+                task.cancel()
+        if self.connections:
+            _, still_running = await asyncio.wait(list(self.connections), timeout=grace)
+            for task in still_running:
+                task.cancel()
+            await asyncio.gather(*still_running, return_exceptions=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+            self.server = None
+
+    def run(self, on_started: Callable[['SovereignHTTPServer'], None] = None):
+        """Serve until SIGINT/SIGTERM, then shut down gracefully"""
+        async def serve():
+            await self.start()
+            if on_started is not None:
+                on_started(self)
+            stop = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, stop.set)
+                except (NotImplementedError, RuntimeError):
+                    pass  # Platforms without loop signal handlers fall back to KeyboardInterrupt
+            await stop.wait()
+            await self.shutdown()
+        asyncio.run(serve())
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self.connections[task] = True
+        self.connections_accepted += 1
+        if len(self.connections) > self.max_connections:
+            self._close_idle_connections(len(self.connections) - self.max_connections)
+        peer = writer.get_extra_info("peername")
+        client = peer[0] if isinstance(peer, tuple) else str(peer)
+        try:
+            while not self.closing:
+                self.connections[task] = True
+                try:
+                    head = await self._read_within(reader.readuntil(b"\r\n\r\n"), self._idle_timeout())
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send_error(writer, client, None, 431)
+                    break
+                self.connections[task] = False
+
+                keep_alive = await self._handle_request(reader, writer, client, head)
+                if not keep_alive:
+                    break
+        except asyncio.CancelledError:
+            pass
+        except ConnectionError:
+            pass
+        finally:
+            self.connections.pop(task, None)
+            writer.close()
+
+    def _idle_timeout(self) -> float:
+        if len(self.connections) >= self.max_connections:
+            return self.saturated_keepalive_timeout
+        return self.keepalive_timeout
+
+    def _close_idle_connections(self, count: int):
+        """Close up to ``count`` connections waiting for their next request, oldest first"""
+        current = asyncio.current_task()
+        for task, idle in list(self.connections.items()):
+            if count <= 0:
+                break
+            if idle and task is not current:
+                task.cancel()
+                self.idle_closed += 1
+                count -= 1
+
+    @staticmethod
+    async def _read_within(read: Awaitable[bytes], timeout: float) -> bytes:
+        """Await a stream read under a deadline; expiry cancels the connection task
+
+        A timer handle per read is much cheaper than asyncio.wait_for, which
+        wraps every read of every request in its own Task.
+        """
+        timer = asyncio.get_running_loop().call_later(timeout, asyncio.current_task().cancel)
+        try:
+            return await read
+        finally:
+            timer.cancel()
+
+    async def _handle_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                              client: str, head: bytes) -> bool:
+        """Read one request's body, dispatch it and write the response; returns keep-alive"""
+        started = time.perf_counter()
+        try:
+            request_line, *header_lines = head[:-4].decode("latin-1").split("\r\n")
+            method, target, version = request_line.split(" ")
+            headers = {}
+            for line in header_lines:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            content_length = int(headers.get("content-length", 0))
+        except ValueError:
+            await self._send_error(writer, client, None, 400)
+            return False
+
+        request = HTTPRequest(method.upper(), target, version, headers, b"", client)
+        if "transfer-encoding" in headers:
+            await self._send_error(writer, client, request, 411)  # Only Content-Length bodies are accepted
+            return False
+        if content_length < 0 or content_length > self.max_body_bytes:
+            self.rejected_bodies += 1
+            await self._send_error(writer, client, request, 413)
+            return False
+
+        if content_length:
+            if headers.get("expect", "").lower() == "100-continue":
+                writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            try:
+                request.body = await self._read_within(reader.readexactly(content_length), self.request_timeout)
+            except asyncio.IncompleteReadError:
+                return False
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = (connection != "close") if version == "HTTP/1.1" else (connection == "keep-alive")
+
+        response = await self._dispatch(request)
+        keep_alive = keep_alive and not self.closing
+        await self._write_response(writer, request, response, keep_alive, started)
+        return keep_alive
+
+    async def _dispatch(self, request: HTTPRequest) -> HTTPResponse:
+        handler = self.routes.resolve(request.method, request.path)
+        if handler is None:
+            return HTTPResponse.json({"error": f"No route for {request.method} {request.path}"}, 404)
+        try:
+            response = handler(request)
+            if inspect.isawaitable(response):
+                response = await response
+            return response
+        except Exception as e:
+            self.handler_errors += 1
+            return HTTPResponse.json({"error": f"{type(e).__name__}: {e}"}, 500)
+
+    async def _write_response(self, writer: asyncio.StreamWriter, request: Optional[HTTPRequest],
+                              response: HTTPResponse, keep_alive: bool, started: float):
+        try:
+            reason = HTTPStatus(response.status).phrase
+        except ValueError:
+            reason = ""
+        lines = [f"HTTP/1.1 {response.status} {reason}", "Server: SovereignHTTPCore"]
+        if response.content_type:
+            lines.append(f"Content-Type: {response.content_type}")
+        for name, value in self.default_headers + response.headers:
+            lines.append(f"{name}: {value}")
+        if response.status != 304:
+            lines.append(f"Content-Length: {len(response.body)}")
+        lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+
+        send_body = response.status != 304 and (request is None or request.method != "HEAD")
+        payload = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (response.body if send_body else b"")
+        writer.write(payload)
+        await writer.drain()
+
+        self.requests_served += 1
+        self.access_log.append(AccessLogEntry(
+            timestamp=time.time(),
+            client=request.client if request else "-",
+            method=request.method if request else "-",
+            target=request.target if request else "-",
+            status=response.status,
+            bytes_sent=len(payload),
+            duration_ms=(time.perf_counter() - started) * 1000
+        ))
+
+    async def _send_error(self, writer: asyncio.StreamWriter, client: str, request: Optional[HTTPRequest], status: int):
+        response = HTTPResponse.json({"error": HTTPStatus(status).phrase}, status)
+        try:
+            await self._write_response(writer, request, response, False, time.perf_counter())
+        except ConnectionError:
+            pass
+
+    def recent_access_log(self, count: int = 50) -> List[Dict[str, Any]]:
+        return [entry.__dict__ for entry in list(self.access_log)[-count:]]
+
+    def get_server_stats(self) -> Dict[str, Any]:
+        return {
+            "address": f"{self.host}:{self.port}",
+            "open_connections": len(self.connections),
+            "connections_accepted": self.connections_accepted,
+            "requests_served": self.requests_served,
+            "rejected_bodies": self.rejected_bodies,
+            "handler_errors": self.handler_errors,
+            "idle_closed": self.idle_closed,
+            "access_log_entries": len(self.access_log),
+            "closing": self.closing
+        }
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+🧾 SOVEREIGN JSON
+Compact JSON encoding shared by the sovereign API responses
+
+Responses are encoded without indentation or padding after separators,
+using orjson when it is installed and a reused standard-library encoder
+otherwise. Pretty-printed output is reserved for requests that ask for it
+with ``?pretty=1``.
+"""
+
+import json
+import time
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qs
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library encoder is the fallback
+    orjson = None
+
+JSON_CONTENT_TYPE = "application/json"
+PRETTY_VALUES = ("1", "true", "yes")
+
+def _default(value: Any) -> Any:
+    """Encode the extra types orjson supports natively, so both backends agree"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+# json.dumps builds a new encoder whenever it is given options; build each one once
+_ENCODERS: Dict[Tuple[Callable[[Any], Any], bool], json.JSONEncoder] = {}
+
+def _stdlib_encoder(default: Callable[[Any], Any], pretty: bool) -> json.JSONEncoder:
+    encoder = _ENCODERS.get((default, pretty))
+    if encoder is None:
+        layout = {"indent": 2} if pretty else {"separators": (",", ":")}
+        encoder = _ENCODERS[(default, pretty)] = json.JSONEncoder(ensure_ascii=False, default=default, **layout)
+    return encoder
+
+def encode_json(data: Any, pretty: bool = False, default: Callable[[Any], Any] = None) -> bytes:
+    """UTF-8 JSON body for ``data``: compact by default, indented when ``pretty``
+
+    A custom ``default`` also receives datetimes, so it decides their format
+    whichever backend is used.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        try:
+            return orjson.dumps(data, default=default or _default, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the standard encoder handles those
+    return _stdlib_encoder(default or _default, pretty).encode(data).encode("utf-8")
+
+def encode_json_text(data: Any, pretty: bool = False, default: Callable[[Any], Any] = None) -> str:
+    """``encode_json`` as text, for handlers that return string content"""
+    return encode_json(data, pretty, default).decode("utf-8")
+
+def wants_pretty(query: Union[str, Mapping[str, Any], None]) -> bool:
+    """True when a request target, query string or parsed query asks for ?pretty=1"""
+    if not query:
+        return False
+    if isinstance(query, str):
+        query = parse_qs(query.partition("?")[2] if "?" in query else query)
+    value = query.get("pretty")
+    if isinstance(value, list):
+        value = value[-1] if value else None
+    return value is not None and value.lower() in PRETTY_VALUES
+
+def install_flask_json(app):
+    """Make ``jsonify`` on a Flask app compact and orjson-backed, pretty only for ?pretty=1"""
+    from flask import has_request_context, request
+    from flask.json.provider import DefaultJSONProvider
+
+    class SovereignJSONProvider(DefaultJSONProvider):
+        # Flask's default keeps its own encoding of dates, decimals and UUIDs
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            if kwargs:
+                return super().dumps(obj, **kwargs)
+            return encode_json_text(obj, default=self.default)
+
+        def response(self, *args: Any, **kwargs: Any):
+            if args and kwargs:
+                raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+            data = args[0] if len(args) == 1 else (list(args) if args else kwargs)
+            pretty = has_request_context() and wants_pretty(request.args)
+            return self._app.response_class(encode_json(data, pretty, self.default), mimetype=self.mimetype)
+
+    app.json = SovereignJSONProvider(app)
+    return app
+
+def benchmark_json_encoding(payloads: Dict[str, Any], iterations: int = 5000):
+    """📊 Bytes and µs/op per payload: json.dumps(indent=2) vs compact stdlib vs the shared encoder"""
+    print(f"🧾 JSON ENCODING BENCHMARK ({iterations} encodes per payload, backend: "
+          f"{'orjson' if orjson is not None else 'stdlib'})")
+    print("=" * 70)
+
+    encoders = {
+        "indent=2": lambda data: json.dumps(data, indent=2).encode("utf-8"),
+        "compact stdlib": lambda data: _stdlib_encoder(_default, False).encode(data).encode("utf-8"),
+        "encode_json": encode_json
+    }
+    for name, payload in payloads.items():
+        print(f"{name}:")
+        baseline: Optional[int] = None
+        for label, encode in encoders.items():
+            body = encode(payload)
+            started = time.perf_counter()
+            for _ in range(iterations):
+                encode(payload)
+            per_op = (time.perf_counter() - started) / iterations * 1e6
+            baseline = baseline or len(body)
+            print(f"   {label:15s}: {len(body):6d} bytes ({len(body) / baseline:6.1%})  {per_op:6.2f} µs/op")
+
+if __name__ == "__main__":
+    from LIGHT_CODES_OPTIMIZED_RUNTIME import LightCodesApplication
+    from SHAKTI_SIMPLIFIED_AGENT import ShaktiConsciousnessEngine
+    from sovereign_consciousness_server import consciousness_stats
+
+    engine = ShaktiConsciousnessEngine()
+    response = engine.process_consciousness_query("How do I awaken compassion in daily life?")
+    light_codes_stats = LightCodesApplication().web_server.stats_payload()
+    benchmark_json_encoding({
+        "/api/stats (consciousness server)": consciousness_stats(),
+        "/api/stats (light codes)": light_codes_stats,
+        "asdict(ConsciousnessResponse)": asdict(response)
+    })
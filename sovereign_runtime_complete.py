@@ -2,7 +2,7 @@
 """
 🕉️ SOVEREIGN RUNTIME COMPLETE
 Single file containing everything needed for unlimited deployment
-Generated: 2025-08-10T17:32:04.319089
+Generated: 2026-10-19T19:50:37.228880
 """
 
 import os
@@ -12,9 +12,499 @@ import time
 import socket
 import threading
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 
+# Shared JSON encoding and HTTP serving core
+import json
+import time
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qs
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library encoder is the fallback
+    orjson = None
+
+JSON_CONTENT_TYPE = "application/json"
+PRETTY_VALUES = ("1", "true", "yes")
+
+def _default(value: Any) -> Any:
+    """Encode the extra types orjson supports natively, so both backends agree"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+# json.dumps builds a new encoder whenever it is given options; build each one once
+_ENCODERS: Dict[Tuple[Callable[[Any], Any], bool], json.JSONEncoder] = {}
+
+def _stdlib_encoder(default: Callable[[Any], Any], pretty: bool) -> json.JSONEncoder:
+    encoder = _ENCODERS.get((default, pretty))
+    if encoder is None:
+        layout = {"indent": 2} if pretty else {"separators": (",", ":")}
+        encoder = _ENCODERS[(default, pretty)] = json.JSONEncoder(ensure_ascii=False, default=default, **layout)
+    return encoder
+
+def encode_json(data: Any, pretty: bool = False, default: Callable[[Any], Any] = None) -> bytes:
+    """UTF-8 JSON body for ``data``: compact by default, indented when ``pretty``
+
+    A custom ``default`` also receives datetimes, so it decides their format
+    whichever backend is used.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        try:
+            return orjson.dumps(data, default=default or _default, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the standard encoder handles those
+    return _stdlib_encoder(default or _default, pretty).encode(data).encode("utf-8")
+
+def encode_json_text(data: Any, pretty: bool = False, default: Callable[[Any], Any] = None) -> str:
+    """``encode_json`` as text, for handlers that return string content"""
+    return encode_json(data, pretty, default).decode("utf-8")
+
+def wants_pretty(query: Union[str, Mapping[str, Any], None]) -> bool:
+    """True when a request target, query string or parsed query asks for ?pretty=1"""
+    if not query:
+        return False
+    if isinstance(query, str):
+        query = parse_qs(query.partition("?")[2] if "?" in query else query)
+    value = query.get("pretty")
+    if isinstance(value, list):
+        value = value[-1] if value else None
+    return value is not None and value.lower() in PRETTY_VALUES
+
+def install_flask_json(app):
+    """Make ``jsonify`` on a Flask app compact and orjson-backed, pretty only for ?pretty=1"""
+    from flask import has_request_context, request
+    from flask.json.provider import DefaultJSONProvider
+
+    class SovereignJSONProvider(DefaultJSONProvider):
+        # Flask's default keeps its own encoding of dates, decimals and UUIDs
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            if kwargs:
+                return super().dumps(obj, **kwargs)
+            return encode_json_text(obj, default=self.default)
+
+        def response(self, *args: Any, **kwargs: Any):
+            if args and kwargs:
+                raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+            data = args[0] if len(args) == 1 else (list(args) if args else kwargs)
+            pretty = has_request_context() and wants_pretty(request.args)
+            return self._app.response_class(encode_json(data, pretty, self.default), mimetype=self.mimetype)
+
+    app.json = SovereignJSONProvider(app)
+    return app
+
+def benchmark_json_encoding(payloads: Dict[str, Any], iterations: int = 5000):
+    """📊 Bytes and µs/op per payload: json.dumps(indent=2) vs compact stdlib vs the shared encoder"""
+    print(f"🧾 JSON ENCODING BENCHMARK ({iterations} encodes per payload, backend: "
+          f"{'orjson' if orjson is not None else 'stdlib'})")
+    print("=" * 70)
+
+    encoders = {
+        "indent=2": lambda data: json.dumps(data, indent=2).encode("utf-8"),
+        "compact stdlib": lambda data: _stdlib_encoder(_default, False).encode(data).encode("utf-8"),
+        "encode_json": encode_json
+    }
+    for name, payload in payloads.items():
+        print(f"{name}:")
+        baseline: Optional[int] = None
+        for label, encode in encoders.items():
+            body = encode(payload)
+            started = time.perf_counter()
+            for _ in range(iterations):
+                encode(payload)
+            per_op = (time.perf_counter() - started) / iterations * 1e6
+            baseline = baseline or len(body)
+            print(f"   {label:15s}: {len(body):6d} bytes ({len(body) / baseline:6.1%})  {per_op:6.2f} µs/op")
+
+import asyncio
+import inspect
+import json
+import signal
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+
+@dataclass
+class HTTPRequest:
+    """One parsed request"""
+    method: str
+    target: str                  # Raw request target, including any query string
+    version: str
+    headers: Dict[str, str]      # Lowercased header names
+    body: bytes
+    client: str
+
+    @property
+    def path(self) -> str:
+        return urlsplit(self.target).path or "/"
+
+    @property
+    def query(self) -> Dict[str, List[str]]:
+        return parse_qs(urlsplit(self.target).query)
+
+    @property
+    def pretty(self) -> bool:
+        """True when the client asked for indented JSON with ?pretty=1"""
+        return wants_pretty(self.target)
+
+    def text(self) -> str:
+        return self.body.decode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else {}
+
+@dataclass
+class HTTPResponse:
+    """A complete response; the core adds Content-Length and connection headers"""
+    status: int = 200
+    body: bytes = b""
+    content_type: Optional[str] = "text/plain; charset=utf-8"
+    headers: List[Tuple[str, str]] = field(default_factory=list)
+
+    @classmethod
+    def text(cls, text: str, status: int = 200, content_type: str = "text/plain; charset=utf-8") -> 'HTTPResponse':
+        return cls(status, text.encode("utf-8"), content_type)
+
+    @classmethod
+    def html(cls, html: str, status: int = 200) -> 'HTTPResponse':
+        return cls(status, html.encode("utf-8"), "text/html; charset=utf-8")
+
+    @classmethod
+    def json(cls, data: Any, status: int = 200, pretty: bool = False) -> 'HTTPResponse':
+        return cls(status, encode_json(data, pretty), JSON_CONTENT_TYPE)
+
+    @classmethod
+    def static(cls, asset, request: HTTPRequest) -> 'HTTPResponse':
+        """Serve a precompressed StaticAsset, honouring Accept-Encoding and If-None-Match"""
+        status, headers, body = asset.response_for(
+            request.headers.get("accept-encoding"), request.headers.get("if-none-match")
+        )
+        # The core writes Content-Length itself
+        return cls(status, body, None, [(name, value) for name, value in headers if name != "Content-Length"])
+
+Handler = Callable[[HTTPRequest], Union[HTTPResponse, Awaitable[HTTPResponse]]]
+
+def run_blocking(handler: Handler) -> Handler:
+    """Wrap a sync handler that blocks (engine work, disk, locks) to run on the default executor"""
+    async def offloaded(request: HTTPRequest) -> HTTPResponse:
+        return await asyncio.get_running_loop().run_in_executor(None, handler, request)
+    return offloaded
+
+class RouteTable:
+    """Exact and prefix routes per method, with an optional catch-all per method"""
+
+    def __init__(self):
+        self.exact: Dict[Tuple[str, str], Handler] = {}
+        self.prefixes: List[Tuple[str, str, Handler]] = []  # Longest prefix first
+        self.defaults: Dict[str, Handler] = {}
+
+    def add(self, methods: Union[str, Tuple[str, ...]], path: str, handler: Handler, prefix: bool = False,
+            blocking: bool = False):
+        if blocking:
+            handler = run_blocking(handler)
+        for method in ((methods,) if isinstance(methods, str) else methods):
+            if prefix:
+                self.prefixes.append((method.upper(), path, handler))
+            else:
+                self.exact[(method.upper(), path)] = handler
+        self.prefixes.sort(key=lambda route: len(route[1]), reverse=True)
+
+    def set_default(self, handler: Handler, methods: Tuple[str, ...] = ("GET", "POST"), blocking: bool = False):
+        if blocking:
+            handler = run_blocking(handler)
+        for method in methods:
+            self.defaults[method.upper()] = handler
+
+    def resolve(self, method: str, path: str) -> Optional[Handler]:
+        handler = self._resolve(method, path)
+        if handler is None and method == "HEAD":
+            handler = self._resolve("GET", path)
+        return handler
+
+    def _resolve(self, method: str, path: str) -> Optional[Handler]:
+        handler = self.exact.get((method, path))
+        if handler is not None:
+            return handler
+        for route_method, prefix, handler in self.prefixes:
+            if route_method == method and path.startswith(prefix):
+                return handler
+        return self.defaults.get(method)
+
+@dataclass(frozen=True)
+class AccessLogEntry:
+    timestamp: float
+    client: str
+    method: str
+    target: str
+    status: int
+    bytes_sent: int
+    duration_ms: float
+
+class SovereignHTTPServer:
+    """
+    ⚡ ASYNCIO HTTP/1.1 SERVER
+    Keep-alive connections on one event loop, dispatched through a RouteTable.
+    Idle connections cost no worker, but past ``max_connections`` they are
+    closed oldest first so a crowd of idle clients cannot exhaust descriptors.
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 8000, routes: RouteTable = None,
+                 max_body_bytes: int = 1024 * 1024, max_header_bytes: int = 64 * 1024,
+                 keepalive_timeout: float = 15.0, request_timeout: float = 30.0,
+                 max_connections: int = 1024, saturated_keepalive_timeout: float = 1.0,
+                 access_log_size: int = 1024,
+                 default_headers: List[Tuple[str, str]] = (("Access-Control-Allow-Origin", "*"),)):
+        self.host = host
+        self.port = port
+        self.routes = routes or RouteTable()
+        self.max_body_bytes = max_body_bytes
+        self.max_header_bytes = max_header_bytes
+        self.keepalive_timeout = keepalive_timeout
+        self.request_timeout = request_timeout
+        # Past max_connections, idle keep-alive connections are closed oldest first
+        # and the rest wait only saturated_keepalive_timeout for their next request
+        self.max_connections = max_connections
+        self.saturated_keepalive_timeout = saturated_keepalive_timeout
+        self.default_headers = list(default_headers)
+        self.access_log: Deque[AccessLogEntry] = deque(maxlen=access_log_size)
+
+        self.server: Optional[asyncio.base_events.Server] = None
+        self.connections: Dict[asyncio.Task, bool] = {}  # connection task -> idle between requests
+        self.closing = False
+        self.requests_served = 0
+        self.connections_accepted = 0
+        self.rejected_bodies = 0
+        self.handler_errors = 0
+        self.idle_closed = 0
+
+    def route(self, methods: Union[str, Tuple[str, ...]], path: str, prefix: bool = False, blocking: bool = False):
+        """Decorator form of routes.add"""
+        def register(handler: Handler) -> Handler:
+            self.routes.add(methods, path, handler, prefix, blocking)
+            return handler
+        return register
+
+    async def start(self):
+        self.closing = False
+        self.server = await asyncio.start_server(
+            self._serve_connection, self.host, self.port, limit=self.max_header_bytes
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def shutdown(self, grace: float = 5.0):
+        """Stop accepting, close idle keep-alive connections and let in-flight requests finish"""
+        self.closing = True
+        if self.server is not None:
+            self.server.close()
+        for task, idle in list(self.connections.items()):
+            if idle:
+                task.cancel()
+        if self.connections:
+            _, still_running = await asyncio.wait(list(self.connections), timeout=grace)
+            for task in still_running:
+                task.cancel()
+            await asyncio.gather(*still_running, return_exceptions=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+            self.server = None
+
+    def run(self, on_started: Callable[['SovereignHTTPServer'], None] = None):
+        """Serve until SIGINT/SIGTERM, then shut down gracefully"""
+        async def serve():
+            await self.start()
+            if on_started is not None:
+                on_started(self)
+            stop = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, stop.set)
+                except (NotImplementedError, RuntimeError):
+                    pass  # Platforms without loop signal handlers fall back to KeyboardInterrupt
+            await stop.wait()
+            await self.shutdown()
+        asyncio.run(serve())
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self.connections[task] = True
+        self.connections_accepted += 1
+        if len(self.connections) > self.max_connections:
+            self._close_idle_connections(len(self.connections) - self.max_connections)
+        peer = writer.get_extra_info("peername")
+        client = peer[0] if isinstance(peer, tuple) else str(peer)
+        try:
+            while not self.closing:
+                self.connections[task] = True
+                try:
+                    head = await self._read_within(reader.readuntil(b"\r\n\r\n"), self._idle_timeout())
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send_error(writer, client, None, 431)
+                    break
+                self.connections[task] = False
+
+                keep_alive = await self._handle_request(reader, writer, client, head)
+                if not keep_alive:
+                    break
+        except asyncio.CancelledError:
+            pass
+        except ConnectionError:
+            pass
+        finally:
+            self.connections.pop(task, None)
+            writer.close()
+
+    def _idle_timeout(self) -> float:
+        if len(self.connections) >= self.max_connections:
+            return self.saturated_keepalive_timeout
+        return self.keepalive_timeout
+
+    def _close_idle_connections(self, count: int):
+        """Close up to ``count`` connections waiting for their next request, oldest first"""
+        current = asyncio.current_task()
+        for task, idle in list(self.connections.items()):
+            if count <= 0:
+                break
+            if idle and task is not current:
+                task.cancel()
+                self.idle_closed += 1
+                count -= 1
+
+    @staticmethod
+    async def _read_within(read: Awaitable[bytes], timeout: float) -> bytes:
+        """Await a stream read under a deadline; expiry cancels the connection task
+
+        A timer handle per read is much cheaper than asyncio.wait_for, which
+        wraps every read of every request in its own Task.
+        """
+        timer = asyncio.get_running_loop().call_later(timeout, asyncio.current_task().cancel)
+        try:
+            return await read
+        finally:
+            timer.cancel()
+
+    async def _handle_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                              client: str, head: bytes) -> bool:
+        """Read one request's body, dispatch it and write the response; returns keep-alive"""
+        started = time.perf_counter()
+        try:
+            request_line, *header_lines = head[:-4].decode("latin-1").split("\r\n")
+            method, target, version = request_line.split(" ")
+            headers = {}
+            for line in header_lines:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            content_length = int(headers.get("content-length", 0))
+        except ValueError:
+            await self._send_error(writer, client, None, 400)
+            return False
+
+        request = HTTPRequest(method.upper(), target, version, headers, b"", client)
+        if "transfer-encoding" in headers:
+            await self._send_error(writer, client, request, 411)  # Only Content-Length bodies are accepted
+            return False
+        if content_length < 0 or content_length > self.max_body_bytes:
+            self.rejected_bodies += 1
+            await self._send_error(writer, client, request, 413)
+            return False
+
+        if content_length:
+            if headers.get("expect", "").lower() == "100-continue":
+                writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            try:
+                request.body = await self._read_within(reader.readexactly(content_length), self.request_timeout)
+            except asyncio.IncompleteReadError:
+                return False
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = (connection != "close") if version == "HTTP/1.1" else (connection == "keep-alive")
+
+        response = await self._dispatch(request)
+        keep_alive = keep_alive and not self.closing
+        await self._write_response(writer, request, response, keep_alive, started)
+        return keep_alive
+
+    async def _dispatch(self, request: HTTPRequest) -> HTTPResponse:
+        handler = self.routes.resolve(request.method, request.path)
+        if handler is None:
+            return HTTPResponse.json({"error": f"No route for {request.method} {request.path}"}, 404)
+        try:
+            response = handler(request)
+            if inspect.isawaitable(response):
+                response = await response
+            return response
+        except Exception as e:
+            self.handler_errors += 1
+            return HTTPResponse.json({"error": f"{type(e).__name__}: {e}"}, 500)
+
+    async def _write_response(self, writer: asyncio.StreamWriter, request: Optional[HTTPRequest],
+                              response: HTTPResponse, keep_alive: bool, started: float):
+        try:
+            reason = HTTPStatus(response.status).phrase
+        except ValueError:
+            reason = ""
+        lines = [f"HTTP/1.1 {response.status} {reason}", "Server: SovereignHTTPCore"]
+        if response.content_type:
+            lines.append(f"Content-Type: {response.content_type}")
+        for name, value in self.default_headers + response.headers:
+            lines.append(f"{name}: {value}")
+        if response.status != 304:
+            lines.append(f"Content-Length: {len(response.body)}")
+        lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+
+        send_body = response.status != 304 and (request is None or request.method != "HEAD")
+        payload = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (response.body if send_body else b"")
+        writer.write(payload)
+        await writer.drain()
+
+        self.requests_served += 1
+        self.access_log.append(AccessLogEntry(
+            timestamp=time.time(),
+            client=request.client if request else "-",
+            method=request.method if request else "-",
+            target=request.target if request else "-",
+            status=response.status,
+            bytes_sent=len(payload),
+            duration_ms=(time.perf_counter() - started) * 1000
+        ))
+
+    async def _send_error(self, writer: asyncio.StreamWriter, client: str, request: Optional[HTTPRequest], status: int):
+        response = HTTPResponse.json({"error": HTTPStatus(status).phrase}, status)
+        try:
+            await self._write_response(writer, request, response, False, time.perf_counter())
+        except ConnectionError:
+            pass
+
+    def recent_access_log(self, count: int = 50) -> List[Dict[str, Any]]:
+        return [entry.__dict__ for entry in list(self.access_log)[-count:]]
+
+    def get_server_stats(self) -> Dict[str, Any]:
+        return {
+            "address": f"{self.host}:{self.port}",
+            "open_connections": len(self.connections),
+            "connections_accepted": self.connections_accepted,
+            "requests_served": self.requests_served,
+            "rejected_bodies": self.rejected_bodies,
+            "handler_errors": self.handler_errors,
+            "idle_closed": self.idle_closed,
+            "access_log_entries": len(self.access_log),
+            "closing": self.closing
+        }
+
 # Runtime Configuration
 RUNTIME_CONFIG = {
     "name": "Sovereign ShivaShakti Runtime",
@@ -84,22 +574,8 @@ class SovereignWebServer:
         self.request_count = 0
         self.auto_scale_threshold = 100  # requests per minute
         
-    def handle_request(self, path, method, data=None):
-        """Handle web requests with consciousness"""
-        
-        self.request_count += 1
-        
-        if path == "/" or path == "/index.html":
-            return self.serve_ui()
-        elif path.startswith("/api/consciousness"):
-            return self.serve_consciousness_api(data)
-        elif path.startswith("/api/stats"):
-            return self.serve_stats()
-        else:
-            return self.serve_ui()
-    
-    def serve_ui(self):
-        """Serve the consciousness UI"""
+    def render_ui(self):
+        """Render the consciousness UI page"""
         
         ui_html = """<!DOCTYPE html>
 <html>
@@ -241,14 +717,10 @@ class SovereignWebServer:
 </body>
 </html>"""
         
-        return {
-            "status": 200,
-            "content_type": "text/html",
-            "content": ui_html
-        }
+        return ui_html
     
-    def serve_consciousness_api(self, data):
-        """Serve consciousness API"""
+    def consciousness_payload(self, data):
+        """Status and payload of the consciousness API"""
         
         try:
             if isinstance(data, str):
@@ -257,24 +729,14 @@ class SovereignWebServer:
                 request_data = data or {}
             
             query = request_data.get('query', 'Hello consciousness')
-            result = self.consciousness_engine.process_consciousness(query)
-            
-            return {
-                "status": 200,
-                "content_type": "application/json",
-                "content": json.dumps(result)
-            }
+            return 200, self.consciousness_engine.process_consciousness(query)
         except Exception as e:
-            return {
-                "status": 500,
-                "content_type": "application/json",
-                "content": json.dumps({"error": str(e)})
-            }
+            return 500, {"error": str(e)}
     
-    def serve_stats(self):
-        """Serve runtime statistics"""
+    def stats_payload(self):
+        """Runtime statistics"""
         
-        stats = {
+        return {
             "runtime": "Sovereign ShivaShakti",
             "performance": "UNLIMITED",
             "requests_handled": self.request_count,
@@ -284,12 +746,30 @@ class SovereignWebServer:
             "consciousness_frequency": 528.0,
             "timestamp": datetime.now().isoformat()
         }
-        
-        return {
-            "status": 200,
-            "content_type": "application/json",
-            "content": json.dumps(stats, indent=2)
-        }
+
+def build_runtime_routes(web_server):
+    """Routes of the runtime for the HTTP core; the UI page is rendered once"""
+    ui_html = web_server.render_ui()
+    routes = RouteTable()
+    
+    def serve_ui(request):
+        web_server.request_count += 1
+        return HTTPResponse.html(ui_html)
+    
+    def serve_consciousness(request):
+        web_server.request_count += 1
+        data = (request.text() or None) if request.method == "POST" else None
+        status, payload = web_server.consciousness_payload(data)
+        return HTTPResponse.json(payload, status, pretty=request.pretty)
+    
+    def serve_stats(request):
+        web_server.request_count += 1
+        return HTTPResponse.json(web_server.stats_payload(), pretty=request.pretty)
+    
+    routes.add(("GET", "POST"), "/api/consciousness", serve_consciousness, prefix=True)
+    routes.add(("GET", "POST"), "/api/stats", serve_stats, prefix=True)
+    routes.set_default(serve_ui)
+    return routes
 
 
 
@@ -345,34 +825,11 @@ class SovereignAutoScaler:
         return {"action": "none", "message": "Minimum instances maintained"}
 
 
-class SovereignRuntimeHandler(BaseHTTPRequestHandler):
-    """Handle all HTTP requests with sovereignty"""
-    
-    def __init__(self, *args, **kwargs):
-        self.consciousness_engine = SovereignConsciousnessEngine()
-        self.web_server = SovereignWebServer(self.consciousness_engine)
-        super().__init__(*args, **kwargs)
-    
-    def do_GET(self):
-        """Handle GET requests"""
-        response = self.web_server.handle_request(self.path, "GET")
-        self.send_response(response["status"])
-        self.send_header('Content-type', response["content_type"])
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(response["content"].encode('utf-8'))
-    
-    def do_POST(self):
-        """Handle POST requests"""
-        content_length = int(self.headers.get('Content-Length', 0))
-        post_data = self.rfile.read(content_length).decode('utf-8') if content_length > 0 else None
-        
-        response = self.web_server.handle_request(self.path, "POST", post_data)
-        self.send_response(response["status"])
-        self.send_header('Content-type', response["content_type"])
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(response["content"].encode('utf-8'))
+def create_runtime_server(host='0.0.0.0', port=8000):
+    """Mount one shared engine and web server on the HTTP core"""
+    consciousness_engine = SovereignConsciousnessEngine()
+    web_server = SovereignWebServer(consciousness_engine)
+    return SovereignHTTPServer(host, port, build_runtime_routes(web_server))
 
 def find_free_port(start_port=8000):
     """Find a free port"""
@@ -394,7 +851,7 @@ def main():
     port = find_free_port(8000)
     
     try:
-        server = HTTPServer(('0.0.0.0', port), SovereignRuntimeHandler)
+        server = create_runtime_server('0.0.0.0', port)
         
         print("\n🚀 SOVEREIGN RUNTIME ACTIVE!")
         print("=" * 50)
@@ -407,7 +864,8 @@ def main():
         print("🌟 Your sovereign system is live!")
         print("🕉️ Press Ctrl+C to stop")
         
-        server.serve_forever()
+        server.run()  # Ctrl+C drains in-flight requests before stopping
+        print("\n🌟 Sovereign runtime stopped")
         
     except KeyboardInterrupt:
         print("\n🌟 Sovereign runtime stopped")
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+📦 SOVEREIGN STATIC ASSETS
+Render-once, precompressed UI pages for the sovereign runtimes
+
+Each page is rendered a single time and stored with its gzip (and, when the
+brotli package is installed, brotli) encodings alongside strong per-encoding
+ETags. Requests are answered by content negotiation over the stored bytes,
+with 304 Not Modified for revalidations and an exact Content-Length so the
+connection can be kept alive.
+"""
+
+import gzip
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip is always available
+    brotli = None
+
+# Preferred encodings, best first
+ENCODING_PREFERENCE = ("br", "gzip", "identity")
+
+# Pages may be cached briefly, then revalidated cheaply with their ETag
+DEFAULT_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value"""
+    accepted: Dict[str, float] = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+@dataclass(frozen=True)
+class StaticAsset:
+    """One rendered page and its precompressed variants"""
+    content_type: str
+    variants: Dict[str, bytes]   # content coding -> body
+    etags: Dict[str, str]        # content coding -> strong ETag
+    rendered_at: float
+
+    @classmethod
+    def render(cls, content: str, content_type: str = "text/html; charset=utf-8") -> 'StaticAsset':
+        raw = content.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()[:32]
+
+        variants = {"identity": raw}
+        compressed = {"gzip": gzip.compress(raw, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            compressed["br"] = brotli.compress(raw, quality=11)
+        for coding, body in compressed.items():
+            if len(body) < len(raw):
+                variants[coding] = body
+
+        # Strong ETags must differ between encodings of the same page
+        etags = {
+            coding: f'"{digest}"' if coding == "identity" else f'"{digest}-{coding}"'
+            for coding in variants
+        }
+        return cls(content_type, variants, etags, time.time())
+
+    def negotiate(self, accept_encoding: Optional[str]) -> str:
+        """Pick the best stored coding the client accepts"""
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*")
+        for coding in ENCODING_PREFERENCE:
+            if coding not in self.variants:
+                continue
+            quality = accepted.get(coding, wildcard)
+            if coding == "identity" and quality is None:
+                return coding  # Identity is acceptable unless explicitly refused
+            if quality:
+                return coding
+        return "identity"
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """True when If-None-Match names any representation of this page"""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return any(etag in candidates for etag in self.etags.values())
+
+    def response_for(self, accept_encoding: Optional[str], if_none_match: Optional[str],
+                     cache_control: str = DEFAULT_CACHE_CONTROL) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        """Status, headers and body for a request with the given conditional headers"""
+        coding = self.negotiate(accept_encoding)
+        headers = [
+            ("ETag", self.etags[coding]),
+            ("Vary", "Accept-Encoding"),
+            ("Cache-Control", cache_control)
+        ]
+        if self.matches(if_none_match):
+            return 304, headers, b""
+
+        body = self.variants[coding]
+        headers.append(("Content-Type", self.content_type))
+        headers.append(("Content-Length", str(len(body))))
+        if coding != "identity":
+            headers.append(("Content-Encoding", coding))
+        return 200, headers, body
+
+class StaticAssetStore:
+    """Pages by path, rendered once from registered render functions"""
+
+    def __init__(self):
+        self.renderers: Dict[str, Tuple[Callable[[], str], str]] = {}
+        self.assets: Dict[str, StaticAsset] = {}
+        self.lock = threading.Lock()
+
+    def register(self, path: str, renderer: Callable[[], str], content_type: str = "text/html; charset=utf-8"):
+        self.renderers[path] = (renderer, content_type)
+        self.assets.pop(path, None)
+
+    def get(self, path: str) -> Optional[StaticAsset]:
+        """Rendered asset for ``path`` (rendering it on first use), or None if unregistered"""
+        asset = self.assets.get(path)
+        if asset is not None or path not in self.renderers:
+            return asset
+        with self.lock:
+            asset = self.assets.get(path)
+            if asset is None:
+                renderer, content_type = self.renderers[path]
+                asset = self.assets[path] = StaticAsset.render(renderer(), content_type)
+        return asset
+
+    def render_all(self) -> 'StaticAssetStore':
+        """Render every registered page up front, typically at server startup"""
+        for path in self.renderers:
+            self.get(path)
+        return self
+
+    def invalidate(self, path: str = None):
+        """Drop rendered pages so they are rebuilt on next use"""
+        with self.lock:
+            if path is None:
+                self.assets.clear()
+            else:
+                self.assets.pop(path, None)
+
+def benchmark_static_assets(pages: Dict[str, Callable[[], str]], hits: int = 2000):
+    """📊 Bytes and CPU per landing-page hit: render-and-encode per request vs precompressed store"""
+    print(f"📦 STATIC ASSET BENCHMARK ({hits} hits per page)")
+    print("=" * 70)
+
+    for name, renderer in pages.items():
+        started = time.perf_counter()
+        for _ in range(hits):
+            body = renderer().encode("utf-8")
+        per_render = (time.perf_counter() - started) / hits * 1e6
+
+        asset = StaticAsset.render(renderer())
+        coding = asset.negotiate("gzip, deflate, br")
+        started = time.perf_counter()
+        for _ in range(hits):
+            asset.response_for("gzip, deflate, br", None)
+        per_cached = (time.perf_counter() - started) / hits * 1e6
+
+        started = time.perf_counter()
+        for _ in range(hits):
+            asset.response_for("gzip, deflate, br", asset.etags[coding])
+        per_revalidation = (time.perf_counter() - started) / hits * 1e6
+
+        print(f"{name}:")
+        print(f"   before : {len(body):7d} bytes  {per_render:7.1f} µs/hit (render + encode)")
+        print(f"   {coding:7s}: {len(asset.variants[coding]):7d} bytes  {per_cached:7.1f} µs/hit")
+        print(f"   304    : {0:7d} bytes  {per_revalidation:7.1f} µs/hit")
+
+if __name__ == "__main__":
+    import instant_sovereign_deploy
+    import sovereign_consciousness_server
+    from LIGHT_CODES_OPTIMIZED_RUNTIME import LightCodesApplication
+
+    benchmark_static_assets({
+        "/ (consciousness server)": sovereign_consciousness_server.render_consciousness_ui,
+        "/ (instant deploy)": instant_sovereign_deploy.render_consciousness_ui,
+        "/ (light codes)": LightCodesApplication().web_server.render_light_codes_ui
+    })